@@ -0,0 +1,515 @@
+"""Backend benchmark suite with JSON baselines and regression checks
+
+Times the hot backend paths over generated datasets (backend.dataset_generator)
+of several sizes, and compares two runs:
+
+    python -m backend.benchmarks run --sizes 100,1000 --output .benchmarks/main.json
+    python -m backend.benchmarks run --sizes 100,1000 --output .benchmarks/branch.json
+    python -m backend.benchmarks compare .benchmarks/main.json .benchmarks/branch.json
+
+`run` calls each benchmark once to warm up, then --repeat more times, and stores
+every sample (seconds) with its median/mean/stdev. `compare` tests each benchmark
+with the Mann-Whitney U test: a benchmark regressed (or improved) when the
+samples differ significantly (p < --alpha) and the median moved by more than
+--threshold. Noise between runs is expected; the test keeps it from being
+reported as a change. Use at least 8 repeats, and only compare runs from the
+same machine.
+
+Exit codes: 0 = ok, 1 = regressions found (compare), 2 = usage error.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+RESULTS_FORMAT = 1
+DEFAULT_SIZES = (100, 1000)
+DEFAULT_REPEAT = 10
+DEFAULT_SEED = 42
+DEFAULT_ALPHA = 0.01
+DEFAULT_THRESHOLD = 0.05  # Relative change of the median
+
+PARSE_SAMPLE = 50  # Team files parsed per parse_team_file sample
+LOOKUP_SAMPLE = 5  # Teams looked up per find_team_by_id sample
+
+REGRESSED = "regressed"
+IMPROVED = "improved"
+UNCHANGED = "unchanged"
+NEW = "new"
+MISSING = "missing"
+
+
+@dataclass
+class Dataset:
+    """A generated dataset the benchmarks run against (the services point at it)"""
+    size: int
+    data_dir: Path
+    index_db: Path
+    rng: random.Random
+    state: dict[str, Any] = field(default_factory=dict)  # Shared by a benchmark's reset and run
+
+    @property
+    def tt_dir(self) -> Path:
+        return self.data_dir / "tt-teams"
+
+
+@dataclass
+class Benchmark:
+    name: str
+    run: Callable[[Dataset], Any]
+    reset: Callable[[Dataset], None] | None = None  # Called before each sample, not timed
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, reset: Callable[[Dataset], None] | None = None):
+    def register(run: Callable[[Dataset], Any]) -> Callable[[Dataset], Any]:
+        BENCHMARKS.append(Benchmark(name, run, reset))
+        return run
+    return register
+
+
+def _without_index(_dataset: Dataset) -> None:
+    os.environ.pop("TEAM_INDEX_DB", None)
+
+
+def _with_index(dataset: Dataset) -> None:
+    os.environ["TEAM_INDEX_DB"] = str(dataset.index_db)
+
+
+def _with_new_index(dataset: Dataset) -> None:
+    from backend.services import team_index
+
+    team_index.close_connections()
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{dataset.index_db}{suffix}").unlink(missing_ok=True)
+    _with_index(dataset)
+
+
+def _pick_files(dataset: Dataset) -> None:
+    files = sorted(dataset.tt_dir.glob("*.md"))
+    dataset.state["files"] = dataset.rng.sample(files, min(PARSE_SAMPLE, len(files)))
+
+
+def _pick_team_ids(dataset: Dataset) -> None:
+    ids = sorted(path.stem for path in dataset.tt_dir.glob("*.md"))
+    dataset.state["team_ids"] = dataset.rng.sample(ids, min(LOOKUP_SAMPLE, len(ids)))
+
+
+def _pick_team_ids_with_index(dataset: Dataset) -> None:
+    _with_index(dataset)
+    _pick_team_ids(dataset)
+
+
+@benchmark("parse_team_file", reset=_pick_files)
+def _parse_team_file(dataset: Dataset) -> None:
+    from backend.services import parse_team_file
+
+    for path in dataset.state["files"]:
+        parse_team_file(path)
+
+
+@benchmark("find_all_teams[scan]")
+def _find_all_teams_scan(_dataset: Dataset) -> None:
+    from backend.services import find_all_teams
+
+    find_all_teams("tt")
+
+
+@benchmark("find_all_teams[index-cold]", reset=_with_new_index)
+def _find_all_teams_index_cold(_dataset: Dataset) -> None:
+    from backend.services import find_all_teams
+
+    find_all_teams("tt")
+
+
+@benchmark("find_all_teams[index-warm]", reset=_with_index)
+def _find_all_teams_index_warm(_dataset: Dataset) -> None:
+    from backend.services import find_all_teams
+
+    find_all_teams("tt")
+
+
+def _find_team_by_id(dataset: Dataset) -> None:
+    from backend.services import find_team_by_id
+
+    for team_id in dataset.state["team_ids"]:
+        find_team_by_id(team_id, "tt")
+
+
+benchmark("find_team_by_id[scan]", reset=_pick_team_ids)(_find_team_by_id)
+benchmark("find_team_by_id[index]", reset=_pick_team_ids_with_index)(_find_team_by_id)
+
+
+def _clear_validation(_dataset: Dataset) -> None:
+    from backend.validation import clear_validation_cache
+
+    clear_validation_cache()
+
+
+@benchmark("validate_all_team_files[cold]", reset=_clear_validation)
+def _validate_cold(_dataset: Dataset) -> None:
+    from backend.validation import validate_all_team_files
+
+    validate_all_team_files("tt", workers=1)
+
+
+@benchmark("validate_all_team_files[warm]")
+def _validate_warm(_dataset: Dataset) -> None:
+    from backend.validation import validate_all_team_files
+
+    validate_all_team_files("tt", workers=1)
+
+
+@benchmark("create_snapshot")
+def _create_snapshot(_dataset: Dataset) -> None:
+    from backend.snapshot_services import create_snapshot
+
+    create_snapshot("Benchmark snapshot")
+
+
+@benchmark("list_snapshots")
+def _list_snapshots(_dataset: Dataset) -> None:
+    from backend.snapshot_services import list_snapshots
+
+    list_snapshots()
+
+
+def _clear_snapshot_caches(dataset: Dataset) -> None:
+    from backend.snapshot_services import clear_snapshot_caches, list_snapshots
+
+    clear_snapshot_caches()
+    if "snapshot_ids" not in dataset.state:
+        # The generator's snapshots: the first and last version of the design
+        generated = sorted((s for s in list_snapshots() if s.name.startswith("Synthetic design")),
+                           key=lambda s: s.created_at)
+        dataset.state["snapshot_ids"] = (generated[0].snapshot_id, generated[-1].snapshot_id)
+
+
+@benchmark("compare_snapshots", reset=_clear_snapshot_caches)
+def _compare_snapshots(dataset: Dataset) -> None:
+    from backend.comparison import compare_snapshots
+    from backend.snapshot_services import load_snapshot
+
+    before_id, after_id = dataset.state["snapshot_ids"]
+    compare_snapshots(load_snapshot(before_id), load_snapshot(after_id))
+
+
+def _endpoint(path: str) -> Callable[[Dataset], None]:
+    def run(dataset: Dataset) -> None:
+        response = dataset.state["client"].get(path)
+        response.raise_for_status()
+    return run
+
+
+def _client(dataset: Dataset) -> None:
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    if "client" not in dataset.state:
+        dataset.state["client"] = TestClient(app)
+
+
+for _path in ("/api/baseline/product-lines", "/api/baseline/business-streams",
+              "/api/baseline/organization-hierarchy"):
+    benchmark(f"GET {_path}", reset=_client)(_endpoint(_path))
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+        "max": max(samples),
+    }
+
+
+def time_benchmark(bench: Benchmark, dataset: Dataset, repeat: int) -> list[float]:
+    """One untimed warm-up call, then repeat timed samples (seconds)."""
+    samples = []
+    for iteration in range(repeat + 1):
+        if bench.reset is not None:
+            bench.reset(dataset)
+        gc.collect()
+        start = time.perf_counter()
+        bench.run(dataset)
+        elapsed = time.perf_counter() - start
+        if iteration:
+            samples.append(elapsed)
+    return samples
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_benchmarks(
+    sizes: list[int],
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = DEFAULT_SEED,
+    only: str | None = None,
+    log: Callable[[str], None] = lambda message: None,
+) -> dict[str, Any]:
+    """Run the (matching) benchmarks over a generated dataset of each size.
+
+    Returns:
+        Results document: environment, settings and benchmarks
+        ({"<name>@<size>": {name, size, samples, median, mean, stdev, min, max}})
+    """
+    from backend.dataset_generator import generate_dataset, use_dataset
+    from backend.services import team_index
+    from backend.validation import clear_validation_cache
+
+    selected = [b for b in BENCHMARKS if only is None or only in b.name]
+    results: dict[str, Any] = {}
+    saved_index_db = os.environ.get("TEAM_INDEX_DB")
+    try:
+        for size in sizes:
+            with tempfile.TemporaryDirectory(prefix=f"tt-bench-{size}-") as tmp:
+                data_dir = Path(tmp) / "data"
+                log(f"Generating a dataset of {size} teams...")
+                generate_dataset(data_dir, size, seed=seed, snapshots=2)
+                dataset = Dataset(size, data_dir, Path(tmp) / "index.db", random.Random(seed))
+                with use_dataset(data_dir):
+                    for bench in selected:
+                        _without_index(dataset)  # Benchmarks of the index opt in (reset)
+                        samples = time_benchmark(bench, dataset, repeat)
+                        results[f"{bench.name}@{size}"] = {
+                            "name": bench.name, "size": size, "samples": samples, **summarize(samples),
+                        }
+                        log(f"  {bench.name}@{size}: median {_format_seconds(statistics.median(samples))}")
+                team_index.close_connections()
+                clear_validation_cache()
+    finally:
+        if saved_index_db is None:
+            os.environ.pop("TEAM_INDEX_DB", None)
+        else:
+            os.environ["TEAM_INDEX_DB"] = saved_index_db
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "git_commit": _git_commit(),
+        },
+        "settings": {"sizes": sizes, "repeat": repeat, "seed": seed},
+        "benchmarks": results,
+    }
+
+
+# ============================================================================
+# Comparing
+# ============================================================================
+
+def mann_whitney_u(a: list[float], b: list[float]) -> tuple[float, float]:
+    """Mann-Whitney U statistic of a, and the two-sided p-value.
+
+    Uses the normal approximation with tie and continuity corrections (good
+    from about 8 samples per side). p is 1.0 when either side is empty.
+    """
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    values = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    n = n1 + n2
+
+    rank_sum_a = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and values[j + 1][0] == values[i][0]:
+            j += 1
+        average_rank = (i + j) / 2 + 1  # Ranks are 1-based; ties share their average rank
+        rank_sum_a += average_rank * sum(1 for k in range(i, j + 1) if values[k][1] == 0)
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0  # All values equal
+    z = max(0.0, abs(u - mean) - 0.5) / math.sqrt(variance)
+    return u, math.erfc(z / math.sqrt(2))
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    alpha: float = DEFAULT_ALPHA,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict[str, Any]]:
+    """Per-benchmark comparison rows ({benchmark, status, baseline, current, change, p_value})."""
+    rows = []
+    before_all, after_all = baseline["benchmarks"], current["benchmarks"]
+    for key in sorted(before_all.keys() | after_all.keys()):
+        before, after = before_all.get(key), after_all.get(key)
+        row: dict[str, Any] = {
+            "benchmark": key,
+            "baseline": before["median"] if before else None,
+            "current": after["median"] if after else None,
+            "change": None,
+            "p_value": None,
+        }
+        if before is None or after is None:
+            row["status"] = NEW if before is None else MISSING
+            rows.append(row)
+            continue
+
+        change = after["median"] / before["median"] - 1 if before["median"] else 0.0
+        _, p_value = mann_whitney_u(before["samples"], after["samples"])
+        row.update(change=change, p_value=p_value)
+        if p_value < alpha and abs(change) > threshold:
+            row["status"] = REGRESSED if change > 0 else IMPROVED
+        else:
+            row["status"] = UNCHANGED
+        rows.append(row)
+    return rows
+
+
+def _format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if value < 1e-3:
+        return f"{value * 1e6:.1f}us"
+    if value < 1:
+        return f"{value * 1e3:.2f}ms"
+    return f"{value:.3f}s"
+
+
+def format_comparison(rows: list[dict[str, Any]]) -> str:
+    width = max([len("benchmark")] + [len(row["benchmark"]) for row in rows])
+    lines = [f"{'benchmark':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}  {'p':>7}  status"]
+    for row in rows:
+        change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+        p_value = f"{row['p_value']:.4f}" if row["p_value"] is not None else "-"
+        lines.append(
+            f"{row['benchmark']:<{width}}  {_format_seconds(row['baseline']):>10}  "
+            f"{_format_seconds(row['current']):>10}  {change:>8}  {p_value:>7}  {row['status']}"
+        )
+    counts = {status: sum(1 for row in rows if row["status"] == status)
+              for status in (REGRESSED, IMPROVED, UNCHANGED, NEW, MISSING)}
+    lines.append("")
+    lines.append(", ".join(f"{count} {status}" for status, count in counts.items() if count))
+    return "\n".join(lines)
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path}: unsupported results format {data.get('format')!r}")
+    return data
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def _sizes(value: str) -> list[int]:
+    try:
+        sizes = [int(size) for size in value.split(",") if size.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a comma-separated list of team counts: {value!r}")
+    if not sizes:
+        raise argparse.ArgumentTypeError("no sizes given")
+    return sizes
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.benchmarks",
+        description="Benchmark the backend over generated datasets and compare runs.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks and save the results as JSON")
+    run.add_argument("--sizes", type=_sizes, default=list(DEFAULT_SIZES),
+                     help="Comma-separated dataset sizes in teams (default: 100,1000)")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                     help=f"Timed samples per benchmark (default: {DEFAULT_REPEAT})")
+    run.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Dataset seed")
+    run.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    run.add_argument("--output", type=Path, help="Results file (default: print JSON to stdout)")
+
+    compare = commands.add_parser("compare", help="Compare two result files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                         help=f"Significance level (default: {DEFAULT_ALPHA})")
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help=f"Minimum relative change of the median (default: {DEFAULT_THRESHOLD})")
+    compare.add_argument("--format", choices=["text", "json"], default="text")
+
+    commands.add_parser("list", help="List the benchmarks")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "list":
+        print("\n".join(bench.name for bench in BENCHMARKS))
+        return 0
+
+    if args.command == "run":
+        if args.repeat < 1:
+            print("--repeat must be at least 1", file=sys.stderr)
+            return 2
+        results = run_benchmarks(
+            args.sizes, args.repeat, args.seed, args.filter,
+            log=lambda message: print(message, file=sys.stderr),
+        )
+        if not results["benchmarks"]:
+            print(f"No benchmark matches {args.filter!r}", file=sys.stderr)
+            return 2
+        text = json.dumps(results, indent=2)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(text + "\n", encoding="utf-8")
+            print(f"Saved {len(results['benchmarks'])} results to {args.output}", file=sys.stderr)
+        else:
+            print(text)
+        return 0
+
+    try:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+    except (OSError, ValueError) as e:
+        print(f"Could not read results: {e}", file=sys.stderr)
+        return 2
+    rows = compare_results(baseline, current, args.alpha, args.threshold)
+    print(json.dumps(rows, indent=2) if args.format == "json" else format_comparison(rows))
+    return 1 if any(row["status"] == REGRESSED for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,34 +1,88 @@
 """Snapshot comparison logic"""
 from typing import Any
 
-from backend.models import Snapshot
+from backend.models import Snapshot, SnapshotTeamCondensed
+
+# A team must move more than this many pixels (in x or y) to count as moved
+MOVE_THRESHOLD = 10
+
+# Fields that place a team in a grouping, and metadata fields worth reporting
+GROUPING_FIELDS = ("value_stream", "platform_grouping", "value_stream_inner", "platform_grouping_inner")
+METADATA_FIELDS = ("size", "cognitive_load", "established")
+
+
+def _dependency_edges(team: SnapshotTeamCondensed) -> set[str]:
+    return set(team.dependencies or [])
+
+
+def _interaction_edges(team: SnapshotTeamCondensed) -> dict[str, str]:
+    return dict(team.interaction_modes or {})
 
 
 def compare_snapshots(before: Snapshot, after: Snapshot) -> dict[str, Any]:
     """
     Compare two snapshots and return differences
 
+    One pass over the teams of both snapshots (O(teams + edges)): teams that are
+    equal (model ==, which stops at the first differing field) are skipped, the
+    rest are compared field by field.
+    Edges of added and removed teams count as added and removed edges.
+
     Returns:
-        Dictionary with added, removed, moved, and type_changed teams
+        Dictionary with before/after snapshot info and a change set:
+        - added_teams, removed_teams: team names
+        - moved_teams: {name, before, after} (moved > MOVE_THRESHOLD px)
+        - type_changed_teams: {name, before, after}
+        - dependency_changes: {added: [{from, to}], removed: [{from, to}]}
+        - interaction_changes: {from, to, before, after} per edge whose mode
+          was added (before None), removed (after None) or changed
+        - grouping_changes: {name, field, before, after} for value stream,
+          platform grouping and inner grouping moves
+        - metadata_changes: {name, field, before, after} (size, cognitive load, ...)
+        - summary: a count for each of the above
     """
     before_teams = {team.name: team for team in before.teams}
     after_teams = {team.name: team for team in after.teams}
 
-    before_names = set(before_teams.keys())
-    after_names = set(after_teams.keys())
-
     # Calculate differences
-    added = list(after_names - before_names)
-    removed = list(before_names - after_names)
-    common = before_names & after_names
+    added = sorted(after_teams.keys() - before_teams.keys())
+    removed = sorted(before_teams.keys() - after_teams.keys())
 
-    # Check for position and type changes in common teams
     moved = []
     type_changed = []
+    dependencies_added = []
+    dependencies_removed = []
+    interaction_changes = []
+    grouping_changes = []
+    metadata_changes = []
+
+    def diff_edges(name: str, before_team: SnapshotTeamCondensed | None, after_team: SnapshotTeamCondensed | None):
+        before_deps = _dependency_edges(before_team) if before_team else set()
+        after_deps = _dependency_edges(after_team) if after_team else set()
+        dependencies_added.extend({"from": name, "to": dep} for dep in sorted(after_deps - before_deps))
+        dependencies_removed.extend({"from": name, "to": dep} for dep in sorted(before_deps - after_deps))
+
+        before_modes = _interaction_edges(before_team) if before_team else {}
+        after_modes = _interaction_edges(after_team) if after_team else {}
+        for other in sorted(before_modes.keys() | after_modes.keys()):
+            if before_modes.get(other) != after_modes.get(other):
+                interaction_changes.append({
+                    "from": name,
+                    "to": other,
+                    "before": before_modes.get(other),
+                    "after": after_modes.get(other),
+                })
+
+    for name in removed:
+        diff_edges(name, before_teams[name], None)
+    for name in added:
+        diff_edges(name, None, after_teams[name])
 
-    for name in common:
+    for name in sorted(before_teams.keys() & after_teams.keys()):
         before_team = before_teams[name]
         after_team = after_teams[name]
+        if before_team == after_team:
+            continue
 
         # Check position change (consider significant if moved >10 pixels)
         before_pos = before_team.position or {"x": 0, "y": 0}
@@ -37,7 +91,7 @@ def compare_snapshots(before: Snapshot, after: Snapshot) -> dict[str, Any]:
         dx = abs(before_pos.get("x", 0) - after_pos.get("x", 0))
         dy = abs(before_pos.get("y", 0) - after_pos.get("y", 0))
 
-        if dx > 10 or dy > 10:
+        if dx > MOVE_THRESHOLD or dy > MOVE_THRESHOLD:
             moved.append({
                 "name": name,
                 "before": before_pos,
@@ -52,6 +106,25 @@ def compare_snapshots(before: Snapshot, after: Snapshot) -> dict[str, Any]:
                 "after": after_team.team_type
             })
 
+        for field in GROUPING_FIELDS:
+            before_value = getattr(before_team, field)
+            after_value = getattr(after_team, field)
+            if before_value != after_value:
+                grouping_changes.append({"name": name, "field": field, "before": before_value, "after": after_value})
+
+        before_metadata = before_team.metadata or {}
+        after_metadata = after_team.metadata or {}
+        for field in METADATA_FIELDS:
+            if before_metadata.get(field) != after_metadata.get(field):
+                metadata_changes.append({
+                    "name": name,
+                    "field": field,
+                    "before": before_metadata.get(field),
+                    "after": after_metadata.get(field),
+                })
+
+        diff_edges(name, before_team, after_team)
+
     return {
         "before_snapshot": {
             "id": before.snapshot_id,
@@ -66,15 +139,24 @@ def compare_snapshots(before: Snapshot, after: Snapshot) -> dict[str, Any]:
             "total_teams": after.statistics.total_teams
         },
         "changes": {
-            "added_teams": sorted(added),
-            "removed_teams": sorted(removed),
+            "added_teams": added,
+            "removed_teams": removed,
             "moved_teams": moved,
             "type_changed_teams": type_changed,
+            "dependency_changes": {"added": dependencies_added, "removed": dependencies_removed},
+            "interaction_changes": interaction_changes,
+            "grouping_changes": grouping_changes,
+            "metadata_changes": metadata_changes,
             "summary": {
                 "added_count": len(added),
                 "removed_count": len(removed),
                 "moved_count": len(moved),
-                "type_changed_count": len(type_changed)
+                "type_changed_count": len(type_changed),
+                "dependencies_added_count": len(dependencies_added),
+                "dependencies_removed_count": len(dependencies_removed),
+                "interaction_changed_count": len(interaction_changes),
+                "grouping_changed_count": len(grouping_changes),
+                "metadata_changed_count": len(metadata_changes),
             }
         }
     }
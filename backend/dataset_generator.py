@@ -0,0 +1,561 @@
+"""Synthetic large-organization dataset generator (for benchmarks and load tests)
+
+Writes a complete data directory shaped like the sample data in data/, at any
+scale - a baseline organization, a TT design and snapshots of that design:
+
+    python -m backend.dataset_generator build/org-5k --teams 5000 --seed 42
+    DATA_DIR=build/org-5k uvicorn main:app --port 8000
+
+Output layout (DATA_DIR compatible):
+- baseline-teams/: baseline-team-types.json, products.json, business-streams.json,
+  organization-hierarchy.json, company-leadership.md and
+  <division>/<department>/<team>.md (divisions and departments have their own .md)
+- tt-teams/: tt-team-types.json and <team>.md with interaction tables
+- tt-snapshots/: --snapshots snapshots of the TT design, taken as it evolves
+  (a few percent of the teams change between consecutive snapshots)
+
+The same --teams, --seed and --snapshots always produce the same team and config
+files (only snapshot timestamps differ), so benchmark datasets are reproducible.
+"""
+import argparse
+import json
+import math
+import random
+import shutil
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from backend.constants import ConfigFiles, InteractionModes, TeamTypes
+from backend.services import team_name_to_slug
+
+MIN_TEAMS = 10
+MAX_TEAMS = 100_000
+
+TEAMS_PER_DEPARTMENT = 12
+DEPARTMENTS_PER_DIVISION = 8
+TEAMS_PER_LINE_MANAGER = 3
+TEAMS_PER_PRODUCT = 25
+MAX_PRODUCTS = 200
+PRODUCTS_PER_BUSINESS_STREAM = 4
+TEAMS_PER_VALUE_STREAM = 10
+TEAMS_PER_PLATFORM_GROUPING = 30
+SNAPSHOT_CHURN = 0.05  # Share of TT teams changed between consecutive snapshots
+
+BASELINE_TYPE_WEIGHTS = {"feature-team": 55, "platform-team": 20, "support-team": 20, "undefined": 5}
+TT_TYPE_WEIGHTS = {
+    TeamTypes.STREAM_ALIGNED: 60,
+    TeamTypes.PLATFORM: 20,
+    TeamTypes.COMPLICATED_SUBSYSTEM: 10,
+    TeamTypes.ENABLING: 10,
+}
+
+# Team names are "[Qualifier] Domain Function Team": 60 x 40 combinations without
+# a qualifier and 42 x 60 x 40 with one, 103,200 unique names (NAME_CAPACITY >= MAX_TEAMS)
+DOMAINS = [
+    "Payments", "Billing", "Checkout", "Search", "Catalog", "Pricing", "Inventory", "Orders",
+    "Shipping", "Routing", "Fleet", "Dispatch", "Tracking", "Returns", "Loyalty", "Identity",
+    "Accounts", "Onboarding", "Messaging", "Notifications", "Reporting", "Analytics", "Forecasting",
+    "Fraud", "Risk", "Compliance", "Tax", "Ledger", "Invoicing", "Payroll", "Scheduling",
+    "Warehouse", "Procurement", "Supplier", "Partner", "Marketplace", "Content", "Media",
+    "Recommendations", "Personalization", "Experiments", "Feedback", "Support", "Ticketing",
+    "Documents", "Contracts", "Subscriptions", "Rewards", "Maps", "Telemetry", "Devices",
+    "Sensors", "Claims", "Quotes", "Policies", "Audit", "Consent", "Profiles", "Sessions", "Ratings",
+]
+FUNCTIONS = [
+    "Platform", "Services", "Experience", "Portal", "Mobile", "Web", "Data", "Insights", "Engine",
+    "Integration", "Gateway", "Automation", "Operations", "Reliability", "Quality", "Security",
+    "Infrastructure", "Workflow", "Intelligence", "Modelling", "Streaming", "Storage", "Delivery",
+    "Tooling", "Enablement", "Architecture", "Core", "Foundations", "Growth", "Discovery", "Admin",
+    "Sync", "Connect", "Hub", "Studio", "Console", "Pipeline", "Registry", "Scoring", "Routing",
+]
+QUALIFIERS = [
+    "North", "South", "East", "West", "Central", "Global", "Europe", "Americas", "Asia", "Nordic",
+    "Alpine", "Atlantic", "Pacific", "Coastal", "Metro", "Rural", "Urban", "Retail", "Wholesale",
+    "Consumer", "Business", "Enterprise", "Channel", "Internal", "Premium", "Express", "Classic",
+    "Next", "Legacy", "Prime", "Labs", "Edge", "Cloud", "Field", "Store", "Regional",
+    "Harbor", "Summit", "Digital", "Direct", "Local", "Outpost",
+]
+NAME_CAPACITY = len(DOMAINS) * len(FUNCTIONS) * (1 + len(QUALIFIERS))
+PEOPLE_FIRST = [
+    "Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn",
+    "Robin", "Drew", "Kai", "Noor", "Ana", "Luis", "Mei", "Ravi", "Olu", "Ines",
+]
+PEOPLE_LAST = [
+    "Garcia", "Chen", "Okafor", "Novak", "Silva", "Khan", "Larsen", "Moreau", "Tanaka", "Rossi",
+    "Murphy", "Schmidt", "Haddad", "Kowalski", "Nguyen", "Ferreira", "Andersen", "Patel", "Costa", "Berg",
+]
+COLORS = [
+    "#3498db", "#e74c3c", "#2ecc71", "#9b59b6", "#f39c12", "#1abc9c", "#34495e", "#e67e22",
+    "#16a085", "#c0392b", "#8e44ad", "#27ae60",
+]
+COGNITIVE_LOADS = ["low", "medium", "medium", "high"]
+DEPLOYMENT_FREQUENCIES = ["daily", "weekly", "monthly", "quarterly"]
+
+INTERACTION_LABELS = {
+    InteractionModes.COLLABORATION: "Collaboration",
+    InteractionModes.X_AS_A_SERVICE: "X-as-a-Service",
+    InteractionModes.FACILITATING: "Facilitating",
+}
+INTERACTION_PURPOSES = {
+    InteractionModes.COLLABORATION: "Co-develop shared capabilities",
+    InteractionModes.X_AS_A_SERVICE: "Consume self-service APIs",
+    InteractionModes.FACILITATING: "Coaching on practices and tooling",
+}
+
+BASELINE_TEAM_TYPES = {
+    "team_types": [
+        {"id": "feature-team", "name": "Feature Team",
+         "description": "Cross-functional team delivering product features end-to-end.", "color": "#6FA8DC"},
+        {"id": "platform-team", "name": "Platform Team",
+         "description": "Owns shared components other teams build on.", "color": "#5DD9C1"},
+        {"id": "support-team", "name": "Enabling/Support Team",
+         "description": "Supports other teams with specialist skills.", "color": "#FFE156"},
+        {"id": "undefined", "name": "Undefined Team",
+         "description": "Not yet classified.", "color": "#F5F5F5"},
+    ]
+}
+TT_TEAM_TYPES = {
+    "team_types": [
+        {"id": TeamTypes.STREAM_ALIGNED, "name": "Stream-aligned",
+         "description": "Aligned to a single, valuable stream of work.", "color": "#FFEDB8"},
+        {"id": TeamTypes.PLATFORM, "name": "Platform",
+         "description": "Provides internal services to reduce cognitive load.", "color": "#B7CDF1"},
+        {"id": TeamTypes.ENABLING, "name": "Enabling",
+         "description": "Helps teams overcome obstacles and adopt new practices.", "color": "#DFBDCF"},
+        {"id": TeamTypes.COMPLICATED_SUBSYSTEM, "name": "Complicated Subsystem",
+         "description": "Deals with domains requiring specialist knowledge.", "color": "#FFC08B"},
+        {"id": TeamTypes.UNDEFINED, "name": "Undefined",
+         "description": "Not yet classified.", "color": "#EBEBEF"},
+    ]
+}
+
+
+def team_names(rng: random.Random, count: int) -> list[str]:
+    """count unique, realistic team names (shuffled, shortest combinations first)."""
+    if count > NAME_CAPACITY:
+        raise ValueError(f"At most {NAME_CAPACITY} unique team names can be generated")
+    pairs = [(domain, function) for domain in DOMAINS for function in FUNCTIONS]
+    rng.shuffle(pairs)
+    names = [f"{domain} {function} Team" for domain, function in pairs[:count]]
+    qualifiers = list(QUALIFIERS)
+    rng.shuffle(qualifiers)
+    for qualifier in qualifiers:
+        if len(names) >= count:
+            break
+        rng.shuffle(pairs)
+        names.extend(f"{qualifier} {domain} {function} Team" for domain, function in pairs[:count - len(names)])
+    return names
+
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(PEOPLE_FIRST)} {rng.choice(PEOPLE_LAST)}"
+
+
+def _weighted(rng: random.Random, weights: dict[str, int]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def _team_size(rng: random.Random) -> int:
+    """Mostly within the recommended 5-9 people, with some outliers either side."""
+    return max(2, min(15, round(rng.gauss(7, 1.5))))
+
+
+def _grid_position(index: int, columns: int) -> dict[str, float]:
+    return {"x": float(100 + (index % columns) * 220), "y": float(100 + (index // columns) * 140)}
+
+
+# The C emitter (when PyYAML was built with libyaml) is what makes 100k files practical
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _markdown_file(front_matter: dict[str, Any], body: str) -> str:
+    yaml_text = yaml.dump(front_matter, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+    return f"---\n{yaml_text}---\n\n{body}"
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+# ============================================================================
+# Baseline organization
+# ============================================================================
+
+def generate_baseline(rng: random.Random, team_count: int) -> dict[str, Any]:
+    """Baseline organization: team names, config files and team files by path (relative to the folder)."""
+    names = team_names(rng, team_count)
+    product_count = max(3, min(MAX_PRODUCTS, team_count // TEAMS_PER_PRODUCT))
+    product_names = [f"{name.removesuffix(' Team')} Suite" for name in team_names(rng, product_count)]
+    products = [
+        {
+            "id": team_name_to_slug(name),
+            "name": name,
+            "description": f"{name} for business and consumer customers",
+            "color": COLORS[index % len(COLORS)],
+            "display-order": index + 1,
+        }
+        for index, name in enumerate(product_names)
+    ]
+    stream_count = max(2, math.ceil(product_count / PRODUCTS_PER_BUSINESS_STREAM))
+    streams = [
+        {
+            "id": f"business-stream-{index + 1}",
+            "name": f"Business Stream {index + 1}",
+            "description": f"Customer segment served by products {index + 1}",
+            "products": product_names[index::stream_count],
+            "color": COLORS[index % len(COLORS)],
+            "display-order": index + 1,
+        }
+        for index in range(stream_count)
+    ]
+    stream_by_product = {product: stream["name"] for stream in streams for product in stream["products"]}
+
+    department_count = max(2, math.ceil(team_count / TEAMS_PER_DEPARTMENT))
+    division_count = max(1, math.ceil(department_count / DEPARTMENTS_PER_DIVISION))
+    types = {name: _weighted(rng, BASELINE_TYPE_WEIGHTS) for name in names}
+    providers = [name for name in names if types[name] in ("platform-team", "support-team")] or names
+    positions = {name: _grid_position(index, max(10, math.isqrt(team_count))) for index, name in enumerate(names)}
+
+    files: dict[str, str] = {}
+    departments = []
+    for department_index in range(department_count):
+        department_teams = names[department_index::department_count]
+        division = f"division-{department_index % division_count + 1}"
+        department_name = f"Department {department_index + 1}"
+        department_slug = team_name_to_slug(department_name)
+        folder = f"{division}/{department_slug}"
+        manager = _person(rng)
+
+        line_managers = []
+        for lm_index, start in enumerate(range(0, len(department_teams), TEAMS_PER_LINE_MANAGER)):
+            lm_name = _person(rng)
+            line_managers.append({
+                "id": f"lm-{department_slug}-{lm_index + 1}",
+                "name": f"{lm_name} - Team Lead",
+                "type": "line-manager",
+                "level": 3,
+                "teams": department_teams[start:start + TEAMS_PER_LINE_MANAGER],
+            })
+            for name in department_teams[start:start + TEAMS_PER_LINE_MANAGER]:
+                files[f"{folder}/{team_name_to_slug(name)}.md"] = _baseline_team_file(
+                    rng, name, types[name], department_name, lm_name, providers,
+                    product_names, stream_by_product, positions[name],
+                )
+        departments.append({
+            "id": f"{department_slug}-dept",
+            "name": department_name,
+            "type": "department",
+            "level": 1,
+            "manager": f"Head of {department_name} - {manager}",
+            "line_managers": line_managers,
+        })
+        files[f"{folder}/{department_slug}.md"] = _markdown_file(
+            {
+                "team_id": department_slug,
+                "name": department_name,
+                "team_type": "department",
+                "metadata": {"department": department_name, "line_manager": manager,
+                             "size": len(department_teams) * 7},
+            },
+            f"# {department_name}\n\n## Teams ({len(department_teams)} teams)\n"
+            + "".join(f"- {name}\n" for name in department_teams),
+        )
+
+    for division_index in range(division_count):
+        division_name = f"Division {division_index + 1}"
+        files[f"division-{division_index + 1}/division-{division_index + 1}.md"] = _markdown_file(
+            {"team_id": f"division-{division_index + 1}", "name": division_name, "team_type": "division",
+             "metadata": {"line_manager": _person(rng)}},
+            f"# {division_name}\n",
+        )
+    files["company-leadership.md"] = _markdown_file(
+        {"name": "Company Leadership", "team_id": "company-leadership", "team_type": "executive",
+         "metadata": {"level": "C-Suite", "size": 6}, "position": {"x": 100.0, "y": 20.0}},
+        "# Company Leadership\n\nExecutive leadership of Synthetic Corp.\n",
+    )
+
+    return {
+        "teams": names,
+        "config": {
+            ConfigFiles.BASELINE_TEAM_TYPES: BASELINE_TEAM_TYPES,
+            ConfigFiles.PRODUCTS: {"products": products},
+            ConfigFiles.BUSINESS_STREAMS: {"business_streams": streams},
+            ConfigFiles.ORGANIZATION_HIERARCHY: {
+                "company": {
+                    "id": "company-leadership",
+                    "name": "Synthetic Corp Leadership",
+                    "type": "leadership",
+                    "level": 0,
+                    "children": departments,
+                }
+            },
+        },
+        "files": files,
+    }
+
+
+def _baseline_team_file(
+    rng: random.Random,
+    name: str,
+    team_type: str,
+    department: str,
+    line_manager: str,
+    providers: list[str],
+    product_names: list[str],
+    stream_by_product: dict[str, str],
+    position: dict[str, float],
+) -> str:
+    front_matter: dict[str, Any] = {
+        "team_id": team_name_to_slug(name),
+        "name": name,
+        "team_type": team_type,
+        "position": position,
+        "metadata": {
+            "size": _team_size(rng),
+            "department": department,
+            "line_manager": line_manager,
+            "established": f"{rng.randint(2010, 2024)}-{rng.randint(1, 12):02d}",
+            "cognitive_load": rng.choice(COGNITIVE_LOADS),
+        },
+    }
+    if team_type == "feature-team":
+        product = rng.choice(product_names)
+        front_matter["product_line"] = product
+        front_matter["business_stream"] = stream_by_product[product]
+
+    count = rng.randint(1, 3)
+    candidates = rng.sample(providers, min(len(providers), count + 1))  # One spare in case it's this team
+    dependencies = [dependency for dependency in candidates if dependency != name][:count]
+    body = (
+        f"# {name}\n\n"
+        f"Owns {name.removesuffix(' Team').lower()} for the {department} department.\n\n"
+        "## Responsibilities\n"
+        f"- Build and run {name.removesuffix(' Team').lower()} capabilities\n"
+        "- On-call for owned services\n\n"
+        "## Dependencies\n\n"
+        "**Teams We Depend On**:\n"
+        + "".join(f"- {dependency} - Shared services and reviews\n" for dependency in dependencies)
+    )
+    return _markdown_file(front_matter, body)
+
+
+# ============================================================================
+# TT design
+# ============================================================================
+
+def generate_tt_teams(rng: random.Random, team_count: int) -> list[dict[str, Any]]:
+    """TT design teams as front matter dicts, with their interactions under '_interactions'."""
+    names = team_names(rng, team_count)
+    value_streams = [f"Value Stream {i + 1}" for i in range(max(2, team_count // TEAMS_PER_VALUE_STREAM))]
+    groupings = [f"Platform Grouping {i + 1}"
+                 for i in range(max(1, team_count // TEAMS_PER_PLATFORM_GROUPING))]
+    columns = max(10, math.isqrt(team_count))
+
+    teams = []
+    for index, name in enumerate(names):
+        team_type = _weighted(rng, TT_TYPE_WEIGHTS)
+        team: dict[str, Any] = {
+            "team_id": team_name_to_slug(name),
+            "name": name,
+            "team_type": team_type,
+            "position": _grid_position(index, columns),
+            "metadata": {"size": _team_size(rng), "cognitive_load": rng.choice(COGNITIVE_LOADS)},
+        }
+        if team_type == TeamTypes.STREAM_ALIGNED:
+            team["metadata"]["flow_metrics"] = {
+                "lead_time_days": rng.randint(1, 30),
+                "deployment_frequency": rng.choice(DEPLOYMENT_FREQUENCIES),
+                "change_fail_rate": round(rng.uniform(0.01, 0.3), 2),
+                "mttr_hours": rng.randint(1, 48),
+            }
+            team["value_stream"] = rng.choice(value_streams)
+        elif team_type == TeamTypes.PLATFORM:
+            team["platform_grouping"] = rng.choice(groupings)
+        teams.append(team)
+
+    by_type: dict[str, list[str]] = {}
+    for team in teams:
+        by_type.setdefault(team["team_type"], []).append(team["name"])
+    for team in teams:
+        team["_interactions"] = _tt_interactions(rng, team, by_type)
+    return teams
+
+
+def _tt_interactions(rng: random.Random, team: dict[str, Any], by_type: dict[str, list[str]]) -> list[tuple[str, str]]:
+    """(team name, mode) pairs following Team Topologies patterns for the team's type."""
+    wanted = {
+        TeamTypes.STREAM_ALIGNED: [(TeamTypes.PLATFORM, InteractionModes.X_AS_A_SERVICE, 2),
+                                   (TeamTypes.COMPLICATED_SUBSYSTEM, InteractionModes.X_AS_A_SERVICE, 1),
+                                   (TeamTypes.STREAM_ALIGNED, InteractionModes.COLLABORATION, 1)],
+        TeamTypes.PLATFORM: [(TeamTypes.PLATFORM, InteractionModes.X_AS_A_SERVICE, 1),
+                             (TeamTypes.COMPLICATED_SUBSYSTEM, InteractionModes.COLLABORATION, 1)],
+        TeamTypes.ENABLING: [(TeamTypes.STREAM_ALIGNED, InteractionModes.FACILITATING, 3)],
+        TeamTypes.COMPLICATED_SUBSYSTEM: [(TeamTypes.PLATFORM, InteractionModes.X_AS_A_SERVICE, 1)],
+    }[team["team_type"]]
+    interactions: dict[str, str] = {}
+    for target_type, mode, most in wanted:
+        candidates = by_type.get(target_type, [])
+        for target in rng.sample(candidates, min(len(candidates), rng.randint(0, most))):
+            if target != team["name"]:
+                interactions.setdefault(target, mode)
+    return list(interactions.items())
+
+
+def tt_team_file(team: dict[str, Any]) -> str:
+    """Markdown of a TT team (front matter, sections and interaction table)."""
+    front_matter = {key: value for key, value in team.items() if not key.startswith("_")}
+    focus = team["name"].removesuffix(" Team").lower()
+    grouping = team.get("value_stream") or team.get("platform_grouping")
+    rows = "".join(
+        f"| {target} | {INTERACTION_LABELS[mode]} | {INTERACTION_PURPOSES[mode]} | Ongoing |\n"
+        for target, mode in team["_interactions"]
+    )
+    body = (
+        f"# {team['name']}\n\n"
+        "## Team name and focus\n\n"
+        f"{team['name']} - Owns {focus} end-to-end.\n\n"
+        "## Team type\n\n"
+        f"{team['team_type']}\n\n"
+        "## Part of a value stream?\n\n"
+        f"{f'Yes - {grouping}' if grouping else 'No'}\n\n"
+        "## Services provided (if applicable)\n\n"
+        f"- {focus.capitalize()} API\n"
+        f"- {focus.capitalize()} events\n\n"
+        "## Teams we currently interact with\n"
+        "| Team Name | Interaction Mode | Purpose | Duration |\n"
+        "|-----------|------------------|---------|----------|\n"
+        f"{rows}"
+    )
+    return _markdown_file(front_matter, body)
+
+
+def evolve_tt_teams(rng: random.Random, teams: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Change SNAPSHOT_CHURN of the teams in place (size, cognitive load); returns the changed teams."""
+    changed = rng.sample(teams, max(1, round(len(teams) * SNAPSHOT_CHURN)))
+    for team in changed:
+        metadata = team["metadata"]
+        metadata["size"] = max(2, min(15, metadata["size"] + rng.choice((-1, 1))))
+        metadata["cognitive_load"] = rng.choice(COGNITIVE_LOADS)
+    return changed
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+@contextmanager
+def use_dataset(data_dir: Path) -> Iterator[None]:
+    """Point the services at a generated dataset (in this process, until exit).
+
+    Like starting the app with DATA_DIR=data_dir; for the generator itself and
+    in-process benchmarks.
+    """
+    from backend import snapshot_services
+    from backend.services import file_ops
+
+    saved = file_ops.TT_TEAMS_DIR, file_ops.BASELINE_TEAMS_DIR, snapshot_services.SNAPSHOTS_DIR
+    file_ops.TT_TEAMS_DIR = data_dir / "tt-teams"
+    file_ops.BASELINE_TEAMS_DIR = data_dir / "baseline-teams"
+    snapshot_services.SNAPSHOTS_DIR = data_dir / "tt-snapshots"
+    snapshot_services.clear_snapshot_caches()
+    try:
+        yield
+    finally:
+        file_ops.TT_TEAMS_DIR, file_ops.BASELINE_TEAMS_DIR, snapshot_services.SNAPSHOTS_DIR = saved
+        snapshot_services.clear_snapshot_caches()
+
+
+def generate_dataset(out_dir: Path, teams: int, seed: int = 0, snapshots: int = 3) -> dict[str, int]:
+    """Write a dataset to out_dir (see the module docstring for the layout).
+
+    Returns:
+        Counts of what was written: baseline_teams, tt_teams, snapshots
+    """
+    if not MIN_TEAMS <= teams <= MAX_TEAMS:
+        raise ValueError(f"teams must be between {MIN_TEAMS} and {MAX_TEAMS}")
+    rng = random.Random(seed)
+    baseline_dir = out_dir / "baseline-teams"
+    tt_dir = out_dir / "tt-teams"
+    snapshots_dir = out_dir / "tt-snapshots"
+
+    baseline = generate_baseline(rng, teams)
+    for filename, config in baseline["config"].items():
+        baseline_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(baseline_dir / filename, config)
+    for relative_path, content in baseline["files"].items():
+        path = baseline_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+    tt_teams = generate_tt_teams(rng, teams)
+    tt_dir.mkdir(parents=True, exist_ok=True)
+    _write_json(tt_dir / ConfigFiles.TT_TEAM_TYPES, TT_TEAM_TYPES)
+    for team in tt_teams:
+        (tt_dir / f"{team['team_id']}.md").write_text(tt_team_file(team), encoding="utf-8")
+
+    if snapshots:
+        from backend.snapshot_services import create_snapshot
+
+        snapshots_dir.mkdir(parents=True, exist_ok=True)
+        with use_dataset(out_dir):
+            for number in range(1, snapshots + 1):
+                if number > 1:
+                    for team in evolve_tt_teams(rng, tt_teams):
+                        (tt_dir / f"{team['team_id']}.md").write_text(tt_team_file(team), encoding="utf-8")
+                create_snapshot(f"Synthetic design v{number}", description=f"Generated with seed {seed}",
+                                author="dataset-generator")
+
+    return {
+        "baseline_teams": len(baseline["teams"]),
+        "tt_teams": len(tt_teams),
+        "snapshots": snapshots,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.dataset_generator",
+        description="Generate a synthetic large-organization dataset (baseline, TT design, snapshots).",
+    )
+    parser.add_argument("out_dir", type=Path, help="Output directory (use as DATA_DIR)")
+    parser.add_argument("--teams", type=int, default=1000,
+                        help=f"Teams per view ({MIN_TEAMS}-{MAX_TEAMS}, default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--snapshots", type=int, default=3, help="TT snapshots to create (default: 3)")
+    parser.add_argument("--force", action="store_true",
+                        help="Replace an existing dataset in out_dir")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not MIN_TEAMS <= args.teams <= MAX_TEAMS:
+        print(f"--teams must be between {MIN_TEAMS} and {MAX_TEAMS}", file=sys.stderr)
+        return 2
+    if args.snapshots < 0:
+        print("--snapshots must not be negative", file=sys.stderr)
+        return 2
+
+    existing = [args.out_dir / name for name in ("baseline-teams", "tt-teams", "tt-snapshots")
+                if (args.out_dir / name).exists()]
+    if existing and not args.force:
+        print(f"{args.out_dir} already contains a dataset (use --force to replace it)", file=sys.stderr)
+        return 2
+    for path in existing:
+        shutil.rmtree(path)
+
+    counts = generate_dataset(args.out_dir, args.teams, args.seed, args.snapshots)
+    print(
+        f"Wrote {counts['baseline_teams']} baseline teams, {counts['tt_teams']} TT teams "
+        f"and {counts['snapshots']} snapshots to {args.out_dir}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+"""In-process background jobs for operations too slow for a single HTTP request
+
+A job runs on a small thread pool; clients poll /api/jobs/{job_id} for its
+status, progress and (once finished) result. Finished jobs are kept for
+JOB_TTL_SECONDS, then dropped. Jobs live in the memory of one server process,
+so with several uvicorn workers a job is only visible to the worker that ran it.
+
+Settings (environment variables):
+- JOB_WORKERS: jobs run concurrently (default 2)
+- JOB_MAX_PENDING: queued + running jobs before new submissions are refused (default 16)
+- JOB_TTL_SECONDS: how long finished jobs are retained (default 3600)
+"""
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+# A job function gets a progress callback, progress(done, total), and returns the result
+ProgressCallback = Callable[[int, int], None]
+JobFunction = Callable[[ProgressCallback], Any]
+
+
+class JobQueueFullError(Exception):
+    """Raised when JOB_MAX_PENDING jobs are already queued or running"""
+
+
+@dataclass
+class Job:
+    """State of one background job (updated by the worker thread)"""
+    job_id: str
+    kind: str
+    status: str = JOB_QUEUED
+    done: int = 0
+    total: int | None = None
+    result: Any = None
+    error: str | None = None
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def to_dict(self, include_result: bool = True) -> dict[str, Any]:
+        data = {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {"done": self.done, "total": self.total},
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """Bounded thread pool running jobs, plus a TTL-limited registry of their state"""
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, ttl_seconds: float = 3600):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None  # Created (and imported) on first submit
+
+    def submit(self, kind: str, fn: JobFunction) -> Job:
+        """Queue fn to run in the background and return its (queued) job
+
+        Raises:
+            JobQueueFullError: If max_pending jobs are already queued or running
+        """
+        with self._lock:
+            self._prune()
+            pending = sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATES)
+            if pending >= self.max_pending:
+                raise JobQueueFullError(f"Too many pending jobs ({pending}), try again later")
+
+            job = Job(job_id=uuid.uuid4().hex, kind=kind)
+            self._jobs[job.job_id] = job
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            self._executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list[Job]:
+        """All retained jobs, newest first"""
+        with self._lock:
+            self._prune()
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running jobs (queued jobs are cancelled)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, job: Job, fn: JobFunction) -> None:
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+
+        def progress(done: int, total: int) -> None:
+            job.done, job.total = done, total
+
+        try:
+            job.result = fn(progress)
+            job.status = JOB_SUCCEEDED
+        except Exception as e:
+            print(f"Job {job.job_id} ({job.kind}) failed: {e}\n{traceback.format_exc()}")
+            job.error = str(e)
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than the TTL (caller holds the lock)"""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+job_manager = JobManager(
+    workers=int(os.getenv("JOB_WORKERS", "2")),
+    max_pending=int(os.getenv("JOB_MAX_PENDING", "16")),
+    ttl_seconds=float(os.getenv("JOB_TTL_SECONDS", "3600")),
+)
@@ -0,0 +1,371 @@
+"""Load-testing harness for the HTTP API (how many concurrent planners one instance serves)
+
+Starts uvicorn on a generated dataset (or targets a running server), then lets
+--users virtual planners work concurrently for --duration seconds and reports
+throughput, latency percentiles and error rates per route:
+
+    python -m backend.loadtest --teams 1000 --users 20 --duration 60
+    python -m backend.loadtest --data-dir build/org-5k --workers 4 --users 50
+    python -m backend.loadtest --url http://localhost:8000 --users 10 --output load.json
+
+Each planner repeatedly picks an action (weights in ACTIONS), then pauses for an
+exponentially distributed think time (--think-ms on average):
+- view switch: GET /api/{view}/teams plus the view's config endpoints
+- modal open: GET /api/{view}/teams/{team_id}
+- drag burst: several quick position PATCHes of one team
+- validate: GET /api/{view}/validate
+- snapshot: list snapshots, and now and then create one
+
+Drag bursts and snapshots write to the data directory. By default the server runs
+on a generated dataset in a temporary directory; --data-dir and --url are written to.
+
+Exit codes: 0 = ok, 1 = requests failed above --max-error-rate, 2 = usage or startup error.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+VIEWS = ("tt", "baseline")
+CONFIG_ENDPOINTS = {
+    "tt": ["/api/tt/team-types"],
+    "baseline": ["/api/baseline/team-types", "/api/baseline/organization-hierarchy",
+                 "/api/baseline/product-lines", "/api/baseline/business-streams"],
+}
+DRAG_BURST = (3, 8)  # Position updates per drag (min, max)
+DRAG_INTERVAL = 0.05  # Seconds between the updates of one drag
+SNAPSHOT_CREATE_SHARE = 0.2  # Share of snapshot actions that create one
+
+SERVER_START_TIMEOUT = 60.0
+REQUEST_TIMEOUT = 120.0
+
+PERCENTILES = (50, 95, 99)
+
+
+# ============================================================================
+# Recording
+# ============================================================================
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)  # Seconds, successful or not
+    errors: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)  # Status code (or exception name) -> count
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """q-th percentile (0-100) of sorted values, interpolating between closest ranks."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class Recorder:
+    """Latencies and outcomes of all requests, by route template ("GET /api/tt/teams/{team_id}")"""
+
+    def __init__(self):
+        self.routes: dict[str, RouteStats] = {}
+
+    def record(self, route: str, latency: float, status: int | str) -> None:
+        stats = self.routes.setdefault(route, RouteStats())
+        stats.latencies.append(latency)
+        stats.statuses[str(status)] = stats.statuses.get(str(status), 0) + 1
+        if not isinstance(status, int) or status >= 400:
+            stats.errors += 1
+
+    def report(self, duration: float) -> dict[str, Any]:
+        """{duration_seconds, requests, errors, error_rate, throughput_rps, routes: {route: ...}}"""
+        routes = {}
+        for route, stats in sorted(self.routes.items()):
+            latencies = sorted(stats.latencies)
+            routes[route] = {
+                "requests": len(latencies),
+                "errors": stats.errors,
+                "error_rate": stats.errors / len(latencies),
+                "throughput_rps": len(latencies) / duration,
+                **{f"p{q}_ms": percentile(latencies, q) * 1000 for q in PERCENTILES},
+                "max_ms": latencies[-1] * 1000,
+                "statuses": dict(sorted(stats.statuses.items())),
+            }
+        requests = sum(r["requests"] for r in routes.values())
+        errors = sum(r["errors"] for r in routes.values())
+        return {
+            "duration_seconds": duration,
+            "requests": requests,
+            "errors": errors,
+            "error_rate": errors / requests if requests else 0.0,
+            "throughput_rps": requests / duration if duration else 0.0,
+            "routes": routes,
+        }
+
+
+# ============================================================================
+# Workload
+# ============================================================================
+
+@dataclass
+class Planner:
+    """One simulated user, with the team ids it can open and drag"""
+    client: httpx.AsyncClient
+    recorder: Recorder
+    rng: random.Random
+    team_ids: dict[str, list[str]]
+    number: int
+
+    async def request(self, method: str, route: str, path: str, **kwargs) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(f"{method} {route}", time.perf_counter() - start, type(e).__name__)
+            return None
+        self.recorder.record(f"{method} {route}", time.perf_counter() - start, response.status_code)
+        return response
+
+    def pick_view(self) -> str:
+        return self.rng.choice([view for view in VIEWS if self.team_ids.get(view)] or ["tt"])
+
+    async def view_switch(self) -> None:
+        view = self.pick_view()
+        await self.request("GET", f"/api/{view}/teams", f"/api/{view}/teams")
+        for path in CONFIG_ENDPOINTS[view]:
+            await self.request("GET", path, path)
+
+    async def modal_open(self) -> None:
+        view = self.pick_view()
+        team_id = self.rng.choice(self.team_ids[view])
+        await self.request("GET", f"/api/{view}/teams/{{team_id}}", f"/api/{view}/teams/{team_id}")
+
+    async def drag_burst(self) -> None:
+        view = self.pick_view()
+        team_id = self.rng.choice(self.team_ids[view])
+        x, y = self.rng.uniform(0, 3000), self.rng.uniform(0, 2000)
+        for _ in range(self.rng.randint(*DRAG_BURST)):
+            x += self.rng.uniform(-40, 40)
+            y += self.rng.uniform(-40, 40)
+            await self.request("PATCH", f"/api/{view}/teams/{{team_id}}/position",
+                               f"/api/{view}/teams/{team_id}/position", json={"x": x, "y": y})
+            await asyncio.sleep(DRAG_INTERVAL)
+
+    async def validate(self) -> None:
+        view = self.pick_view()
+        await self.request("GET", f"/api/{view}/validate", f"/api/{view}/validate")
+
+    async def snapshot(self) -> None:
+        await self.request("GET", "/api/tt/snapshots", "/api/tt/snapshots")
+        if self.rng.random() < SNAPSHOT_CREATE_SHARE:
+            await self.request("POST", "/api/tt/snapshots/create", "/api/tt/snapshots/create",
+                               json={"name": f"Load test {self.number}", "author": "loadtest"})
+
+
+# Action -> weight (relative frequency)
+ACTIONS: dict[str, int] = {
+    "view_switch": 25,
+    "modal_open": 45,
+    "drag_burst": 20,
+    "validate": 5,
+    "snapshot": 5,
+}
+
+
+async def _planner_loop(planner: Planner, deadline: float, think_time: float) -> None:
+    actions: list[Callable[[], Awaitable[None]]] = [getattr(planner, name) for name in ACTIONS]
+    weights = list(ACTIONS.values())
+    while time.perf_counter() < deadline:
+        await planner.rng.choices(actions, weights=weights)[0]()
+        if think_time > 0:
+            await asyncio.sleep(planner.rng.expovariate(1 / think_time))
+
+
+async def fetch_team_ids(client: httpx.AsyncClient) -> dict[str, list[str]]:
+    team_ids = {}
+    for view in VIEWS:
+        response = await client.get(f"/api/{view}/teams")
+        response.raise_for_status()
+        team_ids[view] = [team["team_id"] for team in response.json()]
+    return team_ids
+
+
+async def run_load(
+    base_url: str,
+    users: int,
+    duration: float,
+    think_time: float = 0.5,
+    seed: int = 0,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> dict[str, Any]:
+    """Run users concurrent planners against base_url for duration seconds.
+
+    Returns:
+        The Recorder report (see Recorder.report), plus users and think_time_ms
+    """
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, transport=transport, limits=limits,
+                                 timeout=REQUEST_TIMEOUT) as client:
+        team_ids = await fetch_team_ids(client)
+        recorder = Recorder()
+        start = time.perf_counter()
+        deadline = start + duration
+        planners = [Planner(client, recorder, random.Random(seed * 10_000 + number), team_ids, number)
+                    for number in range(users)]
+        await asyncio.gather(*(_planner_loop(planner, deadline, think_time) for planner in planners))
+        elapsed = time.perf_counter() - start
+
+    return {**recorder.report(elapsed), "users": users, "think_time_ms": think_time * 1000}
+
+
+# ============================================================================
+# Server
+# ============================================================================
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(data_dir: Path, workers: int = 1):
+    """Run uvicorn (main:app) on data_dir at a free local port; yields its base URL."""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {**os.environ, "DATA_DIR": str(data_dir.resolve())}
+    env.pop("TT_DESIGN_VARIANT", None)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+            try:
+                if httpx.get(f"{base_url}/api/tt/team-types", timeout=1).status_code < 500:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn did not start within {SERVER_START_TIMEOUT:.0f}s")
+            time.sleep(0.1)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def format_report(report: dict[str, Any]) -> str:
+    width = max([len("route")] + [len(route) for route in report["routes"]])
+    header = (f"{'route':<{width}}  {'requests':>8}  {'rps':>7}  {'p50 ms':>8}  {'p95 ms':>8}  "
+              f"{'p99 ms':>8}  {'errors':>7}")
+    lines = [header]
+    for route, stats in report["routes"].items():
+        lines.append(
+            f"{route:<{width}}  {stats['requests']:>8}  {stats['throughput_rps']:>7.1f}  "
+            f"{stats['p50_ms']:>8.1f}  {stats['p95_ms']:>8.1f}  {stats['p99_ms']:>8.1f}  "
+            f"{stats['error_rate']:>7.1%}"
+        )
+    lines.append("")
+    lines.append(
+        f"{report['users']} users, {report['duration_seconds']:.1f}s: {report['requests']} requests, "
+        f"{report['throughput_rps']:.1f} req/s, {report['error_rate']:.2%} errors"
+    )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.loadtest",
+        description="Replay a mixed planner workload against the API and report latency per route.",
+    )
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Test a running server (its data will be written to)")
+    target.add_argument("--data-dir", type=Path,
+                        help="Start the server on this data directory (it will be written to)")
+    parser.add_argument("--teams", type=int, default=500,
+                        help="Teams in the generated dataset when no --url/--data-dir (default: 500)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes (default: 1)")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent planners (default: 10)")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run (default: 30)")
+    parser.add_argument("--think-ms", type=float, default=500,
+                        help="Average pause between a planner's actions (default: 500, 0 = none)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for dataset and workload")
+    parser.add_argument("--output", type=Path, help="Also write the report as JSON")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Exit 1 if more requests than this fail (default: 0.01)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.users < 1 or args.duration <= 0 or args.workers < 1:
+        print("--users and --workers must be at least 1 and --duration positive", file=sys.stderr)
+        return 2
+
+    def load(base_url: str) -> dict[str, Any]:
+        print(f"Running {args.users} planners for {args.duration:g}s against {base_url}...",
+              file=sys.stderr)
+        return asyncio.run(run_load(base_url, args.users, args.duration, args.think_ms / 1000, args.seed))
+
+    tmp_dir = None
+    try:
+        if args.url:
+            report = load(args.url.rstrip("/"))
+        else:
+            data_dir = args.data_dir
+            if data_dir is None:
+                from backend.dataset_generator import generate_dataset
+
+                tmp_dir = Path(tempfile.mkdtemp(prefix="tt-loadtest-"))
+                data_dir = tmp_dir / "data"
+                print(f"Generating a dataset of {args.teams} teams...", file=sys.stderr)
+                generate_dataset(data_dir, args.teams, seed=args.seed, snapshots=1)
+            elif not data_dir.is_dir():
+                print(f"Not a directory: {data_dir}", file=sys.stderr)
+                return 2
+            with local_server(data_dir, args.workers) as base_url:
+                report = load(base_url)
+    except (RuntimeError, httpx.HTTPError) as e:
+        print(f"Load test failed: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print(format_report(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,254 @@
+"""In-process metrics registry with Prometheus text exposition (/api/metrics)
+
+Counters and histograms are plain dicts behind a lock, cheap enough to update
+on every request. Values are per server process: with several uvicorn workers,
+each scrape sees the worker that answered it.
+
+Metrics:
+- http_request_duration_seconds{method, route, status}: latency per route template
+- team_files_parsed_total, team_file_parse_errors_total
+- cache_requests_total{cache, result}: result is "hit" or "miss"
+- validation_duration_seconds{view, profile}
+- snapshot_io_bytes_total{direction}: direction is "read" or "write"
+- startup_phase_duration_seconds{phase}: time of each startup phase (from backend.startup)
+- file_lock_*{category}: lock acquisitions and waits (from backend.services.locking)
+"""
+import bisect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Latency buckets (seconds), from cached lookups to full validations of large datasets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# A sample: (name suffix, labels, value)
+Sample = tuple[str, dict[str, str], float]
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> list[Sample]:
+        """Current samples, in exposition order"""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            if not self.labelnames:
+                return [("", {}, self._values.get((), 0))]  # Report 0 before the first increment
+            return [("", dict(zip(self.labelnames, key, strict=True)), value)
+                    for key, value in sorted(self._values.items())]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> list[Sample]:
+        with self._lock:
+            return [("", dict(zip(self.labelnames, key, strict=True)), value)
+                    for key, value in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[tuple[str, ...], list[float]] = {}  # bucket counts..., +Inf count, sum
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)  # Buckets are upper bounds (le)
+        with self._lock:
+            counts = self._values.get(key)
+            if counts is None:
+                counts = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            counts = self._values.get(self._key(labels))
+            return int(sum(counts[:-1])) if counts else 0
+
+    def samples(self) -> list[Sample]:
+        samples = []
+        with self._lock:
+            for key, counts in sorted(self._values.items()):
+                labels = dict(zip(self.labelnames, key, strict=True))
+                cumulative = 0.0
+                for bound, count in zip((*self.buckets, math.inf), counts[:-1], strict=True):
+                    cumulative += count
+                    samples.append(("_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+                samples.append(("_count", labels, cumulative))
+                samples.append(("_sum", labels, counts[-1]))
+        return samples
+
+
+_REGISTRY: list[_Metric] = []
+# Collectors return (name, kind, documentation, samples) for values owned elsewhere
+_COLLECTORS: list[Callable[[], list[tuple[str, str, str, list[Sample]]]]] = []
+
+
+def _register(metric: Any) -> Any:
+    _REGISTRY.append(metric)
+    return metric
+
+
+def register_collector(collector: Callable[[], list[tuple[str, str, str, list[Sample]]]]) -> None:
+    _COLLECTORS.append(collector)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_metrics() -> str:
+    """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+    families = [(m.name, m.kind, m.documentation, m.samples()) for m in _REGISTRY]
+    for collector in _COLLECTORS:
+        families.extend(collector())
+
+    lines = []
+    for name, kind, documentation, samples in families:
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{key}="{_escape(str(v))}"' for key, v in labels.items())
+            lines.append(f"{name}{suffix}{{{label_text}}} {_format_value(value)}" if label_text
+                         else f"{name}{suffix} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    """Clear all recorded values (for tests)."""
+    for metric in _REGISTRY:
+        with metric._lock:
+            metric._values.clear()
+
+
+REQUEST_LATENCY = _register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route", "status"),
+))
+FILES_PARSED = _register(Counter("team_files_parsed_total", "Team files parsed"))
+PARSE_ERRORS = _register(Counter("team_file_parse_errors_total", "Team files that failed to parse"))
+CACHE_REQUESTS = _register(Counter(
+    "cache_requests_total", "Cache lookups by cache and result (hit or miss)", ("cache", "result"),
+))
+VALIDATION_DURATION = _register(Histogram(
+    "validation_duration_seconds", "Duration of team file validation runs", ("view", "profile"),
+))
+SNAPSHOT_IO_BYTES = _register(Counter(
+    "snapshot_io_bytes_total", "Bytes of snapshot files and objects read or written", ("direction",),
+))
+STARTUP_PHASE_DURATION = _register(Gauge(
+    "startup_phase_duration_seconds", "Duration of each application startup phase", ("phase",),
+))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def _lock_samples() -> list[tuple[str, str, str, list[Sample]]]:
+    from backend.services.locking import lock_stats  # backend.services imports this module
+
+    stats = sorted(lock_stats().items())
+    return [
+        ("file_lock_acquired_total", "counter", "File lock acquisitions",
+         [("", {"category": category}, s["acquired"]) for category, s in stats]),
+        ("file_lock_contended_total", "counter", "File lock acquisitions that had to wait",
+         [("", {"category": category}, s["contended"]) for category, s in stats]),
+        ("file_lock_wait_seconds_total", "counter", "Time spent waiting for file locks",
+         [("", {"category": category}, s["wait_seconds"]) for category, s in stats]),
+    ]
+
+
+register_collector(_lock_samples)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording REQUEST_LATENCY (until the response is fully sent)
+
+    Requests are labelled with the matched route template (e.g. /api/tt/teams/{team_id}),
+    so label cardinality stays bounded; unmatched requests share route="unmatched".
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            )
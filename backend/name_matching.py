@@ -0,0 +1,98 @@
+"""Fuzzy matching of team names, for "did you mean" suggestions.
+
+Uses a trigram index: a string within edit distance k of the query keeps all
+but at most 3k of the query's trigrams (one edit touches at most three of
+them), so only terms sharing enough trigrams are compared with the full edit
+distance. On thousands of team names a lookup verifies a handful of
+candidates instead of scanning every name.
+"""
+from collections import defaultdict
+from typing import Any
+
+TRIGRAM_PAD = "\0\0"
+
+
+def levenshtein(a: str, b: str, max_distance: int | None = None) -> int:
+    """Edit distance between two strings (insert/delete/substitute cost 1).
+
+    Args:
+        max_distance: Give up once the distance is known to exceed this;
+                      max_distance + 1 is returned in that case
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    limit = len(a) if max_distance is None else max_distance
+    if len(a) - len(b) > limit:
+        return limit + 1
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,  # deletion
+                current[j - 1] + 1,  # insertion
+                previous[j - 1] + (char_a != char_b),  # substitution
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+def trigrams(term: str) -> set[str]:
+    """Distinct trigrams of a term, padded so short terms and word edges count."""
+    padded = f"{TRIGRAM_PAD}{term}{TRIGRAM_PAD}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Maps search terms to values (several terms may share a value)."""
+
+    def __init__(self):
+        self._terms: list[str] = []
+        self._values: list[set[Any]] = []
+        self._term_ids: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, term: str, value: Any) -> None:
+        """Index a term; adding an existing term attaches another value to it."""
+        term_id = self._term_ids.get(term)
+        if term_id is not None:
+            self._values[term_id].add(value)
+            return
+
+        term_id = len(self._terms)
+        self._term_ids[term] = term_id
+        self._terms.append(term)
+        self._values.append({value})
+        for gram in trigrams(term):
+            self._postings[gram].append(term_id)
+
+    def search(self, term: str, max_distance: int) -> list[tuple[int, Any]]:
+        """All (distance, value) pairs within max_distance of term, closest first."""
+        grams = trigrams(term)
+        min_shared = len(grams) - 3 * max_distance
+
+        if min_shared > 0:
+            shared: dict[int, int] = defaultdict(int)
+            for gram in grams:
+                for term_id in self._postings.get(gram, ()):
+                    shared[term_id] += 1
+            candidates = [term_id for term_id, count in shared.items() if count >= min_shared]
+        else:
+            # Query too short for the trigram bound to prune anything
+            candidates = range(len(self._terms))
+
+        best: dict[Any, int] = {}
+        for term_id in candidates:
+            distance = levenshtein(term, self._terms[term_id], max_distance)
+            if distance <= max_distance:
+                for value in self._values[term_id]:
+                    if distance < best.get(value, max_distance + 1):
+                        best[value] = distance
+
+        return sorted(((d, v) for v, d in best.items()), key=lambda item: (item[0], str(item[1])))
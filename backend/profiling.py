@@ -0,0 +1,209 @@
+"""Opt-in request profiling (statistical stack sampling, collapsed-stack output)
+
+A profiled request is sampled by a background thread that records the stack of
+the thread serving it every PROFILE_INTERVAL_MS. Route handlers are async and
+run on the event loop thread, so that is the thread sampled. The result is
+written in collapsed-stack format ("frame;frame;frame count" per line), which
+speedscope (https://www.speedscope.app) and flamegraph.pl open directly, with
+a JSON sidecar describing the request.
+
+Settings (environment variables):
+- PROFILE_REQUESTS=true: profile every request
+- PROFILE_ADMIN_TOKEN: lets a request opt in with the headers
+  `X-Profile: 1` and `X-Admin-Token: <token>`. The token also guards /api/profiles.
+- PROFILE_DIR: where profiles are stored (default: tt-profiles in the temp directory)
+- PROFILE_INTERVAL_MS: sampling interval (default 1)
+- PROFILE_KEEP: number of most recent profiles kept (default 50)
+
+Only one request is profiled at a time per process; requests arriving while a
+profile is running are served unprofiled.
+"""
+import hmac
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from backend.services.locking import atomic_write_text
+
+PROFILE_SUFFIX = ".collapsed"
+METADATA_SUFFIX = ".json"
+
+_ACTIVE = threading.Lock()  # Held while a request is being profiled
+
+
+def profiling_enabled() -> bool:
+    return os.getenv("PROFILE_REQUESTS") == "true"
+
+
+def admin_token_valid(token: str | None) -> bool:
+    """Whether token matches PROFILE_ADMIN_TOKEN (never true if it isn't set)."""
+    expected = os.getenv("PROFILE_ADMIN_TOKEN")
+    return bool(expected) and token is not None and hmac.compare_digest(token, expected)
+
+
+def profile_dir() -> Path:
+    return Path(os.getenv("PROFILE_DIR", Path(tempfile.gettempdir()) / "tt-profiles"))
+
+
+def _frame_name(code) -> str:
+    filename = code.co_filename
+    if "site-packages" in filename:
+        filename = filename.split("site-packages", 1)[1].lstrip("/\\")
+    else:
+        try:
+            filename = os.path.relpath(filename)
+        except ValueError:
+            pass  # Different drive on Windows
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed interval, counting identical stacks"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+
+def start_profile() -> StackSampler | None:
+    """Start sampling the calling thread, or None if another profile is running."""
+    if not _ACTIVE.acquire(blocking=False):
+        return None
+    interval = float(os.getenv("PROFILE_INTERVAL_MS", "1")) / 1000
+    sampler = StackSampler(threading.get_ident(), interval)
+    sampler.start()
+    return sampler
+
+
+def finish_profile(sampler: StackSampler, profile_id: str, request_info: dict[str, Any]) -> None:
+    """Stop sampling and store the profile (plus metadata), pruning old profiles."""
+    try:
+        stacks = sampler.stop()
+    finally:
+        _ACTIVE.release()
+
+    directory = profile_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(
+        directory / f"{profile_id}{PROFILE_SUFFIX}",
+        "".join(f"{stack} {count}\n" for stack, count in stacks.most_common()),
+    )
+    metadata = {"profile_id": profile_id, **request_info, "samples": sum(stacks.values())}
+    atomic_write_text(directory / f"{profile_id}{METADATA_SUFFIX}", json.dumps(metadata))
+    _prune(directory, int(os.getenv("PROFILE_KEEP", "50")))
+
+
+def new_profile_id() -> str:
+    """Unique id that sorts by creation time"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{uuid.uuid4().hex[:6]}"
+
+
+def _prune(directory: Path, keep: int) -> None:
+    for metadata_file in sorted(directory.glob(f"*{METADATA_SUFFIX}"), reverse=True)[keep:]:
+        metadata_file.unlink(missing_ok=True)
+        metadata_file.with_suffix(PROFILE_SUFFIX).unlink(missing_ok=True)
+
+
+def list_profiles() -> list[dict[str, Any]]:
+    """Metadata of stored profiles, newest first."""
+    profiles = []
+    for metadata_file in sorted(profile_dir().glob(f"*{METADATA_SUFFIX}"), reverse=True):
+        try:
+            profiles.append(json.loads(metadata_file.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue  # Pruned or being written
+    return profiles
+
+
+def profile_path(profile_id: str) -> Path | None:
+    """Collapsed-stack file of a profile, or None if unknown (ids are never paths)."""
+    if not profile_id or Path(profile_id).name != profile_id:
+        return None
+    path = profile_dir() / f"{profile_id}{PROFILE_SUFFIX}"
+    return path if path.is_file() else None
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests opted in by PROFILE_REQUESTS or the admin headers
+
+    Profiled responses carry an X-Profile-Id header naming the stored profile.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = start_profile()
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id()
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_profile_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message = {**message, "headers": [*message.get("headers", []),
+                                                  (b"x-profile-id", profile_id.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            route = scope.get("route")
+            finish_profile(sampler, profile_id, {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None),
+                "status": status,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "created_at": datetime.now().isoformat(),
+            })
+
+    @staticmethod
+    def _wanted(scope) -> bool:
+        if scope["path"].startswith("/api/profiles"):
+            return False
+        if profiling_enabled():
+            return True
+        headers = dict(scope.get("headers") or [])
+        if headers.get(b"x-profile") != b"1":
+            return False
+        token = headers.get(b"x-admin-token")
+        return admin_token_valid(token.decode("latin-1") if token is not None else None)
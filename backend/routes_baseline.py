@@ -4,22 +4,27 @@ import os
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from backend.models import (
     PositionUpdate,
     TeamData,
 )
+from backend.routes_jobs import submit_job
+from backend.search import DEFAULT_LIMIT, MAX_LIMIT, search_teams
 from backend.services import (
-    BASELINE_TEAMS_DIR,
     find_all_teams,
     find_team_by_id,
+    get_data_dir,
     update_position_in_file,
 )
+from backend.sse import validation_stream_response
 from backend.validation import (
     ORGANIZATION_STRUCTURE_TYPES,
     validate_all_config_files,
     validate_all_team_files,
 )
+from backend.validation_rules import DEFAULT_PROFILE, VALIDATOR_PROFILES
 
 router = APIRouter(prefix="/api/baseline", tags=["baseline"])
 
@@ -27,7 +32,7 @@ router = APIRouter(prefix="/api/baseline", tags=["baseline"])
 @router.get("/team-types")
 async def get_team_types():
     """Get team type definitions with colors and descriptions for Baseline view"""
-    config_file = BASELINE_TEAMS_DIR / "baseline-team-types.json"
+    config_file = get_data_dir("baseline") / "baseline-team-types.json"
 
     if not config_file.exists():
         raise HTTPException(status_code=404, detail="Team types configuration not found")
@@ -41,7 +46,7 @@ async def get_team_types():
 @router.get("/organization-hierarchy")
 async def get_organization_hierarchy():
     """Get the organizational hierarchy for Baseline view"""
-    hierarchy_file = BASELINE_TEAMS_DIR / "organization-hierarchy.json"
+    hierarchy_file = get_data_dir("baseline") / "organization-hierarchy.json"
 
     if not hierarchy_file.exists():
         raise HTTPException(status_code=404, detail="Organization hierarchy not found")
@@ -55,7 +60,7 @@ async def get_organization_hierarchy():
 @router.get("/product-lines")
 async def get_product_lines():
     """Get teams grouped by product lines for Product Lines view (Baseline only)"""
-    products_file = BASELINE_TEAMS_DIR / "products.json"
+    products_file = get_data_dir("baseline") / "products.json"
 
     if not products_file.exists():
         raise HTTPException(status_code=404, detail="Products configuration not found")
@@ -110,7 +115,7 @@ async def get_product_lines():
 @router.get("/business-streams")
 async def get_business_streams():
     """Get teams grouped by business streams for Business Streams view (Baseline only)"""
-    business_streams_file = BASELINE_TEAMS_DIR / "business-streams.json"
+    business_streams_file = get_data_dir("baseline") / "business-streams.json"
 
     if not business_streams_file.exists():
         raise HTTPException(status_code=404, detail="Business streams configuration not found")
@@ -226,14 +231,64 @@ async def update_team_position(team_id: str, position: PositionUpdate):
     return {"message": "Position updated", "position": {"x": x, "y": y}}
 
 
+@router.get("/search")
+async def search(q: str, limit: int = DEFAULT_LIMIT) -> dict[str, Any]:
+    """Full-text search over Baseline teams (name, purpose, description, services, software, members)
+
+    Hits are ranked by relevance (BM25) and include a snippet of the best matching field.
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+    if not 1 <= limit <= MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_LIMIT}")
+    return search_teams("baseline", q, limit)
+
+
 @router.get("/validate")
-async def validate_files() -> dict[str, Any]:
-    """Validate all Baseline team files and config files for common issues"""
-    team_validation = validate_all_team_files("baseline")
+async def validate_files(profile: str = DEFAULT_PROFILE, timings: bool = False) -> dict[str, Any]:
+    """Validate all Baseline team files and config files for common issues
+
+    Use profile=fast for structural checks only (cheap enough to run on every save),
+    and timings=true to include per-rule call counts and durations.
+    """
+    _check_validation_profile(profile)
+    team_validation = validate_all_team_files("baseline", profile=profile, include_timings=timings)
     config_validation = validate_all_config_files("baseline")
-
     return {
         "teams": team_validation,
         "config_files": config_validation,
         "team_schema": "baseline-team-file"
     }
+
+
+@router.post("/validate/jobs", status_code=202)
+async def submit_validation_job(profile: str = DEFAULT_PROFILE, timings: bool = False) -> dict[str, Any]:
+    """Run Baseline validation as a background job; poll /api/jobs/{job_id} for progress and the report
+
+    The job's result has the same shape as the /validate response.
+    """
+    _check_validation_profile(profile)
+
+    def run(progress) -> dict[str, Any]:
+        return {
+            "teams": validate_all_team_files("baseline", profile=profile, include_timings=timings, progress=progress),
+            "config_files": validate_all_config_files("baseline"),
+            "team_schema": "baseline-team-file"
+        }
+
+    return submit_job("validate-baseline", run)
+
+
+@router.get("/validate/stream")
+async def validate_files_stream(profile: str = DEFAULT_PROFILE) -> StreamingResponse:
+    """Stream Baseline validation results as Server-Sent Events (per-file issues, then a summary)"""
+    _check_validation_profile(profile)
+    return validation_stream_response("baseline", "baseline-team-file", profile)
+
+
+def _check_validation_profile(profile: str) -> None:
+    if profile not in VALIDATOR_PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown validation profile: {profile} (valid: {', '.join(VALIDATOR_PROFILES)})"
+        )
@@ -0,0 +1,34 @@
+"""API routes for background job status (jobs are submitted by the view routers)"""
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+
+from backend.jobs import JobFunction, JobQueueFullError, job_manager
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+@router.get("")
+async def get_jobs() -> list[dict[str, Any]]:
+    """List retained jobs (newest first), without their results"""
+    return [job.to_dict(include_result=False) for job in job_manager.list_jobs()]
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str) -> dict[str, Any]:
+    """Status, progress and - once finished - result or error of a job"""
+    job = job_manager.get(job_id)
+
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found (or expired): {job_id}")
+
+    return job.to_dict()
+
+
+def submit_job(kind: str, fn: JobFunction) -> dict[str, Any]:
+    """Submit a job for a route handler; poll the returned job_id at /api/jobs/{job_id}"""
+    try:
+        job = job_manager.submit(kind, fn)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return job.to_dict(include_result=False)
@@ -0,0 +1,42 @@
+"""API routes for stored request profiles (see backend/profiling.py)"""
+import os
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import FileResponse
+
+router = APIRouter(prefix="/api/profiles", tags=["profiling"])
+
+
+def _check_access(admin_token: str | None) -> None:
+    """Require the admin token if PROFILE_ADMIN_TOKEN is set; otherwise allow only while PROFILE_REQUESTS is on."""
+    from backend.profiling import admin_token_valid, profiling_enabled  # Not loaded until used
+
+    if os.getenv("PROFILE_ADMIN_TOKEN"):
+        if not admin_token_valid(admin_token):
+            raise HTTPException(status_code=403, detail="Profiles require a valid X-Admin-Token")
+    elif not profiling_enabled():
+        raise HTTPException(status_code=403, detail="Profiling is disabled")
+
+
+@router.get("")
+async def get_profiles(x_admin_token: str | None = Header(default=None)) -> list[dict[str, Any]]:
+    """List recent request profiles (newest first): request, status, duration and sample count"""
+    from backend.profiling import list_profiles
+
+    _check_access(x_admin_token)
+    return list_profiles()
+
+
+@router.get("/{profile_id}")
+async def download_profile(profile_id: str, x_admin_token: str | None = Header(default=None)) -> FileResponse:
+    """Download a profile in collapsed-stack format (open it in speedscope or flamegraph.pl)"""
+    from backend.profiling import profile_path
+
+    _check_access(x_admin_token)
+    path = profile_path(profile_id)
+
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+
+    return FileResponse(path, media_type="text/plain", filename=path.name)
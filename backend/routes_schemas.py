@@ -8,8 +8,6 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException
 
-from backend.schemas import SCHEMA_REGISTRY
-
 router = APIRouter(prefix="/api/schemas", tags=["schemas"])
 
 
@@ -20,6 +18,8 @@ async def get_all_schemas() -> dict[str, Any]:
     Returns a dictionary mapping config file types to their JSON schemas,
     including field descriptions, constraints, and examples.
     """
+    from backend.schemas import SCHEMA_REGISTRY  # Built on first request, not at startup
+
     schemas = {}
     for schema_name, schema_class in SCHEMA_REGISTRY.items():
         json_schema = schema_class.model_json_schema()
@@ -46,6 +46,8 @@ async def get_schema(schema_name: str) -> dict[str, Any]:
     Raises:
         HTTPException: If schema_name is not recognized
     """
+    from backend.schemas import SCHEMA_REGISTRY
+
     if schema_name not in SCHEMA_REGISTRY:
         available = ", ".join(SCHEMA_REGISTRY.keys())
         raise HTTPException(
@@ -4,23 +4,36 @@ import os
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
-from backend.comparison import compare_snapshots
 from backend.models import (
     CreateSnapshotRequest,
     PositionUpdate,
     Snapshot,
     SnapshotMetadata,
+    SnapshotTeamCondensed,
     TeamData,
 )
+from backend.routes_jobs import submit_job
+from backend.search import DEFAULT_LIMIT, MAX_LIMIT, search_teams
 from backend.services import (
-    TT_TEAMS_DIR,
     find_all_teams,
     find_team_by_id,
+    get_data_dir,
     update_position_in_file,
 )
-from backend.snapshot_services import create_snapshot, list_snapshots, load_snapshot
+from backend.snapshot_services import (
+    compare_loaded_snapshots,
+    create_snapshot,
+    list_snapshots,
+    live_snapshot,
+    load_snapshot,
+    open_snapshot,
+    snapshot_timeline,
+)
+from backend.sse import validation_stream_response
 from backend.validation import validate_all_config_files, validate_all_team_files
+from backend.validation_rules import DEFAULT_PROFILE, VALIDATOR_PROFILES
 
 router = APIRouter(prefix="/api/tt", tags=["tt-design"])
 
@@ -28,7 +41,7 @@ router = APIRouter(prefix="/api/tt", tags=["tt-design"])
 @router.get("/team-types")
 async def get_team_types():
     """Get team type definitions with colors and descriptions for TT-Design view"""
-    config_file = TT_TEAMS_DIR / "tt-team-types.json"
+    config_file = get_data_dir("tt") / "tt-team-types.json"
 
     if not config_file.exists():
         raise HTTPException(status_code=404, detail="Team types configuration not found")
@@ -78,10 +91,28 @@ async def update_team_position(team_id: str, position: PositionUpdate):
     return {"message": "Position updated", "position": {"x": x, "y": y}}
 
 
+@router.get("/search")
+async def search(q: str, limit: int = DEFAULT_LIMIT) -> dict[str, Any]:
+    """Full-text search over TT-Design teams (name, purpose, description, services, software, members)
+
+    Hits are ranked by relevance (BM25) and include a snippet of the best matching field.
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+    if not 1 <= limit <= MAX_LIMIT:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_LIMIT}")
+    return search_teams("tt", q, limit)
+
+
 @router.get("/validate")
-async def validate_files() -> dict[str, Any]:
-    """Validate all TT-Design team files and config files"""
-    team_validation = validate_all_team_files("tt")
+async def validate_files(profile: str = DEFAULT_PROFILE, timings: bool = False) -> dict[str, Any]:
+    """Validate all TT-Design team files and config files
+
+    Use profile=fast for structural checks only (cheap enough to run on every save),
+    and timings=true to include per-rule call counts and durations.
+    """
+    _check_validation_profile(profile)
+    team_validation = validate_all_team_files("tt", profile=profile, include_timings=timings)
     config_validation = validate_all_config_files("tt")
     return {
         "teams": team_validation,
@@ -90,6 +121,39 @@ async def validate_files() -> dict[str, Any]:
     }
 
 
+@router.post("/validate/jobs", status_code=202)
+async def submit_validation_job(profile: str = DEFAULT_PROFILE, timings: bool = False) -> dict[str, Any]:
+    """Run TT-Design validation as a background job; poll /api/jobs/{job_id} for progress and the report
+
+    The job's result has the same shape as the /validate response.
+    """
+    _check_validation_profile(profile)
+
+    def run(progress) -> dict[str, Any]:
+        return {
+            "teams": validate_all_team_files("tt", profile=profile, include_timings=timings, progress=progress),
+            "config_files": validate_all_config_files("tt"),
+            "team_schema": "tt-team-file"
+        }
+
+    return submit_job("validate-tt", run)
+
+
+@router.get("/validate/stream")
+async def validate_files_stream(profile: str = DEFAULT_PROFILE) -> StreamingResponse:
+    """Stream TT-Design validation results as Server-Sent Events (per-file issues, then a summary)"""
+    _check_validation_profile(profile)
+    return validation_stream_response("tt", "tt-team-file", profile)
+
+
+def _check_validation_profile(profile: str) -> None:
+    if profile not in VALIDATOR_PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown validation profile: {profile} (valid: {', '.join(VALIDATOR_PROFILES)})"
+        )
+
+
 # Snapshot endpoints (TT Design evolution tracking)
 @router.post("/snapshots/create", response_model=Snapshot)
 async def create_new_snapshot(request: CreateSnapshotRequest):
@@ -113,12 +177,52 @@ async def create_new_snapshot(request: CreateSnapshotRequest):
         raise HTTPException(status_code=500, detail=f"Failed to create snapshot: {str(e)}")
 
 
+@router.post("/snapshots/jobs", status_code=202)
+async def submit_snapshot_job(request: CreateSnapshotRequest) -> dict[str, Any]:
+    """Create a snapshot as a background job; poll /api/jobs/{job_id} for its metadata"""
+    if os.getenv("READ_ONLY_MODE") == "true":
+        raise HTTPException(status_code=403, detail="Modifications not allowed in demo mode")
+
+    def run(progress) -> dict[str, Any]:
+        snapshot = create_snapshot(
+            name=request.name,
+            description=request.description or "",
+            author=request.author or "",
+            team_names=request.team_names
+        )
+        return snapshot.model_dump(mode="json", exclude={"teams"})
+
+    return submit_job("snapshot", run)
+
+
 @router.get("/snapshots", response_model=list[SnapshotMetadata])
 async def get_snapshots():
     """List all available TT Design snapshots with metadata"""
     return list_snapshots()
 
 
+@router.get("/snapshots/timeline")
+async def get_snapshot_timeline(ids: str = "all"):
+    """
+    Evolution of the TT Design across several snapshots
+
+    Args:
+        ids: Comma-separated snapshot IDs in timeline order, or "all" (oldest first)
+
+    Returns:
+        Per-snapshot series (statistics and edge counts) and the changes between
+        each consecutive pair of snapshots
+    """
+    snapshot_ids = None if ids == "all" else [i.strip() for i in ids.split(",") if i.strip()]
+    if snapshot_ids is not None and not snapshot_ids:
+        raise HTTPException(status_code=400, detail="No snapshot IDs given")
+
+    try:
+        return snapshot_timeline(snapshot_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get("/snapshots/{snapshot_id}", response_model=Snapshot)
 async def get_snapshot(snapshot_id: str):
     """Load a specific TT Design snapshot by ID"""
@@ -130,6 +234,37 @@ async def get_snapshot(snapshot_id: str):
     return snapshot
 
 
+@router.get("/snapshots/{snapshot_id}/teams/{team_name:path}", response_model=SnapshotTeamCondensed)
+async def get_snapshot_team(snapshot_id: str, team_name: str):
+    """Load a single team from a TT Design snapshot, without loading the whole snapshot"""
+    reader = open_snapshot(snapshot_id)
+
+    if reader is None:
+        raise HTTPException(status_code=404, detail=f"Snapshot not found: {snapshot_id}")
+
+    team = reader.get_team(team_name)
+    if team is None:
+        raise HTTPException(status_code=404, detail=f"Team not found in snapshot: {team_name}")
+
+    return team
+
+
+@router.get("/snapshots/compare/{before_id}/live")
+async def compare_snapshot_with_live(before_id: str):
+    """
+    Compare a TT Design snapshot with the current (unsaved) TT Design
+
+    Same response as comparing two snapshots; the "after" side has id "live".
+    No snapshot is written.
+    """
+    before = load_snapshot(before_id)
+
+    if before is None:
+        raise HTTPException(status_code=404, detail=f"Before snapshot not found: {before_id}")
+
+    return compare_loaded_snapshots(before, live_snapshot())
+
+
 @router.get("/snapshots/compare/{before_id}/{after_id}")
 async def compare_snapshot_versions(before_id: str, after_id: str):
     """
@@ -150,4 +285,4 @@ async def compare_snapshot_versions(before_id: str, after_id: str):
     if after is None:
         raise HTTPException(status_code=404, detail=f"After snapshot not found: {after_id}")
 
-    return compare_snapshots(before, after)
+    return compare_loaded_snapshots(before, after)
@@ -0,0 +1,218 @@
+"""Full-text search over team files (inverted index, BM25 ranking)
+
+One in-memory index per data directory, built on first search and then kept
+up to date incrementally: each search stat-scans the team files and re-indexes
+only those added, changed or removed since the previous search.
+
+Searched fields and their weights (BM25F-style: a term's frequency in each field
+is scaled by the field weight before ranking):
+name, team_api.purpose / purpose, description (the markdown body),
+team_api.services_provided, software_owned and team_members.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from backend.models import TeamData
+from backend.services import get_data_dir, parse_team_file, team_file_stats
+
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "purpose": 2.0,
+    "services_provided": 1.5,
+    "software_owned": 1.5,
+    "team_members": 1.0,
+    "description": 1.0,
+}
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+SNIPPET_CHARS = 160
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_MARKDOWN_RE = re.compile(r"[#*`|>_\[\]]+|-{3,}")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens, with a plural 's' stripped ("payments" finds "payment")."""
+    tokens = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _team_fields(team: TeamData) -> dict[str, str]:
+    api = team.team_api
+    purpose = (api.purpose if api else None) or team.purpose
+    return {
+        "name": team.name,
+        "purpose": purpose or "",
+        "services_provided": "\n".join((api.services_provided if api else None) or []),
+        "software_owned": "\n".join(team.software_owned or []),
+        "team_members": "\n".join(team.team_members or []),
+        "description": _MARKDOWN_RE.sub(" ", team.description or ""),
+    }
+
+
+@dataclass
+class _Document:
+    team_id: str
+    name: str
+    team_type: str | None
+    fields: dict[str, str]
+    term_weights: Counter  # term -> field-weighted frequency
+    length: float  # field-weighted token count
+
+
+class SearchIndex:
+    """Inverted index over the team files of one data directory"""
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+        self._documents: dict[str, _Document] = {}  # relative path -> document
+        self._stats: dict[str, tuple[int, int]] = {}  # relative path -> (mtime_ns, size) indexed
+        self._postings: dict[str, dict[str, float]] = {}  # term -> {path: weighted frequency}
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def sync(self) -> int:
+        """Re-index files added, changed or removed since the last sync; returns how many."""
+        stats = team_file_stats(self.data_dir)
+        with self._lock:
+            removed = self._stats.keys() - stats.keys()
+            changed = [path for path, stat in stats.items() if self._stats.get(path) != stat]
+            for path in [*removed, *changed]:
+                self._remove(path)
+            for path in changed:
+                self._stats[path] = stats[path]
+                try:
+                    team = parse_team_file(self.data_dir / path)
+                except Exception as e:
+                    print(f"Error parsing {Path(path).name}: {e}")
+                    continue  # Retried once the file changes
+                self._add(path, team)
+        return len(removed) + len(changed)
+
+    def _add(self, path: str, team: TeamData) -> None:
+        fields = _team_fields(team)
+        term_weights: Counter = Counter()
+        for field, text in fields.items():
+            for token in tokenize(text):
+                term_weights[token] += FIELD_WEIGHTS[field]
+
+        document = _Document(team.team_id, team.name, team.team_type, fields, term_weights,
+                             sum(term_weights.values()))
+        self._documents[path] = document
+        self._total_length += document.length
+        for term, weight in term_weights.items():
+            self._postings.setdefault(term, {})[path] = weight
+
+    def _remove(self, path: str) -> None:
+        self._stats.pop(path, None)
+        document = self._documents.pop(path, None)
+        if document is None:
+            return
+        self._total_length -= document.length
+        for term in document.term_weights:
+            postings = self._postings[term]
+            del postings[path]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> dict[str, Any]:
+        """Teams ranked by BM25 score for query (any term may match).
+
+        Returns:
+            {query, total (matching teams), hits: [{team_id, name, team_type, score,
+            matched_terms, field, snippet}]} - field/snippet show the best matching field
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            scores: Counter = Counter()
+            document_count = len(self._documents)
+            average_length = self._total_length / document_count if document_count else 0.0
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for path, frequency in postings.items():
+                    length_norm = 1 - BM25_B + BM25_B * self._documents[path].length / average_length
+                    scores[path] += idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+            hits = [self._hit(self._documents[path], score, terms) for path, score in top]
+        return {"query": query, "total": len(scores), "hits": hits}
+
+    @staticmethod
+    def _hit(document: _Document, score: float, terms: list[str]) -> dict[str, Any]:
+        matched = [term for term in terms if term in document.term_weights]
+        field, snippet = _snippet(document.fields, set(matched))
+        return {
+            "team_id": document.team_id,
+            "name": document.name,
+            "team_type": document.team_type,
+            "score": round(score, 4),
+            "matched_terms": matched,
+            "field": field,
+            "snippet": snippet,
+        }
+
+
+def _snippet(fields: dict[str, str], terms: set[str]) -> tuple[str, str]:
+    """The field with the most query term matches (ties: the higher weighted field),
+    and a window of about SNIPPET_CHARS around its first match."""
+    best: tuple[int, str, int] | None = None  # (matches, field, offset of first match)
+    for field, text in fields.items():
+        matches = [m for m in _TOKEN_RE.finditer(text) if tokenize(m.group())[0] in terms]
+        if matches and (best is None or len(matches) > best[0]):
+            best = (len(matches), field, matches[0].start())
+    if best is None:
+        return "name", fields["name"]
+
+    _, field, offset = best
+    text = " ".join(fields[field].split())  # Collapse whitespace and newlines
+    prefix = fields[field][:offset]
+    offset = len(" ".join(prefix.split())) + (1 if prefix.strip() and prefix[-1].isspace() else 0)
+    start = max(0, offset - SNIPPET_CHARS // 3)
+    end = min(len(text), start + SNIPPET_CHARS)
+    if start > 0 and (space := text.find(" ", start, offset)) != -1:
+        start = space + 1  # Don't cut words
+    if end < len(text) and (space := text.rfind(" ", offset, end)) != -1:
+        end = space
+    snippet = text[start:end].strip()
+    return field, ("..." if start > 0 else "") + snippet + ("..." if end < len(text) else "")
+
+
+_INDEXES: dict[str, SearchIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def search_teams(view: str, query: str, limit: int = DEFAULT_LIMIT) -> dict[str, Any]:
+    """Search the team files of a view (see SearchIndex.search)."""
+    data_dir = get_data_dir(view)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(str(data_dir))
+        if index is None:
+            index = _INDEXES[str(data_dir)] = SearchIndex(data_dir)
+    index.sync()
+    return index.search(query, min(limit, MAX_LIMIT))
+
+
+def clear_search_indexes() -> None:
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
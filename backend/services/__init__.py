@@ -4,6 +4,8 @@ This package is split into focused modules:
 - file_ops: File I/O and directory management
 - parsing: Markdown/YAML parsing and data enrichment
 - utils: Helper functions (slug generation, validation)
+- locking: Cross-process file locks and atomic writes (imported directly)
+- team_index: Optional SQLite index of the team files, used by the find functions (imported directly)
 
 For backward compatibility, all public functions are re-exported here.
 """
@@ -11,14 +13,18 @@ For backward compatibility, all public functions are re-exported here.
 # Re-export all public functions from sub-modules for backward compatibility
 from backend.services.file_ops import (
     BASELINE_TEAMS_DIR,
+    DATA_DIR,
     TT_DESIGN_VARIANT,
     TT_TEAMS_DIR,
     check_duplicate_team_ids,
+    ensure_data_dirs,
     find_all_teams,
     find_team_by_id,
     find_team_by_name,
     find_team_by_name_or_slug,
     get_data_dir,
+    get_dataset_version,
+    team_file_stats,
     update_position_in_file,
 )
 from backend.services.parsing import (
@@ -30,6 +36,7 @@ from backend.services.utils import team_name_to_slug, validate_team_id
 
 __all__ = [
     # Directory constants
+    "DATA_DIR",
     "TT_DESIGN_VARIANT",
     "TT_TEAMS_DIR",
     "BASELINE_TEAMS_DIR",
@@ -38,6 +45,9 @@ __all__ = [
     "validate_team_id",
     # File operations
     "get_data_dir",
+    "ensure_data_dirs",
+    "get_dataset_version",
+    "team_file_stats",
     "update_position_in_file",
     "find_all_teams",
     "find_team_by_name",
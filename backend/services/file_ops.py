@@ -1,22 +1,28 @@
 """File operations and directory management for team data."""
+import hashlib
 import os
+import tempfile
 from pathlib import Path
 
-import yaml
-
 from backend.constants import SKIP_FILES
 from backend.models import TeamData
+from backend.services.locking import atomic_write_text, file_lock
 
 # Data directories
+# DATA_DIR environment variable sets the root of all team data (default: "data"),
+# e.g. a dataset written by `python -m backend.dataset_generator`.
 # TT_DESIGN_VARIANT environment variable allows switching between TT design variants:
 # - "tt-teams" (default) - Mid-stage transformation with multiple platforms and value streams
 # - "tt-teams-initial" - Simplified first-step transformation (3-6 months)
 # - Or use custom folder names for your own design variants (e.g., "tt-design-proposal-a")
+DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
 TT_DESIGN_VARIANT = os.getenv("TT_DESIGN_VARIANT", "tt-teams")
-TT_TEAMS_DIR = Path(f"data/{TT_DESIGN_VARIANT}")
-BASELINE_TEAMS_DIR = Path("data/baseline-teams")
-TT_TEAMS_DIR.mkdir(parents=True, exist_ok=True)
-BASELINE_TEAMS_DIR.mkdir(parents=True, exist_ok=True)
+TT_TEAMS_DIR = DATA_DIR / TT_DESIGN_VARIANT
+BASELINE_TEAMS_DIR = DATA_DIR / "baseline-teams"
+
+# Lock files for team file writes live outside the data directory (which is often
+# under version control). All server workers must share it: the default is per host.
+TEAM_LOCK_DIR = Path(os.getenv("TEAM_LOCK_DIR", Path(tempfile.gettempdir()) / "tt-team-locks"))
 
 
 def get_data_dir(view: str = "tt") -> Path:
@@ -24,6 +30,72 @@ def get_data_dir(view: str = "tt") -> Path:
     return TT_TEAMS_DIR if view == "tt" else BASELINE_TEAMS_DIR
 
 
+def ensure_data_dirs() -> list[Path]:
+    """Create the team directories if missing (at app startup, not on import)."""
+    directories = [TT_TEAMS_DIR, BASELINE_TEAMS_DIR]
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+    return directories
+
+
+def team_file_stats(data_dir: Path) -> dict[str, tuple[int, int]]:
+    """(mtime_ns, size) of each team file, by path relative to data_dir (no contents read).
+
+    Lets indexes of the team files find the files added, changed or removed
+    since they were built.
+    """
+    stats = {}
+    for file_path in data_dir.rglob("*.md"):
+        if file_path.name in SKIP_FILES:
+            continue
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue  # Deleted while scanning
+        stats[file_path.relative_to(data_dir).as_posix()] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def get_dataset_version(view: str = "tt") -> str:
+    """Fingerprint of a view's team files from their stat data (no file contents read).
+
+    Changes whenever a team file is added, removed, renamed or modified, so it
+    can key caches of anything derived from the parsed teams.
+    """
+    digest = hashlib.sha256()
+    for path, (mtime_ns, size) in sorted(team_file_stats(get_data_dir(view)).items()):
+        digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode())
+    return digest.hexdigest()
+
+
+def team_file_lock_path(file_path: Path) -> Path:
+    """Lock file guarding writes to a team file (one per resolved file path)."""
+    key = hashlib.sha256(str(file_path.resolve()).encode()).hexdigest()[:32]
+    return TEAM_LOCK_DIR / f"{key}.lock"
+
+
+_INDEX_UNAVAILABLE = object()
+
+
+def _index_enabled() -> bool:
+    """team_index.index_enabled(), without importing sqlite3 while the index is off."""
+    return bool(os.getenv("TEAM_INDEX_DB"))
+
+
+def _query_index(query: str, data_dir: Path, *args):
+    """Run a team_index query, or return _INDEX_UNAVAILABLE if the database fails
+    (callers then scan the files, which are the source of truth anyway)."""
+    import sqlite3
+
+    from backend.services import team_index
+
+    try:
+        return getattr(team_index, query)(data_dir, *args)
+    except sqlite3.Error as e:
+        print(f"Warning: Team index query failed, reading files instead: {e}")
+        return _INDEX_UNAVAILABLE
+
+
 def read_team_file(file_path: Path) -> tuple[dict, str]:
     """Read team file and split YAML front matter from markdown content.
 
@@ -43,6 +115,8 @@ def read_team_file(file_path: Path) -> tuple[dict, str]:
     if len(parts) < 3:
         raise ValueError(f"Missing team_id in {file_path.name}. All teams must have a unique team_id.")
 
+    import yaml  # Deferred: not needed until the first team file is read
+
     yaml_content = parts[1]
     markdown_content = parts[2].strip()
     data = yaml.safe_load(yaml_content) or {}
@@ -54,39 +128,40 @@ def update_position_in_file(file_path: Path, x: int, y: int) -> None:
     """Update ONLY the position field in a team file's YAML frontmatter.
 
     This does a surgical update without re-serializing the entire file,
-    preserving all other content exactly as-is.
+    preserving all other content exactly as-is. The read-modify-write holds the
+    file's lock (so concurrent updates from several workers apply one after the
+    other) and the file is replaced atomically.
 
     Args:
         file_path: Path to the team markdown file
         x: New x coordinate
         y: New y coordinate
     """
-    with open(file_path, encoding='utf-8') as f:
-        content = f.read()
+    import yaml
 
-    if not content.startswith('---'):
-        raise ValueError(f"Invalid file format: {file_path.name}")
+    with file_lock(team_file_lock_path(file_path), "team_files"):
+        with open(file_path, encoding='utf-8') as f:
+            content = f.read()
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        raise ValueError(f"Invalid YAML frontmatter: {file_path.name}")
+        if not content.startswith('---'):
+            raise ValueError(f"Invalid file format: {file_path.name}")
 
-    yaml_content = parts[1]
-    markdown_content = parts[2]
+        parts = content.split('---', 2)
+        if len(parts) < 3:
+            raise ValueError(f"Invalid YAML frontmatter: {file_path.name}")
 
-    # Parse YAML to update position
-    data = yaml.safe_load(yaml_content) or {}
-    data['position'] = {'x': x, 'y': y}
+        yaml_content = parts[1]
+        markdown_content = parts[2]
 
-    # Re-serialize ONLY the YAML frontmatter (not the entire file)
-    new_yaml = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        # Parse YAML to update position
+        data = yaml.safe_load(yaml_content) or {}
+        data['position'] = {'x': x, 'y': y}
 
-    # Write back with updated YAML but original markdown content
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write('---\n')
-        f.write(new_yaml)
-        f.write('---')
-        f.write(markdown_content)
+        # Re-serialize ONLY the YAML frontmatter (not the entire file)
+        new_yaml = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+        # Write back with updated YAML but original markdown content
+        atomic_write_text(file_path, f"---\n{new_yaml}---{markdown_content}")
 
 
 def find_all_teams(view: str = "tt") -> list[TeamData]:
@@ -101,6 +176,11 @@ def find_all_teams(view: str = "tt") -> list[TeamData]:
     from backend.services.parsing import parse_team_file  # Avoid circular import
 
     data_dir = get_data_dir(view)
+    if _index_enabled():
+        indexed = _query_index("indexed_teams", data_dir)
+        if indexed is not _INDEX_UNAVAILABLE:
+            return indexed
+
     teams = []
 
     for file_path in data_dir.rglob("*.md"):
@@ -133,6 +213,10 @@ def find_team_by_name(team_name: str, view: str = "tt") -> tuple[TeamData, Path]
     from backend.services.parsing import parse_team_file  # Avoid circular import
 
     data_dir = get_data_dir(view)
+    if _index_enabled():
+        indexed = _query_index("indexed_team_by_name", data_dir, team_name)
+        if indexed is not _INDEX_UNAVAILABLE:
+            return indexed
 
     for file_path in data_dir.rglob("*.md"):
         if file_path.name in SKIP_FILES:
@@ -162,6 +246,10 @@ def find_team_by_id(team_id: str, view: str = "tt") -> tuple[TeamData, Path] | N
     from backend.services.utils import team_name_to_slug  # Avoid circular import
 
     data_dir = get_data_dir(view)
+    if _index_enabled():
+        indexed = _query_index("indexed_team_by_id", data_dir, team_id)
+        if indexed is not _INDEX_UNAVAILABLE:
+            return indexed
 
     for file_path in data_dir.rglob("*.md"):
         if file_path.name in SKIP_FILES:
@@ -0,0 +1,120 @@
+"""Cross-process file locking and atomic file writes.
+
+Several uvicorn workers (or CLI runs) may write the same data directory, so
+writers serialize on an advisory lock file and replace files atomically:
+readers see either the old or the new file, never a partial one, even if the
+writer crashes.
+"""
+import os
+import stat
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: no fcntl; local single-process use needs no lock
+    fcntl = None
+
+# Contention counters per lock category (see lock_stats)
+_LOCK_STATS: dict[str, dict[str, float]] = {}
+_LOCK_STATS_LOCK = threading.Lock()
+
+
+@contextmanager
+def file_lock(lock_path: Path, category: str = "other") -> Iterator[None]:
+    """Hold an exclusive advisory lock on lock_path (created if missing).
+
+    Blocks until the lock is free. Locks are per open file, so they also
+    serialize threads of one process. On platforms without fcntl this is a no-op.
+    Acquisitions and waits are counted under category (see lock_stats).
+    """
+    if fcntl is None:
+        yield
+        return
+
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a') as lock_file:
+        waited = None
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            start = time.perf_counter()
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            waited = time.perf_counter() - start
+        _record_acquisition(category, waited)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _record_acquisition(category: str, waited: float | None) -> None:
+    with _LOCK_STATS_LOCK:
+        stats = _LOCK_STATS.setdefault(
+            category, {"acquired": 0, "contended": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+        )
+        stats["acquired"] += 1
+        if waited is not None:
+            stats["contended"] += 1
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+
+
+def lock_stats() -> dict[str, dict[str, float]]:
+    """Lock counters of this process per category: acquired, contended (had to wait),
+    wait_seconds (total) and max_wait_seconds"""
+    with _LOCK_STATS_LOCK:
+        return {category: dict(stats) for category, stats in _LOCK_STATS.items()}
+
+
+def reset_lock_stats() -> None:
+    with _LOCK_STATS_LOCK:
+        _LOCK_STATS.clear()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file atomically: temp file in the same directory, fsync, rename over.
+
+    A symlink is followed, so its target is replaced rather than the link. An
+    existing file keeps its permission bits; new files are created 0644.
+    """
+    path = path.resolve()
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)  # mkstemp creates 0600
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """atomic_write_bytes for UTF-8 text."""
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory (best effort; unsupported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
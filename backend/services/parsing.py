@@ -3,6 +3,7 @@ import re
 from pathlib import Path
 
 from backend.constants import FlowMetrics, InteractionModes, MarkdownSections
+from backend.metrics import FILES_PARSED, PARSE_ERRORS
 from backend.models import TeamData
 from backend.services.file_ops import read_team_file
 from backend.services.utils import validate_team_id
@@ -20,6 +21,15 @@ def parse_team_file(file_path: Path) -> TeamData:
     Returns:
         TeamData object with all parsed fields
     """
+    FILES_PARSED.inc()
+    try:
+        return _parse_team_file(file_path)
+    except Exception:
+        PARSE_ERRORS.inc()
+        raise
+
+
+def _parse_team_file(file_path: Path) -> TeamData:
     # Read file and split YAML from markdown
     data, markdown_content = read_team_file(file_path)
 
@@ -0,0 +1,177 @@
+"""Optional SQLite index mirroring the team markdown files.
+
+Enabled by setting TEAM_INDEX_DB to a database path. The markdown files stay the
+source of truth: before each query the data directory is stat-scanned and only
+files that were added, changed (mtime/size) or removed since the last sync are
+re-parsed into the index. The database uses WAL mode, so all server worker
+processes can share one index file - readers don't block each other or a writer.
+
+Table (rows are per data directory, `root`, so views and variants share a database):
+- teams: one row per team file - identity (team_id, name, slug) and the parsed TeamData
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from backend.models import TeamData
+
+SCHEMA_VERSION = 1
+BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    root TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    team_id TEXT,
+    name TEXT,
+    slug TEXT,
+    data TEXT,  -- TeamData JSON, NULL if the file failed to parse
+    PRIMARY KEY (root, path)
+);
+CREATE INDEX IF NOT EXISTS teams_team_id ON teams (root, team_id);
+CREATE INDEX IF NOT EXISTS teams_slug ON teams (root, slug);
+CREATE INDEX IF NOT EXISTS teams_name ON teams (root, name);
+"""
+
+_local = threading.local()  # sqlite3 connections can't be shared between threads
+# Last synced stat signature per (database, root), to skip re-diffing unchanged directories
+_synced: dict[tuple[str, str], frozenset[tuple[str, int, int]]] = {}
+_synced_lock = threading.Lock()
+
+
+def index_path() -> Path | None:
+    """Database path from TEAM_INDEX_DB, or None if the index is disabled."""
+    value = os.getenv("TEAM_INDEX_DB")
+    return Path(value) if value else None
+
+
+def index_enabled() -> bool:
+    return index_path() is not None
+
+
+def _connect() -> sqlite3.Connection:
+    db_path = index_path()
+    if db_path is None:
+        raise RuntimeError("Team index is disabled (TEAM_INDEX_DB is not set)")
+
+    connections = getattr(_local, "connections", None)
+    if connections is None:
+        connections = _local.connections = {}
+    connection = connections.get(str(db_path))
+    if connection is None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            connection.executescript(
+                "BEGIN IMMEDIATE; DROP TABLE IF EXISTS teams;"
+                f"{_SCHEMA} PRAGMA user_version={SCHEMA_VERSION}; COMMIT;"
+            )
+        connections[str(db_path)] = connection
+    return connection
+
+
+def close_connections() -> None:
+    """Close this thread's index connections (e.g. before deleting the database)."""
+    for connection in getattr(_local, "connections", {}).values():
+        connection.close()
+    _local.connections = {}
+    with _synced_lock:
+        _synced.clear()
+
+
+def _team_row(team: TeamData) -> dict[str, Any]:
+    from backend.services.utils import team_name_to_slug  # Avoid circular import
+
+    return {
+        "team_id": team.team_id,
+        "name": team.name,
+        "slug": team_name_to_slug(team.name),
+        "data": team.model_dump_json(),
+    }
+
+
+def sync(data_dir: Path) -> int:
+    """Bring the index for data_dir up to date with the files on disk.
+
+    Returns:
+        Number of files (re)indexed or removed
+    """
+    from backend.services.file_ops import team_file_stats  # Avoid circular import
+    from backend.services.parsing import parse_team_file  # Avoid circular import
+
+    root = str(data_dir.resolve())
+    files = team_file_stats(data_dir)
+    signature = frozenset((path, *stat) for path, stat in files.items())
+    sync_key = (str(index_path()), root)
+    with _synced_lock:
+        if _synced.get(sync_key) == signature:
+            return 0
+
+    connection = _connect()
+    connection.execute("BEGIN IMMEDIATE")  # One writer at a time across processes
+    try:
+        indexed = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in connection.execute(
+                "SELECT path, mtime_ns, size FROM teams WHERE root = ?", (root,)
+            )
+        }
+        removed = indexed.keys() - files.keys()
+        changed = [path for path, stat in files.items() if indexed.get(path) != stat]
+
+        for path in [*removed, *changed]:
+            connection.execute("DELETE FROM teams WHERE root = ? AND path = ?", (root, path))
+
+        for path in changed:
+            mtime_ns, size = files[path]
+            row: dict[str, Any] = dict.fromkeys(("team_id", "name", "slug", "data"))
+            try:
+                row = _team_row(parse_team_file(data_dir / path))
+            except Exception as e:
+                print(f"Error parsing {Path(path).name}: {e}")
+            connection.execute(
+                "INSERT INTO teams (root, path, mtime_ns, size, team_id, name, slug, data)"
+                " VALUES (:root, :path, :mtime_ns, :size, :team_id, :name, :slug, :data)",
+                {"root": root, "path": path, "mtime_ns": mtime_ns, "size": size, **row},
+            )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+    with _synced_lock:
+        _synced[sync_key] = signature
+    return len(removed) + len(changed)
+
+
+def _select_teams(data_dir: Path, where: str = "", params: tuple = ()) -> list[tuple[TeamData, Path]]:
+    sync(data_dir)
+    rows = _connect().execute(
+        f"SELECT path, data FROM teams WHERE root = ? AND data IS NOT NULL {where} ORDER BY path",
+        (str(data_dir.resolve()), *params),
+    )
+    return [(TeamData.model_validate_json(data), data_dir / path) for path, data in rows]
+
+
+def indexed_teams(data_dir: Path) -> list[TeamData]:
+    """All teams in data_dir, sorted by team_id (same as find_all_teams)."""
+    return sorted((team for team, _ in _select_teams(data_dir)), key=lambda t: t.team_id)
+
+
+def indexed_team_by_name(data_dir: Path, team_name: str) -> tuple[TeamData, Path] | None:
+    matches = _select_teams(data_dir, "AND name = ?", (team_name,))
+    return matches[0] if matches else None
+
+
+def indexed_team_by_id(data_dir: Path, team_id: str) -> tuple[TeamData, Path] | None:
+    """Team whose team_id or name slug is team_id (team_id matches take precedence)."""
+    matches = _select_teams(data_dir, "AND (team_id = ? OR slug = ?)", (team_id, team_id))
+    matches.sort(key=lambda match: match[0].team_id != team_id)
+    return matches[0] if matches else None
+
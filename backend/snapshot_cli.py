@@ -0,0 +1,52 @@
+"""Command-line maintenance of the snapshot store.
+
+Snapshots are deleted by removing their files (the app has no delete endpoint),
+which leaves the team objects only they referenced in objects.db. `gc` removes
+those objects and compacts the database:
+
+    python -m backend.snapshot_services gc
+    python -m backend.snapshot_services gc --snapshots-dir /srv/org-data/tt-snapshots
+
+It takes the snapshots lock, so it is safe to run while the server is creating
+snapshots. Nothing is deleted if any snapshot file can't be read (a warning says so).
+
+Exit codes: 0 = done, 2 = usage error.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from backend import snapshot_services
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.snapshot_services",
+        description="Maintain the snapshot store.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    gc = commands.add_parser("gc", help="Delete team objects no snapshot refers to")
+    gc.add_argument(
+        "--snapshots-dir", type=Path, default=None,
+        help="Snapshot directory (default: tt-snapshots in DATA_DIR)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    snapshots_dir = args.snapshots_dir or snapshot_services.SNAPSHOTS_DIR
+    if not snapshots_dir.is_dir():
+        print(f"Not a directory: {snapshots_dir}", file=sys.stderr)
+        return 2
+
+    saved = snapshot_services.SNAPSHOTS_DIR
+    snapshot_services.SNAPSHOTS_DIR = snapshots_dir
+    try:
+        deleted = snapshot_services.collect_unreferenced_objects()
+    finally:
+        snapshot_services.SNAPSHOTS_DIR = saved
+
+    print(f"Deleted {deleted} unreferenced team object(s) from {snapshots_dir}")
+    return 0
@@ -1,8 +1,29 @@
-"""Service layer for snapshot operations"""
+"""Service layer for snapshot operations
+
+Storage layout (under SNAPSHOTS_DIR):
+- <snapshot_id>.json: snapshot metadata plus `team_refs`, the content hashes of its
+  teams, and `team_names`, their names in the same order (for lookups by name)
+- objects.db: each distinct condensed team, stored once (SQLite table of content hash ->
+  zlib-compressed JSON; many small objects share a database page instead of a file each)
+- index.json: manifest of snapshot metadata (see list_snapshots)
+
+Snapshots written before content-addressed storage embed their teams directly
+(`teams`) and are still read transparently.
+"""
+import hashlib
 import json
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import pairwise
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from backend.comparison import compare_snapshots
+from backend.metrics import SNAPSHOT_IO_BYTES, record_cache
 from backend.models import (
     Snapshot,
     SnapshotMetadata,
@@ -10,11 +31,50 @@ from backend.models import (
     SnapshotTeamCondensed,
     TeamData,
 )
-from backend.services import find_all_teams
+from backend.services import DATA_DIR, find_all_teams, get_dataset_version
+from backend.services.locking import atomic_write_text, file_lock
+
+if TYPE_CHECKING:
+    import sqlite3
 
 # Snapshots directory
-SNAPSHOTS_DIR = Path("data/tt-snapshots")
-SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+SNAPSHOTS_DIR = DATA_DIR / "tt-snapshots"
+
+# Writers (several uvicorn workers, CLI runs) serialize on this lock file; all files
+# are written atomically (temp file + fsync + rename), so a crash leaves no partial file
+LOCK_FILE = ".lock"
+
+# Manifest of snapshot metadata, so listing doesn't have to load every snapshot.
+# Derived data: rebuilt automatically when missing, corrupt or out of date.
+MANIFEST_FILE = "index.json"
+MANIFEST_VERSION = 1
+
+# Content-addressed team objects, shared by all snapshots
+OBJECT_STORE_FILE = "objects.db"
+_OBJECTS_SCHEMA = "CREATE TABLE IF NOT EXISTS objects (hash TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+OBJECT_BATCH_SIZE = 500  # Hashes per query (SQLite limits the number of parameters)
+OBJECT_STORE_TIMEOUT_SECONDS = 5.0
+SNAPSHOT_FORMAT = 2  # 1 (implicit) = teams embedded in the snapshot file
+
+# Snapshots are immutable once written, so parsed snapshots and comparisons are kept
+# in small LRU caches. Loaded snapshots are keyed by file path and validated against
+# the file's (mtime_ns, size); comparisons are valid while both cached snapshots are.
+SNAPSHOT_CACHE_SIZE = 32
+COMPARISON_CACHE_SIZE = 64
+_SNAPSHOT_CACHE: OrderedDict[str, tuple[tuple[int, int], Snapshot]] = OrderedDict()
+_COMPARISON_CACHE: OrderedDict[tuple[str, str], tuple[Snapshot, Snapshot, dict[str, Any]]] = OrderedDict()
+
+# Timeline caches are keyed by file version, (snapshot_id, mtime_ns, size), so they
+# stay valid after the snapshots themselves drop out of _SNAPSHOT_CACHE
+TIMELINE_CACHE_SIZE = 512
+SnapshotVersion = tuple[str, int, int]
+_TIMELINE_STEP_CACHE: OrderedDict[tuple[SnapshotVersion, SnapshotVersion], dict[str, Any]] = OrderedDict()
+_EDGE_COUNT_CACHE: OrderedDict[SnapshotVersion, dict[str, int]] = OrderedDict()
+
+# Condensed live TT design, as an unsaved snapshot: (dataset version, snapshot)
+LIVE_SNAPSHOT_ID = "live"
+_LIVE_SNAPSHOT: tuple[str, Snapshot] | None = None
+_CACHE_LOCK = threading.Lock()
 
 
 def condense_team_for_snapshot(team: TeamData) -> SnapshotTeamCondensed:
@@ -102,6 +162,26 @@ def generate_snapshot_id(name: str, created_at: datetime) -> str:
     return f"{safe_name}-{timestamp}"
 
 
+def ensure_snapshots_dir() -> Path:
+    """Create SNAPSHOTS_DIR if missing (at app startup; writes also create it via the lock)."""
+    SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    return SNAPSHOTS_DIR
+
+
+def _lock_path() -> Path:
+    return SNAPSHOTS_DIR / LOCK_FILE
+
+
+def _unique_snapshot_id(snapshot_id: str) -> str:
+    """snapshot_id, or snapshot_id-2, -3, ... if taken (ids are per second). Call under the lock."""
+    candidate = snapshot_id
+    suffix = 2
+    while (SNAPSHOTS_DIR / f"{candidate}.json").exists():
+        candidate = f"{snapshot_id}-{suffix}"
+        suffix += 1
+    return candidate
+
+
 def create_snapshot(name: str, description: str = "", author: str = "", team_names: list[str] | None = None) -> Snapshot:
     """Create a new snapshot of current TT design state
 
@@ -121,9 +201,7 @@ def create_snapshot(name: str, description: str = "", author: str = "", team_nam
     else:
         teams = all_teams
 
-    # Create snapshot metadata
     created_at = datetime.now()
-    snapshot_id = generate_snapshot_id(name, created_at)
 
     # Condense teams
     condensed_teams = [condense_team_for_snapshot(team) for team in teams]
@@ -131,69 +209,535 @@ def create_snapshot(name: str, description: str = "", author: str = "", team_nam
     # Calculate statistics
     statistics = calculate_statistics(teams)
 
-    # Create snapshot object
-    snapshot = Snapshot(
-        snapshot_id=snapshot_id,
-        name=name,
-        description=description,
-        author=author,
-        created_at=created_at,
-        teams=condensed_teams,
-        statistics=statistics
+    # Under the lock: no other writer can take the same id, and object cleanup
+    # can't delete objects before the snapshot file referencing them exists
+    with file_lock(_lock_path(), "snapshots"):
+        snapshot_id = _unique_snapshot_id(generate_snapshot_id(name, created_at))
+
+        # Create snapshot object
+        snapshot = Snapshot(
+            snapshot_id=snapshot_id,
+            name=name,
+            description=description,
+            author=author,
+            created_at=created_at,
+            teams=condensed_teams,
+            statistics=statistics
+        )
+
+        # Save teams as shared objects, and the snapshot itself as metadata + team hashes
+        team_refs = _write_objects([team.model_dump(mode='json') for team in condensed_teams])
+        snapshot_data = snapshot.model_dump(mode='json', exclude={"teams"})
+        snapshot_data.update(
+            format=SNAPSHOT_FORMAT,
+            team_names=[team.name for team in condensed_teams],
+            team_refs=team_refs,
+        )
+
+        snapshot_file = SNAPSHOTS_DIR / f"{snapshot_id}.json"
+        snapshot_json = json.dumps(snapshot_data, default=str)
+        atomic_write_text(snapshot_file, snapshot_json)
+        SNAPSHOT_IO_BYTES.inc(len(snapshot_json.encode('utf-8')), direction="write")
+
+        # Record it in the manifest (listing would pick it up anyway, but without re-reading it)
+        manifest = _load_manifest()
+        manifest[snapshot_file.name] = _manifest_entry(snapshot_file, _snapshot_metadata(snapshot))
+        _save_manifest(manifest)
+
+    return snapshot
+
+
+def _snapshot_metadata(snapshot: Snapshot) -> SnapshotMetadata:
+    return SnapshotMetadata(
+        snapshot_id=snapshot.snapshot_id,
+        name=snapshot.name,
+        description=snapshot.description,
+        author=snapshot.author,
+        created_at=snapshot.created_at,
+        statistics=snapshot.statistics,
     )
 
-    # Save to file
-    snapshot_file = SNAPSHOTS_DIR / f"{snapshot_id}.json"
-    with open(snapshot_file, 'w', encoding='utf-8') as f:
-        json.dump(snapshot.model_dump(mode='json'), f, indent=2, default=str)
 
-    return snapshot
+def _object_store_path() -> Path:
+    return SNAPSHOTS_DIR / OBJECT_STORE_FILE
 
 
-def list_snapshots() -> list[SnapshotMetadata]:
-    """List all available snapshots with metadata"""
-    snapshots = []
+@contextmanager
+def _object_store(write: bool = False) -> Iterator["sqlite3.Connection"]:
+    """Open the object store; read-only unless writing (which creates it if missing)."""
+    import sqlite3  # The object store is only touched by snapshot writes and reads
+
+    path = _object_store_path()
+    if write:
+        connection = sqlite3.connect(path, timeout=OBJECT_STORE_TIMEOUT_SECONDS, isolation_level=None)
+        connection.execute(_OBJECTS_SCHEMA)
+    else:
+        # Read-only, so snapshots can be read from a read-only directory
+        connection = sqlite3.connect(
+            f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=OBJECT_STORE_TIMEOUT_SECONDS
+        )
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+def _write_objects(objects: list[dict[str, Any]]) -> list[str]:
+    """Store JSON objects by content hash (each once) and return their hashes. Call under the lock."""
+    payloads = [
+        json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        for data in objects
+    ]
+    hashes = [hashlib.sha256(payload).hexdigest() for payload in payloads]
 
+    with _object_store(write=True) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            stored = set()  # Already stored by an earlier snapshot
+            unique = list(set(hashes))
+            for start in range(0, len(unique), OBJECT_BATCH_SIZE):
+                batch = unique[start:start + OBJECT_BATCH_SIZE]
+                stored.update(row[0] for row in connection.execute(
+                    f"SELECT hash FROM objects WHERE hash IN ({','.join('?' * len(batch))})", batch
+                ))
+            new = {}
+            for content_hash, payload in zip(hashes, payloads, strict=True):
+                if content_hash not in stored and content_hash not in new:
+                    new[content_hash] = zlib.compress(payload, 6)
+            connection.executemany("INSERT INTO objects (hash, data) VALUES (?, ?)", new.items())
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    SNAPSHOT_IO_BYTES.inc(sum(len(data) for data in new.values()), direction="write")
+    return hashes
+
+
+def _read_object(content_hash: str) -> dict[str, Any]:
+    return next(_read_objects([content_hash]))
+
+
+def _read_objects(content_hashes: list[str]) -> Iterator[dict[str, Any]]:
+    """Yield the objects for content_hashes, in order, reading them in batches.
+
+    Raises:
+        KeyError: If an object is missing from the store
+    """
+    with _object_store() as connection:
+        for start in range(0, len(content_hashes), OBJECT_BATCH_SIZE):
+            batch = content_hashes[start:start + OBJECT_BATCH_SIZE]
+            unique = list(set(batch))
+            rows = dict(connection.execute(
+                f"SELECT hash, data FROM objects WHERE hash IN ({','.join('?' * len(unique))})", unique
+            ))
+            for content_hash in batch:
+                compressed = rows[content_hash]
+                SNAPSHOT_IO_BYTES.inc(len(compressed), direction="read")
+                yield json.loads(zlib.decompress(compressed))
+
+
+def _referenced_objects() -> set[str] | None:
+    """Hashes referenced by any snapshot file (None if a snapshot file can't be read)."""
+    referenced = set()
     for snapshot_file in SNAPSHOTS_DIR.glob("*.json"):
+        if snapshot_file.name == MANIFEST_FILE:
+            continue
         try:
             with open(snapshot_file, encoding='utf-8') as f:
                 data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if isinstance(data, dict):
+            referenced.update(data.get("team_refs") or [])
+    return referenced
+
+
+def collect_unreferenced_objects() -> int:
+    """Delete team objects no snapshot refers to (e.g. after deleting snapshots).
+
+    Does nothing if any snapshot file is unreadable, since its references are unknown.
 
-            # Extract metadata only
-            metadata = SnapshotMetadata(
-                snapshot_id=data["snapshot_id"],
-                name=data["name"],
-                description=data.get("description", ""),
-                author=data.get("author", ""),
-                created_at=datetime.fromisoformat(data["created_at"]),
-                statistics=SnapshotStatistics(**data["statistics"])
-            )
-            snapshots.append(metadata)
-        except Exception as e:
-            print(f"Warning: Could not load snapshot {snapshot_file}: {e}")
+    Returns:
+        Number of objects deleted
+    """
+    with file_lock(_lock_path(), "snapshots"):  # Objects of a snapshot being created aren't referenced yet
+        referenced = _referenced_objects()
+        if referenced is None:
+            print("Warning: Skipping snapshot object cleanup, a snapshot file could not be read")
+            return 0
+        if not _object_store_path().exists():
+            return 0
+
+        with _object_store(write=True) as connection:
+            unreferenced = [
+                (content_hash,) for (content_hash,) in connection.execute("SELECT hash FROM objects")
+                if content_hash not in referenced
+            ]
+            if unreferenced:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.executemany("DELETE FROM objects WHERE hash = ?", unreferenced)
+                connection.execute("COMMIT")
+                connection.execute("VACUUM")  # Give the freed pages back to the file system
+        return len(unreferenced)
+
+
+def _manifest_path() -> Path:
+    return SNAPSHOTS_DIR / MANIFEST_FILE
+
+
+def _manifest_entry(snapshot_file: Path, metadata: SnapshotMetadata | None) -> dict[str, Any]:
+    """Manifest entry for a snapshot file: its stat signature plus metadata (None if unreadable)."""
+    stat = snapshot_file.stat()
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "metadata": metadata.model_dump(mode='json') if metadata else None,
+    }
+
+
+def _load_manifest() -> dict[str, dict[str, Any]]:
+    """Load the manifest (file name -> entry); empty if missing, corrupt or outdated."""
+    try:
+        with open(_manifest_path(), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("snapshots", {})
+
+
+def _save_manifest(entries: dict[str, dict[str, Any]]) -> None:
+    """Write the manifest atomically, so readers never see half a file."""
+    path = _manifest_path()
+    try:
+        atomic_write_text(path, json.dumps({"version": MANIFEST_VERSION, "snapshots": entries}))
+    except OSError as e:
+        # The manifest is only an accelerator; listing still works without it
+        print(f"Warning: Could not write snapshot manifest {path}: {e}")
+
+
+def _read_snapshot_metadata(snapshot_file: Path) -> SnapshotMetadata:
+    """Read metadata from a snapshot file (team data is not loaded)."""
+    return SnapshotReader(snapshot_file.stem, snapshot_file).metadata
+
+
+def list_snapshots() -> list[SnapshotMetadata]:
+    """List all available snapshots with metadata
+
+    Metadata comes from the manifest; only snapshot files that are new or changed
+    since it was written (by stat signature) are read, and the manifest is updated.
+    """
+    manifest = _load_manifest()
+    entries = {}
+    snapshots = []
+
+    for snapshot_file in SNAPSHOTS_DIR.glob("*.json"):
+        if snapshot_file.name == MANIFEST_FILE:
             continue
 
+        try:
+            stat = snapshot_file.stat()
+        except OSError:
+            continue  # Deleted while listing
+
+        entry = manifest.get(snapshot_file.name)
+        if not entry or entry.get("mtime_ns") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            try:
+                metadata = _read_snapshot_metadata(snapshot_file)
+            except Exception as e:
+                print(f"Warning: Could not load snapshot {snapshot_file}: {e}")
+                metadata = None
+            entry = _manifest_entry(snapshot_file, metadata)
+
+        entries[snapshot_file.name] = entry
+        if entry["metadata"] is not None:
+            snapshots.append(SnapshotMetadata(**entry["metadata"]))
+
+    if entries != manifest:
+        # Best effort: listing is a read path and must work on a read-only directory
+        try:
+            with file_lock(_lock_path(), "snapshots"):
+                _save_manifest(entries)
+        except OSError as e:
+            print(f"Warning: Could not update snapshot manifest: {e}")
+
     # Sort by creation date (newest first)
     snapshots.sort(key=lambda s: s.created_at, reverse=True)
 
     return snapshots
 
 
+def clear_snapshot_caches() -> None:
+    """Forget all cached snapshots, comparisons and timeline steps."""
+    with _CACHE_LOCK:
+        _SNAPSHOT_CACHE.clear()
+        _COMPARISON_CACHE.clear()
+        _TIMELINE_STEP_CACHE.clear()
+        _EDGE_COUNT_CACHE.clear()
+    global _LIVE_SNAPSHOT
+    _LIVE_SNAPSHOT = None
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+    with _CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
 def load_snapshot(snapshot_id: str) -> Snapshot | None:
-    """Load a specific snapshot by ID"""
+    """Load a specific snapshot by ID
+
+    Parsed snapshots are cached until their file changes; the returned object
+    is shared between callers and must be treated as read-only.
+    """
     snapshot_file = SNAPSHOTS_DIR / f"{snapshot_id}.json"
 
-    if not snapshot_file.exists():
+    try:
+        stat = snapshot_file.stat()
+    except OSError:
         return None
 
-    try:
-        with open(snapshot_file, encoding='utf-8') as f:
-            data = json.load(f)
+    cache_key = str(snapshot_file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache_get(_SNAPSHOT_CACHE, cache_key)
+    record_cache("snapshot", cached is not None and cached[0] == signature)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    snapshot = _read_snapshot(snapshot_id, snapshot_file)
+    if snapshot is not None:
+        _cache_put(_SNAPSHOT_CACHE, cache_key, (signature, snapshot), SNAPSHOT_CACHE_SIZE)
+    return snapshot
 
-        # Parse datetime string
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
 
-        return Snapshot(**data)
+def _read_snapshot(snapshot_id: str, snapshot_file: Path) -> Snapshot | None:
+    try:
+        reader = SnapshotReader(snapshot_id, snapshot_file)
+        return Snapshot(**reader.metadata.model_dump(), teams=list(reader.iter_teams()))
     except Exception as e:
         print(f"Error loading snapshot {snapshot_id}: {e}")
         return None
+
+
+class SnapshotReader:
+    """Read a stored snapshot lazily: metadata up front, teams on demand.
+
+    Opening a snapshot parses the whole snapshot file, which holds the metadata
+    and one object reference and name per team - O(teams) small strings, but no
+    team data. A name -> position index is built once, so get_team() is a dict
+    lookup plus one team object read; iter_teams() reads objects one at a time.
+    Legacy snapshots embed their teams in the file, so opening one parses all
+    team data (teams are still only validated when read).
+    """
+
+    def __init__(self, snapshot_id: str, snapshot_file: Path):
+        with open(snapshot_file, 'rb') as f:
+            raw = f.read()
+        SNAPSHOT_IO_BYTES.inc(len(raw), direction="read")
+        data = json.loads(raw)
+
+        self.snapshot_id = snapshot_id
+        self.metadata = SnapshotMetadata(
+            snapshot_id=data["snapshot_id"],
+            name=data["name"],
+            description=data.get("description", ""),
+            author=data.get("author", ""),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            statistics=SnapshotStatistics(**data["statistics"]),
+        )
+        self._team_refs: list[str] | None = data.get("team_refs")
+        self._legacy_teams: list[dict[str, Any]] = data.get("teams", []) if self._team_refs is None else []
+        if self._team_refs is None:
+            self._team_names: list[str] | None = [team.get("name") for team in self._legacy_teams]
+        else:
+            self._team_names = data.get("team_names")
+        # Name -> position of its first team (None if names aren't stored in the file)
+        self._positions: dict[str, int] | None = None
+        if self._team_names is not None:
+            self._positions = {}
+            for position, name in enumerate(self._team_names):
+                self._positions.setdefault(name, position)
+
+    def __len__(self) -> int:
+        return len(self._team_refs) if self._team_refs is not None else len(self._legacy_teams)
+
+    def team_names(self) -> list[str]:
+        """Names of the snapshot's teams, in order (reads team objects if not indexed)."""
+        if self._team_names is not None:
+            return list(self._team_names)
+        return [team.name for team in self.iter_teams()]
+
+    def iter_teams(self) -> Iterator[SnapshotTeamCondensed]:
+        """Yield the snapshot's teams in order, reading one team object at a time."""
+        if self._team_refs is None:
+            for team in self._legacy_teams:
+                yield SnapshotTeamCondensed(**team)
+            return
+        for team in _read_objects(self._team_refs):
+            yield SnapshotTeamCondensed(**team)
+
+    def get_team(self, name: str) -> SnapshotTeamCondensed | None:
+        """Look up one team by name (reads a single team object when names are indexed)."""
+        if self._positions is None:
+            return next((team for team in self.iter_teams() if team.name == name), None)
+        position = self._positions.get(name)
+        if position is None:
+            return None
+        if self._team_refs is None:
+            return SnapshotTeamCondensed(**self._legacy_teams[position])
+        return SnapshotTeamCondensed(**_read_object(self._team_refs[position]))
+
+
+def open_snapshot(snapshot_id: str) -> SnapshotReader | None:
+    """Open a snapshot for lazy reading (None if it doesn't exist or is unreadable)."""
+    snapshot_file = SNAPSHOTS_DIR / f"{snapshot_id}.json"
+    if not snapshot_file.exists():
+        return None
+    try:
+        return SnapshotReader(snapshot_id, snapshot_file)
+    except Exception as e:
+        print(f"Error opening snapshot {snapshot_id}: {e}")
+        return None
+
+
+def live_snapshot() -> Snapshot:
+    """The current TT design as an in-memory snapshot (never written to disk).
+
+    Rebuilt only when the dataset version (team file stats) changes; the returned
+    object is shared and must be treated as read-only.
+    """
+    global _LIVE_SNAPSHOT
+    version = get_dataset_version("tt")
+    cached = _LIVE_SNAPSHOT
+    record_cache("live_snapshot", cached is not None and cached[0] == version)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    teams = find_all_teams(view="tt")
+    snapshot = Snapshot(
+        snapshot_id=LIVE_SNAPSHOT_ID,
+        name="Live TT Design",
+        description="Current state of the TT Design (not saved)",
+        created_at=datetime.now(),
+        teams=[condense_team_for_snapshot(team) for team in teams],
+        statistics=calculate_statistics(teams),
+    )
+    _LIVE_SNAPSHOT = (version, snapshot)
+    return snapshot
+
+
+def compare_loaded_snapshots(before: Snapshot, after: Snapshot) -> dict[str, Any]:
+    """compare_snapshots, cached per (before_id, after_id).
+
+    A cached result is reused only while both snapshots are the same cached
+    objects, i.e. neither file changed since. Treat the result as read-only.
+    """
+    cache_key = (before.snapshot_id, after.snapshot_id)
+    cached = _cache_get(_COMPARISON_CACHE, cache_key)
+    record_cache("comparison", cached is not None and cached[0] is before and cached[1] is after)
+    if cached is not None and cached[0] is before and cached[1] is after:
+        return cached[2]
+
+    result = compare_snapshots(before, after)
+    _cache_put(_COMPARISON_CACHE, cache_key, (before, after, result), COMPARISON_CACHE_SIZE)
+    return result
+
+
+def _snapshot_version(snapshot_id: str) -> SnapshotVersion | None:
+    try:
+        stat = (SNAPSHOTS_DIR / f"{snapshot_id}.json").stat()
+    except OSError:
+        return None
+    return (snapshot_id, stat.st_mtime_ns, stat.st_size)
+
+
+def _load_for_timeline(snapshot_id: str) -> Snapshot:
+    snapshot = load_snapshot(snapshot_id)
+    if snapshot is None:
+        raise ValueError(f"Snapshot could not be loaded: {snapshot_id}")
+    return snapshot
+
+
+def count_edges(snapshot: Snapshot) -> dict[str, int]:
+    """Number of dependency and interaction edges in a snapshot."""
+    return {
+        "dependency_edges": sum(len(team.dependencies or []) for team in snapshot.teams),
+        "interaction_edges": sum(len(team.interaction_modes or {}) for team in snapshot.teams),
+    }
+
+
+def snapshot_timeline(snapshot_ids: list[str] | None = None) -> dict[str, Any]:
+    """Consecutive diffs and time series across snapshots.
+
+    Diffs between adjacent snapshots and per-snapshot edge counts are cached by
+    file version, so extending a timeline by one snapshot costs one new diff.
+
+    Args:
+        snapshot_ids: Snapshots in timeline order; None for all snapshots, oldest first
+
+    Returns:
+        Dictionary with:
+        - series: one point per snapshot (snapshot_id, name, created_at,
+          statistics, dependency_edges, interaction_edges)
+        - steps: one entry per consecutive pair (before_id, after_id, changes),
+          where changes has the same shape as in compare_snapshots
+
+    Raises:
+        ValueError: If a snapshot doesn't exist or can't be loaded
+    """
+    metadata = {m.snapshot_id: m for m in list_snapshots()}
+    if snapshot_ids is None:
+        snapshot_ids = [m.snapshot_id for m in sorted(metadata.values(), key=lambda m: m.created_at)]
+
+    versions = []
+    for snapshot_id in snapshot_ids:
+        version = _snapshot_version(snapshot_id)
+        if version is None or snapshot_id not in metadata:
+            raise ValueError(f"Snapshot not found: {snapshot_id}")
+        versions.append(version)
+
+    series = []
+    for version in versions:
+        edge_counts = _cache_get(_EDGE_COUNT_CACHE, version)
+        record_cache("timeline_edge_counts", edge_counts is not None)
+        if edge_counts is None:
+            edge_counts = count_edges(_load_for_timeline(version[0]))
+            _cache_put(_EDGE_COUNT_CACHE, version, edge_counts, TIMELINE_CACHE_SIZE)
+
+        info = metadata[version[0]]
+        series.append({
+            "snapshot_id": info.snapshot_id,
+            "name": info.name,
+            "created_at": info.created_at.isoformat(),
+            "statistics": info.statistics.model_dump(),
+            **edge_counts,
+        })
+
+    steps = []
+    for before, after in pairwise(versions):
+        changes = _cache_get(_TIMELINE_STEP_CACHE, (before, after))
+        record_cache("timeline_step", changes is not None)
+        if changes is None:
+            changes = compare_snapshots(_load_for_timeline(before[0]), _load_for_timeline(after[0]))["changes"]
+            _cache_put(_TIMELINE_STEP_CACHE, (before, after), changes, TIMELINE_CACHE_SIZE)
+        steps.append({"before_id": before[0], "after_id": after[0], "changes": changes})
+
+    return {"series": series, "steps": steps}
+
+
+if __name__ == "__main__":
+    from backend.snapshot_cli import main
+
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+"""Server-Sent Events (SSE) helpers for streaming API responses."""
+import json
+from collections.abc import Iterator
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+from backend.validation import iter_team_file_validation, validate_all_config_files
+from backend.validation_rules import DEFAULT_PROFILE
+
+# Emit a progress event after this many files without issues
+PROGRESS_INTERVAL = 50
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format one SSE message (event name + single-line JSON payload)."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def validation_event_stream(
+    view: str, team_schema: str, profile: str = DEFAULT_PROFILE
+) -> Iterator[str]:
+    """Stream validation of a view as SSE messages.
+
+    Events:
+    - start: {view, total_files}
+    - issue: {index, total_files, file, errors, warnings} for each file with issues
+    - progress: {checked, total_files}, every PROGRESS_INTERVAL files
+    - summary: same shape as the /validate response, minus the per-file issues
+    """
+    total_files = 0
+
+    for event in iter_team_file_validation(view, profile=profile):
+        kind = event.pop("event")
+
+        if kind == "start":
+            total_files = event["total_files"]
+            yield format_sse("start", event)
+        elif kind == "file":
+            if event["errors"] or event["warnings"]:
+                yield format_sse("issue", {**event, "total_files": total_files})
+            if event["index"] % PROGRESS_INTERVAL == 0:
+                yield format_sse("progress", {"checked": event["index"], "total_files": total_files})
+        elif kind == "summary":
+            yield format_sse("summary", {
+                "teams": event,
+                "config_files": validate_all_config_files(view),
+                "team_schema": team_schema,
+            })
+
+
+def validation_stream_response(
+    view: str, team_schema: str, profile: str = DEFAULT_PROFILE
+) -> StreamingResponse:
+    """Wrap validation_event_stream in an unbuffered text/event-stream response."""
+    return StreamingResponse(
+        validation_event_stream(view, team_schema, profile),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
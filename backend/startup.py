@@ -0,0 +1,81 @@
+"""Application startup phases, run from the FastAPI lifespan
+
+Importing the backend has no side effects: no directory is created and no team
+file is read until the app starts (or a request needs it). Startup then runs
+explicit phases, each timed:
+- ensure_dirs: create the team and snapshot directories if missing
+- scan: count the team files of each view for the startup banner
+
+Phase durations are returned, printed in the banner and exposed on /api/metrics
+as startup_phase_duration_seconds{phase}.
+
+Settings (environment variables):
+- STARTUP_SCAN: "false" skips the scan phase (faster cold starts on large datasets)
+"""
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from backend import snapshot_services
+from backend.metrics import STARTUP_PHASE_DURATION
+from backend.services import file_ops
+
+
+def count_team_files(directory: Path, recursive: bool = False) -> int:
+    """Number of .md files in directory (and its subdirectories if recursive); 0 if missing.
+
+    Uses os.scandir, so no Path object or stat call is made per directory entry.
+    """
+    count = 0
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        count += 1
+                    elif recursive and entry.is_dir():
+                        pending.append(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return count
+
+
+def _timed(phases: dict[str, float], phase: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    phases[phase] = time.perf_counter() - start
+    STARTUP_PHASE_DURATION.set(phases[phase], phase=phase)
+    return result
+
+
+def _ensure_dirs() -> list[Path]:
+    return [*file_ops.ensure_data_dirs(), snapshot_services.ensure_snapshots_dir()]
+
+
+def _scan() -> dict[str, int]:
+    return {
+        "tt": count_team_files(file_ops.TT_TEAMS_DIR),  # Flat: one folder per design variant
+        "baseline": count_team_files(file_ops.BASELINE_TEAMS_DIR, recursive=True),
+    }
+
+
+def run_startup(scan: bool | None = None) -> dict[str, Any]:
+    """Run the startup phases and report what they did.
+
+    Args:
+        scan: Whether to count the team files (defaults to STARTUP_SCAN, on unless "false")
+
+    Returns:
+        {"directories": [...], "file_counts": {view: count} or None if skipped,
+         "phases": {phase: seconds}}
+    """
+    if scan is None:
+        scan = os.getenv("STARTUP_SCAN", "true") != "false"
+
+    phases: dict[str, float] = {}
+    directories = _timed(phases, "ensure_dirs", _ensure_dirs)
+    file_counts = _timed(phases, "scan", _scan) if scan else None
+    return {"directories": directories, "file_counts": file_counts, "phases": phases}
@@ -5,52 +5,196 @@ The validation is split into:
 - validation_rules.py: Individual validation functions (single responsibility)
 - validation.py: Orchestration and config file validation
 """
+import hashlib
 import json
+import os
+import time
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import ValidationError
 
 from backend.constants import SKIP_FILES, ConfigFiles, OrganizationTypes
-from backend.schemas import (
-    BaselineTeamTypesConfig,
-    BusinessStreamsConfig,
-    OrganizationHierarchyConfig,
-    ProductsConfig,
-)
+from backend.metrics import VALIDATION_DURATION, record_cache
 from backend.services import get_data_dir, team_name_to_slug
 from backend.validation_rules import (
-    MARKDOWN_VALIDATORS,
-    YAML_VALIDATORS,
+    DEFAULT_PROFILE,
+    VALIDATOR_PROFILES,
     ValidationContext,
-    validate_filename_matches_name,
+    ValidationLookups,
+    ValidatorProfile,
 )
 
 # Backward compatibility alias
 ORGANIZATION_STRUCTURE_TYPES = OrganizationTypes.ALL
 
 
-def _collect_all_team_names(data_dir: Path) -> set[str]:
-    """First pass: collect all team names for cross-reference validation."""
-    all_team_names = set()
+@dataclass
+class _CachedValidation:
+    """Validation result for one file, plus what it depended on."""
+    content_hash: str
+    team_name: str | None
+    team_id: str | None
+    context_fingerprint: str | None = None
+    team_lookups: dict[tuple[str, str], Any] = field(default_factory=dict)
+    issues: dict[str, Any] | None = None
+
+
+# Timing entry for YAML front matter parsing (reported alongside the rules)
+YAML_PARSE_TIMING = "yaml_front_matter"
+
+# Below this many files per worker, process start-up costs more than it saves
+PARALLEL_MIN_FILES_PER_WORKER = 32
+
+# Per data directory: relative file path -> cached validation result.
+# Entries are replaced on every run, so deleted files drop out automatically.
+_VALIDATION_CACHE: dict[str, dict[str, _CachedValidation]] = {}
+
+
+def clear_validation_cache() -> None:
+    """Forget all cached validation results (next run re-validates every file)."""
+    _VALIDATION_CACHE.clear()
+
+
+# Modules (besides validation*.py) whose code decides the reported issues: name
+# suggestions, team types and limits, and the expected filename slug
+_RULE_DEPENDENCIES = ("name_matching.py", "constants.py", "services/utils.py")
+
+
+def _rules_fingerprint() -> str:
+    """Fingerprint the validator source, so a persisted cache dies with rule changes."""
+    backend_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for module_file in [*sorted(backend_dir.glob("validation*.py")),
+                        *(backend_dir / name for name in _RULE_DEPENDENCIES)]:
+        digest.update(module_file.read_bytes())
+    return digest.hexdigest()
+
+
+def save_validation_cache(cache_file: Path) -> None:
+    """Persist the validation cache to a JSON file (used by the CLI between runs)."""
+    payload = {
+        "rules": _rules_fingerprint(),
+        "directories": {
+            data_dir: {
+                key: {
+                    "content_hash": entry.content_hash,
+                    "team_name": entry.team_name,
+                    "team_id": entry.team_id,
+                    "context_fingerprint": entry.context_fingerprint,
+                    "team_lookups": [[kind, ref, result] for (kind, ref), result in entry.team_lookups.items()],
+                    "issues": entry.issues,
+                }
+                for key, entry in entries.items()
+            }
+            for data_dir, entries in _VALIDATION_CACHE.items()
+        },
+    }
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(payload, f)
+    os.replace(tmp_file, cache_file)
+
+
+def load_validation_cache(cache_file: Path) -> None:
+    """Load a cache written by save_validation_cache.
+
+    Missing, unreadable or outdated (validator code changed) cache files are
+    ignored, which simply means every file gets validated.
+    """
+    try:
+        with open(cache_file, encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return
+    if not isinstance(payload, dict) or payload.get("rules") != _rules_fingerprint():
+        return
+
+    for data_dir, entries in payload.get("directories", {}).items():
+        _VALIDATION_CACHE[data_dir] = {
+            key: _CachedValidation(
+                content_hash=entry["content_hash"],
+                team_name=entry["team_name"],
+                team_id=entry["team_id"],
+                context_fingerprint=entry["context_fingerprint"],
+                team_lookups={(kind, ref): result for kind, ref, result in entry["team_lookups"]},
+                issues=entry["issues"],
+            )
+            for key, entry in entries.items()
+        }
+
+
+def _hash_content(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
-    for file_path in data_dir.rglob("*.md"):
-        if file_path.name in SKIP_FILES:
-            continue
-        try:
-            with open(file_path, encoding='utf-8') as f:
-                content = f.read()
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    data = yaml.safe_load(parts[1])
-                    if data and 'name' in data:
-                        all_team_names.add(data['name'])
-        except (yaml.YAMLError, OSError):
-            pass  # Errors will be caught in main validation pass
 
-    return all_team_names
+def _extract_team_identity(content: str) -> tuple[str | None, str | None]:
+    """Read (name, team_id) from a file's YAML front matter (None where unavailable)."""
+    if not content.startswith('---'):
+        return None, None
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return None, None
+    import yaml  # Deferred to the first validation (keeps app startup light)
+
+    try:
+        data = yaml.safe_load(parts[1])
+    except yaml.YAMLError:
+        return None, None  # Errors will be reported in the main validation pass
+    if not isinstance(data, dict):
+        return None, None
+    return data.get('name'), data.get('team_id')
+
+
+def _context_fingerprint(
+    view: str,
+    valid_types: list[str],
+    valid_product_lines: list[str],
+    valid_business_streams: list[str],
+) -> str:
+    """Fingerprint the config-derived part of the validation context.
+
+    Team names are deliberately excluded: their effect is tracked per file via
+    the recorded team lookups, so renaming one team only invalidates the files
+    that actually reference it.
+    """
+    payload = json.dumps(
+        [view, valid_types, valid_product_lines, valid_business_streams],
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _is_cache_hit(
+    entry: _CachedValidation,
+    context_fingerprint: str,
+    lookups: ValidationLookups,
+) -> bool:
+    """Check whether a cached result is still valid for the current run."""
+    if entry.issues is None or entry.context_fingerprint != context_fingerprint:
+        return False
+    return all(
+        lookups.query(kind, ref) == result for (kind, ref), result in entry.team_lookups.items()
+    )
+
+
+def _load_config_values(config_file: Path, list_key: str, value_key: str) -> list[str]:
+    """Read config_file[list_key][*][value_key].
+
+    Missing or malformed config files (and malformed entries) are skipped rather
+    than raised: validate_all_config_files reports them as config errors.
+    """
+    try:
+        with open(config_file, encoding='utf-8') as f:
+            config = json.load(f)
+    except (OSError, ValueError):
+        return []
+    items = config.get(list_key, []) if isinstance(config, dict) else []
+    if not isinstance(items, list):
+        return []
+    return [item[value_key] for item in items if isinstance(item, dict) and isinstance(item.get(value_key), str)]
 
 
 def _load_valid_types(view: str, data_dir: Path) -> list[str]:
@@ -60,40 +204,20 @@ def _load_valid_types(view: str, data_dir: Path) -> list[str]:
     if view == "tt":
         return TeamTypes.TT_TYPES
 
-    # Baseline view - load from config
-    config_file = data_dir / ConfigFiles.BASELINE_TEAM_TYPES
-    valid_types = []
-
-    if config_file.exists():
-        with open(config_file, encoding='utf-8') as f:
-            config = json.load(f)
-            valid_types = [t["id"] for t in config.get("team_types", [])]
-
-    # Add organizational structure types as valid
+    # Baseline view - load from config, plus organizational structure types
+    valid_types = _load_config_values(data_dir / ConfigFiles.BASELINE_TEAM_TYPES, "team_types", "id")
     valid_types.extend(OrganizationTypes.ALL)
     return valid_types
 
 
 def _load_valid_product_lines(data_dir: Path) -> list[str]:
     """Load valid product lines from config."""
-    products_file = data_dir / ConfigFiles.PRODUCTS
-    if not products_file.exists():
-        return []
-
-    with open(products_file, encoding='utf-8') as f:
-        config = json.load(f)
-        return [p["name"] for p in config.get("products", [])]
+    return _load_config_values(data_dir / ConfigFiles.PRODUCTS, "products", "name")
 
 
 def _load_valid_business_streams(data_dir: Path) -> list[str]:
     """Load valid business streams from config."""
-    streams_file = data_dir / ConfigFiles.BUSINESS_STREAMS
-    if not streams_file.exists():
-        return []
-
-    with open(streams_file, encoding='utf-8') as f:
-        config = json.load(f)
-        return [s["name"] for s in config.get("business_streams", [])]
+    return _load_config_values(data_dir / ConfigFiles.BUSINESS_STREAMS, "business_streams", "name")
 
 
 def _validate_yaml_structure(content: str) -> tuple[dict | None, str, list[str]]:
@@ -117,6 +241,8 @@ def _validate_yaml_structure(content: str) -> tuple[dict | None, str, list[str]]
     if len(parts) < 3:
         return None, "", ["Malformed YAML front matter (missing closing '---')"]
 
+    import yaml
+
     try:
         data = yaml.safe_load(parts[1])
         markdown_content = parts[2].strip()
@@ -130,128 +256,390 @@ def _validate_yaml_structure(content: str) -> tuple[dict | None, str, list[str]]
         return None, "", [f"YAML parsing error: {str(e)}"]
 
 
-def _validate_single_file(
-    file_path: Path,
+def _run_rule(rule, args: tuple, file_issues: dict[str, Any], timings: dict[str, float]) -> None:
+    """Run one validator, collecting its issues and recording its duration."""
+    start = time.perf_counter()
+    errors, warnings = rule(*args)
+    timings[rule.__name__] = timings.get(rule.__name__, 0.0) + time.perf_counter() - start
+    file_issues["errors"].extend(errors)
+    file_issues["warnings"].extend(warnings)
+
+
+def _validate_content(
+    file_name: str,
+    content: str,
     ctx: ValidationContext,
+    profile: ValidatorProfile | None = None,
+    timings: dict[str, float] | None = None,
 ) -> dict[str, Any]:
-    """Validate a single team file using all registered validators.
+    """Validate the content of a single team file using the profile's validators.
+
+    Args:
+        profile: Validators to run (defaults to the full profile)
+        timings: If given, rule name -> seconds spent is added to it
 
     Returns:
         Dict with 'file', 'errors', and 'warnings' keys.
     """
+    profile = profile or VALIDATOR_PROFILES[DEFAULT_PROFILE]
+    timings = {} if timings is None else timings
     file_issues = {
-        "file": file_path.name,
+        "file": file_name,
         "errors": [],
         "warnings": []
     }
 
-    try:
-        with open(file_path, encoding='utf-8') as f:
-            content = f.read()
+    # Validate YAML structure (timed like a rule: parsing is often the biggest cost)
+    start = time.perf_counter()
+    data, markdown_content, structure_errors = _validate_yaml_structure(content)
+    timings[YAML_PARSE_TIMING] = timings.get(YAML_PARSE_TIMING, 0.0) + time.perf_counter() - start
+    file_issues["errors"].extend(structure_errors)
 
-        # Validate YAML structure
-        data, markdown_content, structure_errors = _validate_yaml_structure(content)
-        file_issues["errors"].extend(structure_errors)
+    if data is None:
+        return file_issues
 
-        if data is None:
-            return file_issues
+    # Run YAML validators
+    for validator in profile.yaml:
+        _run_rule(validator, (data, ctx), file_issues, timings)
 
-        # Run all YAML validators
-        for validator in YAML_VALIDATORS:
-            errors, warnings = validator(data, ctx)
-            file_issues["errors"].extend(errors)
-            file_issues["warnings"].extend(warnings)
+    # Run filename validators (need team_name_to_slug function)
+    for validator in profile.filename:
+        _run_rule(validator, (data, ctx, team_name_to_slug), file_issues, timings)
 
-        # Run filename validator (needs team_name_to_slug function)
-        errors, warnings = validate_filename_matches_name(data, ctx, team_name_to_slug)
-        file_issues["errors"].extend(errors)
-        file_issues["warnings"].extend(warnings)
+    # Run markdown validators
+    for validator in profile.markdown:
+        _run_rule(validator, (markdown_content, ctx), file_issues, timings)
 
-        # Run markdown validators
-        for validator in MARKDOWN_VALIDATORS:
-            errors, warnings = validator(markdown_content, ctx)
-            file_issues["errors"].extend(errors)
-            file_issues["warnings"].extend(warnings)
+    return file_issues
 
-    except OSError as e:
-        file_issues["errors"].append(f"File reading error: {str(e)}")
 
-    return file_issues
+# Result of validating one file: (file_issues, team_lookups, rule timings in seconds)
+FileResult = tuple[dict[str, Any], dict[tuple[str, str], Any], dict[str, float]]
 
 
-def validate_all_team_files(view: str = "tt") -> dict[str, Any]:
-    """Validate all team files and return a report of issues.
+def _validate_batch(
+    batch: list[tuple[str, str]], base_ctx: ValidationContext, profile: ValidatorProfile
+) -> list[FileResult]:
+    """Validate (file_name, content) pairs against a shared context.
+
+    Returns:
+        One (file_issues, team_lookups, timings) tuple per input, in input order.
+    """
+    results = []
+    for file_name, content in batch:
+        ctx = replace(base_ctx, file_name=file_name)  # Shares the prebuilt lookups
+        timings: dict[str, float] = {}
+        file_issues = _validate_content(file_name, content, ctx, profile, timings)
+        results.append((file_issues, ctx.team_lookups, timings))
+    return results
+
+
+# Shared context and profile of a validation worker process (set once by _init_worker)
+_WORKER_CONTEXT: ValidationContext | None = None
+_WORKER_PROFILE: ValidatorProfile | None = None
+
+
+def _init_worker(base_ctx: ValidationContext, profile_name: str) -> None:
+    global _WORKER_CONTEXT, _WORKER_PROFILE
+    _WORKER_CONTEXT = base_ctx
+    _WORKER_PROFILE = VALIDATOR_PROFILES[profile_name]
 
-    This is the main orchestration function that:
-    1. Collects all team names for cross-reference validation
-    2. Loads configuration (valid types, product lines, business streams)
-    3. Runs all validators on each team file
-    4. Aggregates results into a report
+
+def _validate_batch_in_worker(batch: list[tuple[str, str]]) -> list[FileResult]:
+    return _validate_batch(batch, _WORKER_CONTEXT, _WORKER_PROFILE)
+
+
+def _resolve_workers(workers: int | None) -> int:
+    """Resolve the worker count (argument, then VALIDATION_WORKERS, then serial)."""
+    if workers is None:
+        try:
+            workers = int(os.getenv("VALIDATION_WORKERS", "1"))
+        except ValueError:
+            workers = 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _iter_validation(
+    batch: list[tuple[str, str]],
+    base_ctx: ValidationContext,
+    profile_name: str,
+    workers: int | None,
+) -> Iterator[FileResult]:
+    """Validate a batch serially or sharded across a process pool.
+
+    The shared context is shipped to each worker once (via the pool initializer)
+    and shards are yielded back in input order as they complete, so the output
+    is identical to the serial path.
+    """
+    workers = min(_resolve_workers(workers), len(batch) // PARALLEL_MIN_FILES_PER_WORKER)
+    if workers <= 1:
+        profile = VALIDATOR_PROFILES[profile_name]
+        for item in batch:
+            yield from _validate_batch([item], base_ctx, profile)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor  # Imports multiprocessing
+
+    chunk_size = -(-len(batch) // (workers * 4))  # ~4 shards per worker for load balancing
+    shards = [batch[i:i + chunk_size] for i in range(0, len(batch), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(base_ctx, profile_name)
+    ) as executor:
+        for shard in executor.map(_validate_batch_in_worker, shards):
+            yield from shard
+
+
+def iter_team_file_validation(
+    view: str = "tt",
+    workers: int | None = None,
+    data_dir: Path | None = None,
+    only: Collection[Path] | None = None,
+    profile: str = DEFAULT_PROFILE,
+    include_timings: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Validate all team files, yielding results as they are produced.
+
+    Results are cached per file, keyed by content hash and by the context the
+    file depended on. Only files whose content changed, or whose team references
+    resolve differently than last time, are re-validated.
 
     Args:
         view: The view to validate ('tt' or 'baseline')
-
-    Returns:
-        Dictionary containing validation report with:
-        - view: The view that was validated
-        - total_files: Total number of files checked
-        - valid_files: Number of files with no issues
-        - files_with_warnings: Number of files with warnings only
-        - files_with_errors: Number of files with errors
-        - issues: List of file issues
+        workers: Number of worker processes to validate with. Defaults to the
+            VALIDATION_WORKERS environment variable (1 = serial, 0 = one per CPU).
+        data_dir: Directory to validate (defaults to the view's data directory)
+        only: If given, validate and report only these files, plus files whose
+            cached result they invalidate (e.g. files referencing a team renamed in
+            one of them; needs a cache from an earlier run). All team files are
+            still read to build the cross-reference context.
+        profile: Name of the validator profile to run (see VALIDATOR_PROFILES)
+        include_timings: Add per-rule call counts and durations to the summary
+
+    Yields:
+        Event dicts, each with an 'event' key:
+        - start: view and total_files
+        - file: index (1-based), file, path (relative to data_dir), errors and
+          warnings - one per team file
+        - summary: view, profile, total_files, valid_files, files_with_warnings,
+          files_with_errors (+ rule_timings if requested)
+
+    Raises:
+        ValueError: If the profile is unknown
     """
-    data_dir = get_data_dir(view)
+    if profile not in VALIDATOR_PROFILES:
+        raise ValueError(
+            f"Unknown validation profile '{profile}' (valid: {', '.join(VALIDATOR_PROFILES)})"
+        )
+    started = time.perf_counter()
+    if data_dir is None:
+        data_dir = get_data_dir(view)
+    only_paths = {Path(p).resolve() for p in only} if only is not None else None
+    cache_key = f"{profile}:{data_dir}"  # Profiles report different issues, so cache separately
+    previous_cache = _VALIDATION_CACHE.get(cache_key, {})
+    current_cache: dict[str, _CachedValidation] = {}
+
+    # First pass: read every file and collect team names for cross-reference validation
+    files: list[tuple[Path, str, str | None]] = []  # (path, cache key, content)
+    all_team_names: set[str] = set()
+    team_ids: dict[str, str] = {}  # team_id / slug -> name
+    read_errors: dict[str, str] = {}
+    for file_path in sorted(data_dir.rglob("*.md")):
+        if file_path.name in SKIP_FILES:
+            continue
+
+        key = file_path.relative_to(data_dir).as_posix()
+        try:
+            with open(file_path, encoding='utf-8') as f:
+                content = f.read()
+        except OSError as e:
+            files.append((file_path, key, None))
+            read_errors[key] = f"File reading error: {str(e)}"
+            continue
 
-    # Collect team names for cross-reference validation
-    all_team_names = _collect_all_team_names(data_dir)
+        content_hash = _hash_content(content)
+        entry = previous_cache.get(key)
+        if entry is None or entry.content_hash != content_hash:
+            entry = _CachedValidation(content_hash, *_extract_team_identity(content))
+        current_cache[key] = entry
+        if isinstance(entry.team_name, str):
+            all_team_names.add(entry.team_name)
+            team_ids.setdefault(team_name_to_slug(entry.team_name), entry.team_name)
+            if isinstance(entry.team_id, str):
+                team_ids[entry.team_id] = entry.team_name
+        files.append((file_path, key, content))
 
     # Load configuration
     valid_types = _load_valid_types(view, data_dir)
     valid_product_lines = _load_valid_product_lines(data_dir) if view == "baseline" else []
     valid_business_streams = _load_valid_business_streams(data_dir) if view == "baseline" else []
-
-    # Initialize report
-    report = {
+    context_fingerprint = _context_fingerprint(
+        view, valid_types, valid_product_lines, valid_business_streams
+    )
+
+    lookups = ValidationLookups.build(
+        valid_types, all_team_names, valid_product_lines, valid_business_streams, team_ids
+    )
+
+    # Keep unselected files in the cache, but don't validate or report them -
+    # unless the selected files changed what their cached result depended on
+    if only_paths is not None:
+        files = [
+            (file_path, key, content)
+            for file_path, key, content in files
+            if file_path.resolve() in only_paths
+            or (content is not None and current_cache[key].issues is not None
+                and not _is_cache_hit(current_cache[key], context_fingerprint, lookups))
+        ]
+
+    yield {"event": "start", "view": view, "total_files": len(files)}
+
+    # Validate files without a usable cached result (in parallel if enabled)
+    base_ctx = ValidationContext(
+        view=view,
+        file_name="",
+        valid_types=valid_types,
+        all_team_names=all_team_names,
+        valid_product_lines=valid_product_lines,
+        valid_business_streams=valid_business_streams,
+        lookups=lookups,
+    )
+    # Decide cache misses once: entries are shared with runs that may be in progress
+    # (SSE streams, jobs), so they are never modified, only replaced in current_cache
+    pending = [
+        (key, file_path.name, content)
+        for file_path, key, content in files
+        if content is not None
+        and not _is_cache_hit(current_cache[key], context_fingerprint, lookups)
+    ]
+    misses = {key for key, _, _ in pending}
+    results = _iter_validation(
+        [(file_name, content) for _, file_name, content in pending], base_ctx, profile, workers
+    )
+    fresh_results = zip((key for key, _, _ in pending), results, strict=True)
+    rule_stats: dict[str, dict[str, float]] = {}
+
+    summary = {
+        "event": "summary",
         "view": view,
+        "profile": profile,
         "total_files": 0,
         "valid_files": 0,
         "files_with_warnings": 0,
         "files_with_errors": 0,
-        "issues": []
     }
 
-    # Validate each team file
-    for file_path in data_dir.rglob("*.md"):
-        if file_path.name in SKIP_FILES:
-            continue
-
-        report["total_files"] += 1
-
-        # Create validation context for this file
-        ctx = ValidationContext(
-            view=view,
-            file_name=file_path.name,
-            valid_types=valid_types,
-            all_team_names=all_team_names,
-            valid_product_lines=valid_product_lines,
-            valid_business_streams=valid_business_streams,
-        )
+    try:
+        for file_path, key, content in files:
+            summary["total_files"] += 1
 
-        # Run all validators
-        file_issues = _validate_single_file(file_path, ctx)
+            if content is None:
+                file_issues = {"file": file_path.name, "errors": [read_errors[key]], "warnings": []}
+            else:
+                cache_hit = key not in misses
+                record_cache("validation", cache_hit)
+                if cache_hit:
+                    entry = current_cache[key]
+                else:
+                    result_key, (issues, team_lookups, timings) = next(fresh_results)
+                    entry = current_cache[result_key] = replace(
+                        current_cache[result_key],
+                        issues=issues,
+                        team_lookups=team_lookups,
+                        context_fingerprint=context_fingerprint,
+                    )
+                    for rule, seconds in timings.items():
+                        stats = rule_stats.setdefault(rule, {"calls": 0, "total_ms": 0.0})
+                        stats["calls"] += 1
+                        stats["total_ms"] += seconds * 1000
+                # Copy so callers can't mutate the cached result
+                file_issues = {
+                    "file": entry.issues["file"],
+                    "errors": list(entry.issues["errors"]),
+                    "warnings": list(entry.issues["warnings"]),
+                }
 
-        # Add to report if there are issues
-        if file_issues["errors"] or file_issues["warnings"]:
-            report["issues"].append(file_issues)
             if file_issues["errors"]:
-                report["files_with_errors"] += 1
+                summary["files_with_errors"] += 1
+            elif file_issues["warnings"]:
+                summary["files_with_warnings"] += 1
             else:
-                report["files_with_warnings"] += 1
-        else:
-            report["valid_files"] += 1
+                summary["valid_files"] += 1
+
+            yield {"event": "file", "index": summary["total_files"], "path": key, **file_issues}
+    finally:
+        results.close()
+        _VALIDATION_CACHE[cache_key] = current_cache
+
+    if include_timings:
+        summary["rule_timings"] = {
+            "validated_files": len(pending),  # Cached files don't run any rules
+            "rules": {
+                rule: {"calls": stats["calls"], "total_ms": round(stats["total_ms"], 3)}
+                for rule, stats in sorted(rule_stats.items(), key=lambda kv: -kv[1]["total_ms"])
+            },
+        }
+    VALIDATION_DURATION.observe(time.perf_counter() - started, view=view, profile=profile)
+    yield summary
 
-    return report
 
+def validate_all_team_files(
+    view: str = "tt",
+    workers: int | None = None,
+    profile: str = DEFAULT_PROFILE,
+    include_timings: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> dict[str, Any]:
+    """Validate all team files and return a report of issues.
+
+    This is the main orchestration function that:
+    1. Collects all team names for cross-reference validation
+    2. Loads configuration (valid types, product lines, business streams)
+    3. Runs all validators on each team file (see iter_team_file_validation)
+    4. Aggregates results into a report
+
+    Args:
+        view: The view to validate ('tt' or 'baseline')
+        workers: Number of worker processes (see iter_team_file_validation)
+        profile: Validator profile to run ('fast': structural rules only, 'full': all rules)
+        include_timings: Include per-rule call counts and durations ('rule_timings')
+        progress: Called with (checked files, total files) at the start and after each file
+
+    Returns:
+        Dictionary containing validation report with:
+        - view: The view that was validated
+        - profile: The validator profile that was run
+        - total_files: Total number of files checked
+        - valid_files: Number of files with no issues
+        - files_with_warnings: Number of files with warnings only
+        - files_with_errors: Number of files with errors
+        - issues: List of file issues
+        - rule_timings: Per-rule calls and total_ms (only if include_timings)
+    """
+    issues = []
+    report: dict[str, Any] = {}
+    total_files = 0
+
+    for event in iter_team_file_validation(
+        view, workers, profile=profile, include_timings=include_timings
+    ):
+        if event["event"] == "start":
+            total_files = event["total_files"]
+            if progress:
+                progress(0, total_files)
+        elif event["event"] == "file":
+            if progress:
+                progress(event["index"], total_files)
+            if event["errors"] or event["warnings"]:
+                issues.append(
+                    {"file": event["file"], "errors": event["errors"], "warnings": event["warnings"]}
+                )
+        elif event["event"] == "summary":
+            report = {key: value for key, value in event.items() if key != "event"}
+
+    report["issues"] = issues
+    return report
 
 
 def validate_config_file(file_path: Path, schema_class) -> dict[str, Any]:
@@ -297,16 +685,25 @@ def validate_config_file(file_path: Path, schema_class) -> dict[str, Any]:
     return result
 
 
-def validate_all_config_files(view: str = "baseline") -> dict[str, Any]:
+def validate_all_config_files(view: str = "baseline", data_dir: Path | None = None) -> dict[str, Any]:
     """Validate all JSON config files for a view.
 
     Args:
         view: The view to validate ('baseline' or 'tt')
+        data_dir: Directory to validate (defaults to the view's data directory)
 
     Returns:
         Dictionary containing validation results for all config files
     """
-    data_dir = get_data_dir(view)
+    from backend.schemas import (  # Pydantic models built on first use, not at startup
+        BaselineTeamTypesConfig,
+        BusinessStreamsConfig,
+        OrganizationHierarchyConfig,
+        ProductsConfig,
+    )
+
+    if data_dir is None:
+        data_dir = get_data_dir(view)
 
     report = {
         "view": view,
@@ -337,3 +734,9 @@ def validate_all_config_files(view: str = "baseline") -> dict[str, Any]:
             report["total_errors"] += len(validation_result["errors"])
 
     return report
+
+
+if __name__ == "__main__":
+    from backend.validation_cli import main
+
+    raise SystemExit(main())
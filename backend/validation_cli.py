@@ -0,0 +1,302 @@
+"""Command-line validation of team data directories (for pre-commit hooks and CI).
+
+Runs the same validators as the /api/{view}/validate endpoints without starting
+the web app:
+
+    python -m backend.validation                              # default TT + baseline dirs
+    python -m backend.validation data/tt-teams-initial        # any variant folder
+    python -m backend.validation --changed-only --since origin/main --format sarif
+    python -m backend.validation --changed-only --files data/tt-teams/billing-team.md
+
+A changed config file (team types, products, business streams, hierarchy)
+re-validates its whole directory. --changed-only keeps a cache in
+.validation-cache.json by default, so a one-file run only re-parses changed files
+and also re-checks the files whose references they changed.
+
+Exit codes: 0 = no errors, 1 = errors found (or warnings with --strict), 2 = usage error.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from backend.constants import ConfigFiles
+from backend.services import get_data_dir
+from backend.validation import (
+    iter_team_file_validation,
+    load_validation_cache,
+    save_validation_cache,
+    validate_all_config_files,
+)
+from backend.validation_rules import DEFAULT_PROFILE, VALIDATOR_PROFILES
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_NAME = "team-topologies-validator"
+
+# Used with --changed-only unless --cache or --no-cache is given
+DEFAULT_CACHE_FILE = Path(".validation-cache.json")
+
+CONFIG_FILE_NAMES = frozenset({
+    ConfigFiles.BASELINE_TEAM_TYPES,
+    ConfigFiles.PRODUCTS,
+    ConfigFiles.BUSINESS_STREAMS,
+    ConfigFiles.ORGANIZATION_HIERARCHY,
+    ConfigFiles.TT_TEAM_TYPES,
+})
+
+
+def infer_view(data_dir: Path) -> str:
+    """Guess the view of a data directory ('baseline' if it has baseline config)."""
+    if (data_dir / ConfigFiles.BASELINE_TEAM_TYPES).exists() or data_dir.name.startswith("baseline"):
+        return "baseline"
+    return "tt"
+
+
+def git_changed_files(since: str) -> list[Path]:
+    """Files changed relative to a git ref, plus untracked files (absolute paths)."""
+    def git(*args: str) -> list[str]:
+        result = subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        )
+        return [line for line in result.stdout.splitlines() if line]
+
+    root = Path(git("rev-parse", "--show-toplevel")[0])
+    changed = git("diff", "--name-only", since, "--")
+    untracked = git("ls-files", "--others", "--exclude-standard", "--full-name")
+    return [root / name for name in changed + untracked]
+
+
+def display_path(path: Path) -> str:
+    """Path relative to the working directory when possible (for readable, portable output)."""
+    try:
+        return path.relative_to(Path.cwd()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def validate_directory(
+    data_dir: Path,
+    view: str,
+    workers: int | None,
+    only: list[Path] | None,
+    profile: str = DEFAULT_PROFILE,
+    include_timings: bool = False,
+) -> dict[str, Any]:
+    """Validate one directory and return its report (team files + config files)."""
+    report: dict[str, Any] = {"path": display_path(data_dir), "view": view, "issues": []}
+
+    events = iter_team_file_validation(
+        view, workers, data_dir=data_dir, only=only, profile=profile, include_timings=include_timings
+    )
+    for event in events:
+        if event["event"] == "file" and (event["errors"] or event["warnings"]):
+            report["issues"].append({
+                "path": display_path(data_dir / event["path"]),
+                "errors": event["errors"],
+                "warnings": event["warnings"],
+            })
+        elif event["event"] == "summary":
+            report.update({k: v for k, v in event.items() if k not in ("event", "view")})
+
+    config_report = validate_all_config_files(view, data_dir=data_dir)
+    report["config_files"] = {
+        name: {"path": display_path(data_dir / name), "errors": result["errors"]}
+        for name, result in config_report["config_files"].items()
+        if result["errors"] and (data_dir / name).exists()
+    }
+    return report
+
+
+def count_issues(reports: list[dict[str, Any]]) -> tuple[int, int]:
+    """Total (errors, warnings) across directory reports."""
+    errors = warnings = 0
+    for report in reports:
+        for issue in report["issues"]:
+            errors += len(issue["errors"])
+            warnings += len(issue["warnings"])
+        for config in report["config_files"].values():
+            errors += len(config["errors"])
+    return errors, warnings
+
+
+def format_text(reports: list[dict[str, Any]]) -> str:
+    lines = []
+    for report in reports:
+        for issue in report["issues"]:
+            lines.extend(f"{issue['path']}: error: {msg}" for msg in issue["errors"])
+            lines.extend(f"{issue['path']}: warning: {msg}" for msg in issue["warnings"])
+        for config in report["config_files"].values():
+            lines.extend(f"{config['path']}: error: {msg}" for msg in config["errors"])
+        lines.append(
+            f"{report['path']} ({report['view']}): {report.get('total_files', 0)} files, "
+            f"{report.get('files_with_errors', 0)} with errors, "
+            f"{report.get('files_with_warnings', 0)} with warnings"
+        )
+    return "\n".join(lines)
+
+
+def format_json(reports: list[dict[str, Any]]) -> str:
+    errors, warnings = count_issues(reports)
+    return json.dumps(
+        {"directories": reports, "total_errors": errors, "total_warnings": warnings},
+        indent=2,
+    )
+
+
+def format_sarif(reports: list[dict[str, Any]]) -> str:
+    """Render reports as SARIF 2.1.0 (for GitHub code scanning and similar tools)."""
+    results = []
+
+    def add(path: str, level: str, message: str, rule_id: str) -> None:
+        results.append({
+            "ruleId": rule_id,
+            "level": level,
+            "message": {"text": message},
+            "locations": [{"physicalLocation": {"artifactLocation": {"uri": path}}}],
+        })
+
+    for report in reports:
+        for issue in report["issues"]:
+            for msg in issue["errors"]:
+                add(issue["path"], "error", msg, "team-file")
+            for msg in issue["warnings"]:
+                add(issue["path"], "warning", msg, "team-file")
+        for config in report["config_files"].values():
+            for msg in config["errors"]:
+                add(config["path"], "error", msg, "config-file")
+
+    sarif = {
+        "$schema": SARIF_SCHEMA,
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {"driver": {
+                "name": TOOL_NAME,
+                "rules": [
+                    {"id": "team-file", "shortDescription": {"text": "Team file validation"}},
+                    {"id": "config-file", "shortDescription": {"text": "Config file validation"}},
+                ],
+            }},
+            "results": results,
+        }],
+    }
+    return json.dumps(sarif, indent=2)
+
+
+def format_timings(reports: list[dict[str, Any]]) -> str:
+    """Per-rule timings, slowest first, summed across directories."""
+    totals: dict[str, dict[str, float]] = {}
+    for report in reports:
+        for rule, stats in report.get("rule_timings", {}).get("rules", {}).items():
+            entry = totals.setdefault(rule, {"calls": 0, "total_ms": 0.0})
+            entry["calls"] += stats["calls"]
+            entry["total_ms"] += stats["total_ms"]
+
+    lines = [f"{'rule':<36} {'calls':>8} {'total ms':>10}"]
+    for rule, stats in sorted(totals.items(), key=lambda item: -item[1]["total_ms"]):
+        lines.append(f"{rule:<36} {stats['calls']:>8} {stats['total_ms']:>10.2f}")
+    return "\n".join(lines)
+
+
+FORMATTERS = {"text": format_text, "json": format_json, "sarif": format_sarif}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.validation",
+        description="Validate team data directories (markdown team files and JSON config).",
+    )
+    parser.add_argument(
+        "directories", nargs="*", type=Path,
+        help="Data directories to validate (default: the TT design and baseline directories)",
+    )
+    parser.add_argument(
+        "--view", choices=["tt", "baseline"],
+        help="View for all directories (default: inferred per directory)",
+    )
+    parser.add_argument(
+        "--changed-only", action="store_true",
+        help="Only validate changed files (from --files, or git diff against --since)",
+    )
+    parser.add_argument("--since", default="HEAD", help="Git ref for --changed-only (default: HEAD)")
+    parser.add_argument(
+        "--files", nargs="*", type=Path,
+        help="Changed files for --changed-only (e.g. the file list passed by pre-commit)",
+    )
+    parser.add_argument("--format", choices=sorted(FORMATTERS), default="text")
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="Worker processes (default: 0 = one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--cache", type=Path,
+        help="Cache file to reuse results between runs (only changed files are re-validated; "
+             f"default with --changed-only: {DEFAULT_CACHE_FILE})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write a cache file")
+    parser.add_argument(
+        "--profile", choices=sorted(VALIDATOR_PROFILES), default=DEFAULT_PROFILE,
+        help="Validator profile: 'fast' = structural checks only, 'full' = everything (default)",
+    )
+    parser.add_argument(
+        "--timings", action="store_true",
+        help="Print per-rule call counts and durations to stderr (included in JSON output)",
+    )
+    parser.add_argument("--strict", action="store_true", help="Treat warnings as failures")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    directories = args.directories or [get_data_dir("tt"), get_data_dir("baseline")]
+    directories = [d.resolve() for d in directories]
+    missing = [str(d) for d in directories if not d.is_dir()]
+    if missing:
+        print(f"Not a directory: {', '.join(missing)}", file=sys.stderr)
+        return 2
+
+    changed: list[Path] | None = None
+    if args.changed_only:
+        if args.files is not None:
+            changed = [f.resolve() for f in args.files]
+        else:
+            try:
+                changed = git_changed_files(args.since)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"Could not list changed files from git: {e}", file=sys.stderr)
+                return 2
+
+    cache_file = args.cache or (DEFAULT_CACHE_FILE if args.changed_only else None)
+    if args.no_cache:
+        cache_file = None
+    if cache_file:
+        load_validation_cache(cache_file)
+
+    reports = []
+    for data_dir in directories:
+        only = None
+        # A changed config file can affect every team file in its directory
+        if changed is not None and not any(f.parent == data_dir and f.name in CONFIG_FILE_NAMES for f in changed):
+            only = [f for f in changed if f.suffix == ".md" and f.is_relative_to(data_dir)]
+            if not only:
+                continue
+        view = args.view or infer_view(data_dir)
+        reports.append(validate_directory(
+            data_dir, view, args.workers, only, args.profile, args.timings
+        ))
+
+    if cache_file:
+        save_validation_cache(cache_file)
+
+    print(FORMATTERS[args.format](reports))
+    if args.timings:
+        print(format_timings(reports), file=sys.stderr)
+
+    errors, warnings = count_issues(reports)
+    return 1 if errors or (args.strict and warnings) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -10,7 +10,8 @@ This design allows:
 3. Clear single-responsibility functions
 """
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from backend.constants import (
@@ -19,6 +20,81 @@ from backend.constants import (
     MarkdownSections,
     TeamSize,
 )
+from backend.name_matching import TrigramIndex
+
+# Kinds of team lookups a validator can make (recorded on the context, see query_team)
+TEAM_NAME_LOOKUP = "name"  # exact team name
+TEAM_REFERENCE_LOOKUP = "reference"  # team name or team_id/slug
+TEAM_SUGGESTION_LOOKUP = "suggest"  # closest team names to an unresolved reference
+
+MAX_SUGGESTIONS = 3
+
+
+@dataclass(frozen=True)
+class ValidationLookups:
+    """Prebuilt lookup tables for one validation run (built once, shared by all files)."""
+    valid_types: frozenset[str]
+    product_lines: frozenset[str]  # normalized
+    business_streams: frozenset[str]  # normalized
+    team_names: frozenset[str]
+    team_names_by_normalized: dict[str, str]  # normalized name -> canonical name
+    team_names_by_slug: dict[str, str]  # team_id / slug -> canonical name
+
+    @classmethod
+    def build(
+        cls,
+        valid_types: list[str],
+        all_team_names: set[str],
+        valid_product_lines: list[str],
+        valid_business_streams: list[str],
+        team_ids: dict[str, str] | None = None,
+    ) -> "ValidationLookups":
+        """Build lookups from context lists.
+
+        Args:
+            team_ids: Optional team_id/slug -> canonical team name mapping
+        """
+        names = frozenset(n for n in all_team_names if isinstance(n, str))
+        return cls(
+            valid_types=frozenset(valid_types),
+            product_lines=frozenset(_normalize_string(p) for p in valid_product_lines),
+            business_streams=frozenset(_normalize_string(s) for s in valid_business_streams),
+            team_names=names,
+            team_names_by_normalized={_normalize_string(n): n for n in sorted(names)},
+            team_names_by_slug=dict(team_ids or {}),
+        )
+
+    def query(self, kind: str, ref: str) -> Any:
+        """Answer a team lookup (see TEAM_*_LOOKUP kinds)."""
+        if kind == TEAM_NAME_LOOKUP:
+            return ref in self.team_names
+        if kind == TEAM_REFERENCE_LOOKUP:
+            if ref in self.team_names:
+                return ref
+            return self.team_names_by_slug.get(ref)
+        if kind == TEAM_SUGGESTION_LOOKUP:
+            return self.suggest(ref)
+        raise ValueError(f"Unknown team lookup kind: {kind}")
+
+    @cached_property
+    def team_name_index(self) -> TrigramIndex:
+        """Fuzzy index over normalized team names and slugs (built on first suggestion)."""
+        index = TrigramIndex()
+        for normalized, name in self.team_names_by_normalized.items():
+            index.add(normalized, name)
+        for slug, name in self.team_names_by_slug.items():
+            index.add(_normalize_string(slug), name)
+        return index
+
+    def suggest(self, ref: str) -> list[str]:
+        """Closest existing team names to ref (at most MAX_SUGGESTIONS, best first)."""
+        term = _normalize_string(ref)
+        if not term:
+            return []
+        # Allow roughly one typo per four characters, so short names don't match everything
+        max_distance = min(3, max(1, len(term) // 4))
+        matches = self.team_name_index.search(term, max_distance)
+        return [name for _, name in matches[:MAX_SUGGESTIONS]]
 
 
 @dataclass
@@ -30,6 +106,45 @@ class ValidationContext:
     all_team_names: set[str]
     valid_product_lines: list[str]
     valid_business_streams: list[str]
+    lookups: ValidationLookups | None = None  # built from the fields above if not given
+    # Every team lookup made through this context: (kind, ref) -> result
+    team_lookups: dict[tuple[str, str], Any] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        if self.lookups is None:
+            self.lookups = ValidationLookups.build(
+                self.valid_types,
+                self.all_team_names,
+                self.valid_product_lines,
+                self.valid_business_streams,
+            )
+
+    def query_team(self, kind: str, ref: Any) -> Any:
+        """Look up a team reference and record the answer.
+
+        The recorded lookups let callers tell whether a validation result still
+        holds after other team files changed.
+        """
+        if not isinstance(ref, str):
+            return {TEAM_REFERENCE_LOOKUP: None, TEAM_SUGGESTION_LOOKUP: []}.get(kind, False)
+        result = self.lookups.query(kind, ref)
+        self.team_lookups[(kind, ref)] = result
+        return result
+
+    def has_team(self, name: Any) -> bool:
+        """Check that a team with exactly this name exists."""
+        return self.query_team(TEAM_NAME_LOOKUP, name)
+
+    def resolve_team(self, ref: Any) -> str | None:
+        """Resolve a team name or team_id/slug to the canonical team name."""
+        return self.query_team(TEAM_REFERENCE_LOOKUP, ref)
+
+    def did_you_mean(self, ref: Any) -> str:
+        """Suffix suggesting the closest team names for an unresolved reference ('' if none)."""
+        suggestions = self.query_team(TEAM_SUGGESTION_LOOKUP, ref)
+        if not suggestions:
+            return ""
+        return f" (did you mean {' or '.join(repr(name) for name in suggestions)}?)"
 
 
 def validate_required_fields(data: dict, _ctx: ValidationContext) -> tuple[list[str], list[str]]:
@@ -52,7 +167,7 @@ def validate_team_type(data: dict, ctx: ValidationContext) -> tuple[list[str], l
     """Check that team_type is one of the allowed values."""
     errors = []
 
-    if ctx.valid_types and 'team_type' in data and data['team_type'] not in ctx.valid_types:
+    if ctx.valid_types and 'team_type' in data and data['team_type'] not in ctx.lookups.valid_types:
         errors.append(
             f"Invalid team_type: '{data['team_type']}' (valid: {', '.join(ctx.valid_types)})"
         )
@@ -159,9 +274,8 @@ def validate_product_line(data: dict, ctx: ValidationContext) -> tuple[list[str]
     warnings = []
     product_line = data['product_line']
     normalized_product = _normalize_string(product_line)
-    valid_normalized = [_normalize_string(p) for p in ctx.valid_product_lines]
 
-    if normalized_product and normalized_product not in valid_normalized:
+    if normalized_product and normalized_product not in ctx.lookups.product_lines:
         warnings.append(
             f"Product line '{product_line}' not found in products.json. "
             f"Valid options: {', '.join(ctx.valid_product_lines)}"
@@ -178,9 +292,8 @@ def validate_business_stream(data: dict, ctx: ValidationContext) -> tuple[list[s
     warnings = []
     business_stream = data['business_stream']
     normalized_stream = _normalize_string(business_stream)
-    valid_normalized = [_normalize_string(s) for s in ctx.valid_business_streams]
 
-    if normalized_stream and normalized_stream not in valid_normalized:
+    if normalized_stream and normalized_stream not in ctx.lookups.business_streams:
         warnings.append(
             f"Business stream '{business_stream}' not found in business-streams.json. "
             f"Valid options: {', '.join(ctx.valid_business_streams)}"
@@ -199,8 +312,8 @@ def validate_dependencies(data: dict, ctx: ValidationContext) -> tuple[list[str]
 
     if isinstance(deps, list):
         for dep in deps:
-            if dep not in ctx.all_team_names:
-                warnings.append(f"Dependency '{dep}' not found - team does not exist")
+            if not ctx.has_team(dep):
+                warnings.append(f"Dependency '{dep}' not found - team does not exist{ctx.did_you_mean(dep)}")
 
     return [], warnings
 
@@ -217,9 +330,10 @@ def validate_interaction_modes(data: dict, ctx: ValidationContext) -> tuple[list
         for mode, teams in modes.items():
             if isinstance(teams, list):
                 for team in teams:
-                    if team not in ctx.all_team_names:
+                    if not ctx.has_team(team):
                         warnings.append(
                             f"Interaction mode '{mode}' references unknown team: '{team}'"
+                            f"{ctx.did_you_mean(team)}"
                         )
 
     return [], warnings
@@ -261,9 +375,11 @@ def validate_interactions_array(data: dict, ctx: ValidationContext) -> tuple[lis
                 f"Use '{InteractionFields.INTERACTION_MODE}' (recommended) or '{InteractionFields.MODE}' to specify interaction type."
             )
 
-        # Validate team exists
-        if team_key and team_key not in ctx.all_team_names:
-            warnings.append(f"Interaction references unknown team: '{team_key}'")
+        # Validate team exists (by name or team_id, like the frontend resolves it)
+        if team_key and not ctx.resolve_team(team_key):
+            warnings.append(
+                f"Interaction references unknown team: '{team_key}'{ctx.did_you_mean(team_key)}"
+            )
 
         # Validate mode is correct
         if mode_key and mode_key not in InteractionModes.ALL:
@@ -307,7 +423,7 @@ def validate_interaction_table(
             parts_row = [p.strip() for p in line.split('|')]
             if len(parts_row) >= 2:
                 team_name = parts_row[1]
-                if team_name and team_name not in ctx.all_team_names:
+                if team_name and not ctx.has_team(team_name):
                     warnings.append(
                         f"Interaction table references unknown team: '{team_name}'"
                     )
@@ -345,3 +461,37 @@ FILENAME_VALIDATORS = [
 MARKDOWN_VALIDATORS = [
     validate_interaction_table,
 ]
+
+# YAML validators that only look at the file itself (no cross-file references)
+STRUCTURAL_YAML_VALIDATORS = [
+    validate_required_fields,
+    validate_team_type,
+    validate_position,
+    validate_metadata_size,
+    validate_inner_groupings,
+]
+
+
+@dataclass(frozen=True)
+class ValidatorProfile:
+    """A named selection of validators to run per file."""
+    yaml: list
+    filename: list
+    markdown: list
+
+
+# Named validator profiles. "full" uses the registries above directly, so rules
+# added to them are picked up automatically.
+VALIDATOR_PROFILES = {
+    "fast": ValidatorProfile(
+        yaml=STRUCTURAL_YAML_VALIDATORS,
+        filename=FILENAME_VALIDATORS,
+        markdown=[],
+    ),
+    "full": ValidatorProfile(
+        yaml=YAML_VALIDATORS,
+        filename=FILENAME_VALIDATORS,
+        markdown=MARKDOWN_VALIDATORS,
+    ),
+}
+DEFAULT_PROFILE = "full"
@@ -367,6 +367,38 @@ class ComparisonView {
             html += '</ul></div>';
         }
 
+        // Dependency edges
+        const dependencyChanges = changes.dependency_changes || { added: [], removed: [] };
+        if (dependencyChanges.added.length > 0 || dependencyChanges.removed.length > 0) {
+            html += '<div class="change-details"><h4>🔗 Dependencies:</h4><ul>';
+            dependencyChanges.added.forEach(edge => {
+                html += `<li>+ ${edge.from} → ${edge.to}</li>`;
+            });
+            dependencyChanges.removed.forEach(edge => {
+                html += `<li>− ${edge.from} → ${edge.to}</li>`;
+            });
+            html += '</ul></div>';
+        }
+
+        // Interaction modes per edge
+        if (changes.interaction_changes?.length > 0) {
+            html += '<div class="change-details"><h4>🤝 Interactions:</h4><ul>';
+            changes.interaction_changes.forEach(edge => {
+                html += `<li>${edge.from} → ${edge.to}: ${edge.before || 'none'} → ${edge.after || 'none'}</li>`;
+            });
+            html += '</ul></div>';
+        }
+
+        // Grouping moves and metadata changes
+        const fieldChanges = [...(changes.grouping_changes || []), ...(changes.metadata_changes || [])];
+        if (fieldChanges.length > 0) {
+            html += '<div class="change-details"><h4>🗂️ Groupings &amp; Metadata:</h4><ul>';
+            fieldChanges.forEach(change => {
+                html += `<li>${change.name} (${change.field}): ${change.before ?? 'none'} → ${change.after ?? 'none'}</li>`;
+            });
+            html += '</ul></div>';
+        }
+
         document.getElementById('comparisonChangesSummary').innerHTML = html;
     }
 
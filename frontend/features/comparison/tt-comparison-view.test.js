@@ -260,6 +260,25 @@ describe('ComparisonView', () => {
 
             expect(html).toContain('Team D');
         });
+
+        it('should list dependency, interaction, grouping and metadata changes', () => {
+            comparisonView.comparison.changes = {
+                ...comparisonView.comparison.changes,
+                dependency_changes: { added: [{ from: 'Team A', to: 'Team E' }], removed: [] },
+                interaction_changes: [{ from: 'Team A', to: 'Team F', before: 'collaboration', after: 'x-as-a-service' }],
+                grouping_changes: [{ name: 'Team G', field: 'value_stream', before: 'Retail', after: 'Wholesale' }],
+                metadata_changes: [{ name: 'Team H', field: 'size', before: 5, after: 8 }]
+            };
+
+            comparisonView.populateChangesSummary();
+
+            const html = document.getElementById('comparisonChangesSummary').innerHTML;
+
+            expect(html).toContain('Team A → Team E');
+            expect(html).toContain('collaboration → x-as-a-service');
+            expect(html).toContain('Retail → Wholesale');
+            expect(html).toContain('Team H (size): 5 → 8');
+        });
     });
 
     describe('wrapText()', () => {
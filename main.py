@@ -1,39 +1,76 @@
 """FastAPI application setup and configuration"""
 import os
 from contextlib import asynccontextmanager
-from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
+from backend.jobs import job_manager
+from backend.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from backend.metrics import MetricsMiddleware, render_metrics
 from backend.routes_baseline import router as baseline_router
+from backend.routes_jobs import router as jobs_router
+from backend.routes_profiles import router as profiles_router
 from backend.routes_schemas import router as schemas_router
 from backend.routes_tt import router as tt_router
+from backend.services import get_data_dir
+from backend.startup import run_startup
+
+
+class LazyProfilingMiddleware:
+    """Wraps backend.profiling.ProfilingMiddleware, importing it on the first request that
+    may be profiled (PROFILE_REQUESTS=true or an X-Profile: 1 header), so a server
+    with profiling off never loads it."""
+
+    def __init__(self, app):
+        self.app = app
+        self._profiling = None
+
+    async def __call__(self, scope, receive, send):
+        if self._profiling is None:
+            if scope["type"] != "http" or not (
+                os.getenv("PROFILE_REQUESTS") == "true" or (b"x-profile", b"1") in scope.get("headers", [])
+            ):
+                await self.app(scope, receive, send)
+                return
+            from backend.profiling import ProfilingMiddleware
+
+            self._profiling = ProfilingMiddleware(self.app)
+        await self._profiling(scope, receive, send)
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
-    """Application lifespan handler (replaces deprecated startup/shutdown events)."""
-    tt_variant = os.getenv("TT_DESIGN_VARIANT", "tt-teams")
-    tt_dir = Path("data") / tt_variant
-    baseline_dir = Path("data/baseline-teams")
+    """Application lifespan handler (replaces deprecated startup/shutdown events).
+
+    Directory setup and the team file scan run here as timed phases
+    (backend.startup), never on import.
+    """
+    startup = run_startup()
+    file_counts = startup["file_counts"]
 
     print("\n" + "=" * 80)
     print("Team Topologies Visualizer Starting Up")
     print("=" * 80)
-    print(f"TT Design Teams Directory: {tt_dir.absolute()}")
-    print(f"   Files found: {len(list(tt_dir.glob('*.md')))}")
-    print(f"Baseline Teams Directory: {baseline_dir.absolute()}")
-    print(f"   Files found: {len(list(baseline_dir.rglob('*.md')))}")
+    for label, view in (("TT Design Teams", "tt"), ("Baseline Teams", "baseline")):
+        print(f"{label} Directory: {get_data_dir(view).absolute()}")
+        if file_counts is not None:
+            print(f"   Files found: {file_counts[view]}")
     print(
         "Environment: TT_DESIGN_VARIANT="
         f"{os.getenv('TT_DESIGN_VARIANT', 'NOT SET (using default: tt-teams)')}"
     )
+    print("Startup phases: " + ", ".join(
+        f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in startup["phases"].items()
+    ))
     print("=" * 80 + "\n")
 
     yield
 
+    job_manager.shutdown()
+
 
 app = FastAPI(
     title="Team Topologies API",
@@ -50,11 +87,15 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(LazyProfilingMiddleware)  # Opt-in (PROFILE_REQUESTS or admin header)
+app.add_middleware(MetricsMiddleware)  # Outermost: times the whole request
 
 # Include API routes with prefixes
 app.include_router(baseline_router)  # /api/baseline/*
 app.include_router(tt_router)        # /api/tt/*
 app.include_router(schemas_router)   # /api/schemas/*
+app.include_router(jobs_router)      # /api/jobs/*
+app.include_router(profiles_router)  # /api/profiles/*
 
 # Serve static frontend files
 app.mount("/static", StaticFiles(directory="frontend"), name="static")
@@ -78,6 +119,12 @@ async def get_config():
     }
 
 
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Server metrics in Prometheus text format (latency per route, parsing, caches, validation, snapshot I/O)"""
+    return PlainTextResponse(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
@@ -0,0 +1,99 @@
+"""Tests for the benchmark runner and regression comparison (python -m backend.benchmarks)"""
+import json
+import os
+
+import pytest
+
+from backend import snapshot_services
+from backend.benchmarks import (
+    BENCHMARKS,
+    IMPROVED,
+    MISSING,
+    NEW,
+    REGRESSED,
+    UNCHANGED,
+    compare_results,
+    main,
+    mann_whitney_u,
+    run_benchmarks,
+    summarize,
+)
+from backend.services import file_ops
+
+
+def _results(**benchmarks):
+    return {
+        "format": 1,
+        "benchmarks": {key: {"samples": samples, **summarize(samples)} for key, samples in benchmarks.items()},
+    }
+
+
+def test_mann_whitney_u_separated_samples():
+    """Fully separated samples give U = 0 and a small p-value"""
+    u, p_value = mann_whitney_u([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+    assert u == 0
+    assert p_value < 0.1
+
+    _, p_value = mann_whitney_u([float(x) for x in range(10)], [float(x) for x in range(100, 110)])
+    assert p_value < 0.001
+
+
+def test_mann_whitney_u_overlapping_samples():
+    """Interleaved samples and all-equal samples are not significant"""
+    _, p_value = mann_whitney_u([1.0, 3.0, 5.0, 7.0, 9.0], [2.0, 4.0, 6.0, 8.0, 10.0])
+    assert p_value > 0.5
+    assert mann_whitney_u([1.0] * 8, [1.0] * 8) == (32.0, 1.0)
+    assert mann_whitney_u([], [1.0]) == (0.0, 1.0)
+
+
+def test_compare_results_statuses():
+    fast = [0.100 + i * 0.001 for i in range(10)]
+    slow = [0.150 + i * 0.001 for i in range(10)]
+    slightly_slower = [x * 1.02 for x in fast]  # Significant, but below the threshold
+    baseline = _results(a=fast, b=slow, c=fast, d=fast)
+    current = _results(a=slow, b=fast, c=slightly_slower, e=fast)
+
+    rows = {row["benchmark"]: row for row in compare_results(baseline, current)}
+
+    assert rows["a"]["status"] == REGRESSED
+    assert rows["a"]["change"] == pytest.approx(0.1545 / 0.1045 - 1)
+    assert rows["b"]["status"] == IMPROVED
+    assert rows["c"]["status"] == UNCHANGED
+    assert rows["d"]["status"] == MISSING
+    assert rows["e"]["status"] == NEW
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    fast = [0.100 + i * 0.001 for i in range(10)]
+    slow = [0.150 + i * 0.001 for i in range(10)]
+    (tmp_path / "base.json").write_text(json.dumps(_results(parse=fast)))
+    (tmp_path / "slow.json").write_text(json.dumps(_results(parse=slow)))
+
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "slow.json")]) == 1
+    assert "regressed" in capsys.readouterr().out
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "base.json")]) == 0
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "missing.json")]) == 2
+
+
+def test_run_benchmarks_covers_every_benchmark(monkeypatch):
+    """All benchmarks run against a generated dataset; the app's settings are restored"""
+    monkeypatch.delenv("TEAM_INDEX_DB", raising=False)
+    tt_dir, snapshots_dir = file_ops.TT_TEAMS_DIR, snapshot_services.SNAPSHOTS_DIR
+
+    results = run_benchmarks([10], repeat=2, seed=1)
+
+    assert set(results["benchmarks"]) == {f"{bench.name}@10" for bench in BENCHMARKS}
+    for result in results["benchmarks"].values():
+        assert len(result["samples"]) == 2
+        assert result["min"] <= result["median"] <= result["max"]
+    assert results["settings"] == {"sizes": [10], "repeat": 2, "seed": 1}
+    assert "TEAM_INDEX_DB" not in os.environ
+    assert (file_ops.TT_TEAMS_DIR, snapshot_services.SNAPSHOTS_DIR) == (tt_dir, snapshots_dir)
+
+
+def test_run_command_writes_results(tmp_path):
+    output = tmp_path / "results" / "run.json"
+    assert main(["run", "--sizes", "10", "--repeat", "1", "--filter", "parse_team_file",
+                 "--output", str(output)]) == 0
+    assert list(json.loads(output.read_text())["benchmarks"]) == ["parse_team_file@10"]
+    assert main(["run", "--sizes", "10", "--filter", "no-such-benchmark"]) == 2
@@ -476,3 +476,82 @@ class TestCompareSnapshots:
 
         # Should detect as moved (100 pixels in both directions)
         assert len(result["changes"]["moved_teams"]) == 1
+
+
+class TestExtendedChanges:
+    """Test dependency, interaction, grouping and metadata changes"""
+
+    @staticmethod
+    def _team(name: str, **fields) -> SnapshotTeamCondensed:
+        return SnapshotTeamCondensed(name=name, team_type="stream-aligned", position={"x": 0, "y": 0}, **fields)
+
+    def _compare(self, before_teams, after_teams):
+        return compare_snapshots(
+            create_test_snapshot("before", "Before", before_teams),
+            create_test_snapshot("after", "After", after_teams),
+        )["changes"]
+
+    def test_dependency_edges(self):
+        """Should report added and removed dependency edges, including those of added/removed teams"""
+        changes = self._compare(
+            [self._team("A", dependencies=["B", "C"]), self._team("Gone", dependencies=["A"])],
+            [self._team("A", dependencies=["C", "D"]), self._team("New", dependencies=["A"])],
+        )
+
+        assert changes["dependency_changes"]["added"] == [{"from": "New", "to": "A"}, {"from": "A", "to": "D"}]
+        assert changes["dependency_changes"]["removed"] == [{"from": "Gone", "to": "A"}, {"from": "A", "to": "B"}]
+        assert changes["summary"]["dependencies_added_count"] == 2
+        assert changes["summary"]["dependencies_removed_count"] == 2
+
+    def test_interaction_mode_changes(self):
+        """Should report each interaction edge whose mode was added, removed or changed"""
+        changes = self._compare(
+            [self._team("A", interaction_modes={"B": "collaboration", "C": "facilitating", "D": "x-as-a-service"})],
+            [self._team("A", interaction_modes={"B": "x-as-a-service", "C": "facilitating", "E": "collaboration"})],
+        )
+
+        assert changes["interaction_changes"] == [
+            {"from": "A", "to": "B", "before": "collaboration", "after": "x-as-a-service"},
+            {"from": "A", "to": "D", "before": "x-as-a-service", "after": None},
+            {"from": "A", "to": "E", "before": None, "after": "collaboration"},
+        ]
+        assert changes["summary"]["interaction_changed_count"] == 3
+
+    def test_grouping_moves(self):
+        """Should report value stream, platform grouping and inner grouping moves"""
+        changes = self._compare(
+            [self._team("A", value_stream="Retail", value_stream_inner="Checkout")],
+            [self._team("A", value_stream="Wholesale", platform_grouping="Data Platform")],
+        )
+
+        assert changes["grouping_changes"] == [
+            {"name": "A", "field": "value_stream", "before": "Retail", "after": "Wholesale"},
+            {"name": "A", "field": "platform_grouping", "before": None, "after": "Data Platform"},
+            {"name": "A", "field": "value_stream_inner", "before": "Checkout", "after": None},
+        ]
+
+    def test_metadata_changes(self):
+        """Should report size and cognitive load changes"""
+        changes = self._compare(
+            [self._team("A", metadata={"size": 5, "cognitive_load": "low"})],
+            [self._team("A", metadata={"size": 8, "cognitive_load": "low"})],
+        )
+
+        assert changes["metadata_changes"] == [{"name": "A", "field": "size", "before": 5, "after": 8}]
+        assert changes["summary"]["metadata_changed_count"] == 1
+
+    def test_unchanged_teams_are_skipped(self, monkeypatch):
+        """Equal teams should not be compared field by field"""
+        import backend.comparison as comparison
+
+        compared = []
+        original = comparison._interaction_edges
+        monkeypatch.setattr(comparison, "_interaction_edges", lambda team: compared.append(team.name) or original(team))
+
+        changes = self._compare(
+            [self._team("A", dependencies=["B"]), self._team("B")],
+            [self._team("A", dependencies=["B"]), self._team("B", metadata={"size": 6})],
+        )
+
+        assert compared == ["B", "B"]
+        assert changes["dependency_changes"] == {"added": [], "removed": []}
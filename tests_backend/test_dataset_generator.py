@@ -0,0 +1,115 @@
+"""Tests for the synthetic dataset generator (python -m backend.dataset_generator)"""
+import json
+
+import pytest
+
+from backend import snapshot_services
+from backend.constants import OrganizationTypes
+from backend.dataset_generator import MAX_TEAMS, NAME_CAPACITY, generate_dataset, main, team_names
+from backend.services import file_ops, find_all_teams
+from backend.validation import (
+    clear_validation_cache,
+    iter_team_file_validation,
+    validate_all_config_files,
+)
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    out_dir = tmp_path_factory.mktemp("dataset")
+    generate_dataset(out_dir, teams=60, seed=7, snapshots=2)
+    return out_dir
+
+
+def _file_issues(view, data_dir):
+    clear_validation_cache()
+    events = list(iter_team_file_validation(view, workers=1, data_dir=data_dir))
+    clear_validation_cache()
+    return [event for event in events if event["event"] == "file"]
+
+
+@pytest.mark.parametrize("view,folder", [("tt", "tt-teams"), ("baseline", "baseline-teams")])
+def test_generated_dataset_is_valid(dataset, view, folder):
+    """Config files match the schemas, team files have no errors and all references resolve"""
+    assert validate_all_config_files(view, dataset / folder)["total_errors"] == 0
+
+    files = _file_issues(view, dataset / folder)
+    assert len(files) >= 60
+    assert not [error for event in files for error in event["errors"]]
+    # Only team size warnings (sizes deliberately include some outliers)
+    warnings = [warning for event in files for warning in event["warnings"]]
+    assert all("outside recommended range" in warning for warning in warnings), warnings
+
+
+def test_generated_teams_parse_with_dependencies_and_interactions(dataset, monkeypatch):
+    """Interaction tables and dependency bullets are picked up by the parser"""
+    monkeypatch.setattr(file_ops, "TT_TEAMS_DIR", dataset / "tt-teams")
+    monkeypatch.setattr(file_ops, "BASELINE_TEAMS_DIR", dataset / "baseline-teams")
+
+    tt_teams = find_all_teams("tt")
+    assert len(tt_teams) == 60
+    assert any(team.interaction_modes for team in tt_teams)
+
+    baseline_teams = [t for t in find_all_teams("baseline")
+                      if t.team_type not in (*OrganizationTypes.ALL, "executive")]
+    assert len(baseline_teams) == 60
+    assert all(team.dependencies for team in baseline_teams)
+
+    hierarchy = json.loads((dataset / "baseline-teams" / "organization-hierarchy.json").read_text())
+    line_manager_teams = {
+        name
+        for department in hierarchy["company"]["children"]
+        for line_manager in department["line_managers"]
+        for name in line_manager["teams"]
+    }
+    assert line_manager_teams == {team.name for team in baseline_teams}
+
+
+def test_snapshots_follow_the_evolving_design(dataset):
+    """Each snapshot is stored in the dataset; later snapshots see the changed teams"""
+    snapshot_files = sorted((dataset / "tt-snapshots").glob("synthetic-design-*.json"))
+    assert len(snapshot_files) == 2
+    # The app's own directories are restored afterwards
+    assert snapshot_services.SNAPSHOTS_DIR == file_ops.DATA_DIR / "tt-snapshots"
+
+    before, after = (json.loads(path.read_text()) for path in snapshot_files)
+    assert before["name"] == "Synthetic design v1"
+    assert len(before["team_refs"]) == len(after["team_refs"]) == 60
+    assert before["team_refs"] != after["team_refs"]
+
+
+def test_same_seed_same_dataset(tmp_path):
+    """Team and config files depend only on --teams, --seed and --snapshots"""
+    for name, seed in (("a", 1), ("b", 1), ("c", 2)):
+        generate_dataset(tmp_path / name, teams=20, seed=seed, snapshots=0)
+
+    def contents(root):
+        return {path.relative_to(root): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+    assert contents(tmp_path / "a") == contents(tmp_path / "b")
+    assert contents(tmp_path / "a") != contents(tmp_path / "c")
+
+
+def test_team_names_are_unique_at_scale():
+    import random
+
+    names = team_names(random.Random(0), MAX_TEAMS)
+    assert len(set(names)) == MAX_TEAMS
+
+    with pytest.raises(ValueError, match="unique team names"):
+        team_names(random.Random(0), NAME_CAPACITY + 1)
+
+
+def test_cli_refuses_to_overwrite_without_force(tmp_path, capsys):
+    assert main([str(tmp_path), "--teams", "10", "--snapshots", "0"]) == 0
+    assert main([str(tmp_path), "--teams", "10", "--snapshots", "0"]) == 2
+    assert "--force" in capsys.readouterr().err
+    assert main([str(tmp_path), "--teams", "12", "--snapshots", "0", "--force"]) == 0
+    assert len(list((tmp_path / "tt-teams").glob("*.md"))) == 12
+    assert len(list((tmp_path / "baseline-teams").rglob("*-team.md"))) == 12
+    assert "Wrote 12 baseline teams, 12 TT teams" in capsys.readouterr().out
+
+
+def test_cli_rejects_out_of_range_team_count(tmp_path):
+    assert main([str(tmp_path), "--teams", "5"]) == 2
+    assert not (tmp_path / "tt-teams").exists()
@@ -0,0 +1,135 @@
+"""Tests for the background job manager and job routes"""
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.jobs import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    JobManager,
+    JobQueueFullError,
+)
+from main import app
+
+client = TestClient(app)
+
+
+def _wait(manager: JobManager, job_id: str, timeout: float = 10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.get(job_id)
+        if job.finished_at is not None:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def _wait_for_route(job_id: str, timeout: float = 30) -> dict:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        data = client.get(f"/api/jobs/{job_id}").json()
+        if data["finished_at"] is not None:
+            return data
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+class TestJobManager:
+    """Tests for JobManager"""
+
+    def test_job_reports_progress_and_result(self):
+        manager = JobManager(workers=1)
+
+        def work(progress):
+            for i in range(3):
+                progress(i + 1, 3)
+            return {"answer": 42}
+
+        job = manager.submit("test", work)
+        finished = _wait(manager, job.job_id)
+
+        assert finished.status == JOB_SUCCEEDED
+        assert finished.result == {"answer": 42}
+        assert (finished.done, finished.total) == (3, 3)
+        manager.shutdown()
+
+    def test_failed_job_records_error(self):
+        manager = JobManager(workers=1)
+
+        def work(progress):
+            raise ValueError("boom")
+
+        finished = _wait(manager, manager.submit("test", work).job_id)
+
+        assert finished.status == JOB_FAILED
+        assert finished.error == "boom"
+        manager.shutdown()
+
+    def test_submissions_beyond_max_pending_are_refused(self):
+        manager = JobManager(workers=1, max_pending=2)
+        release = threading.Event()
+        manager.submit("test", lambda progress: release.wait())
+        manager.submit("test", lambda progress: release.wait())
+
+        with pytest.raises(JobQueueFullError):
+            manager.submit("test", lambda progress: None)
+
+        release.set()
+        manager.shutdown()
+
+    def test_finished_jobs_expire_after_ttl(self):
+        manager = JobManager(workers=1, ttl_seconds=60)
+        job = _wait(manager, manager.submit("test", lambda progress: None).job_id)
+
+        job.finished_at -= 61
+        assert manager.get(job.job_id) is None
+        assert manager.list_jobs() == []
+        manager.shutdown()
+
+
+class TestJobRoutes:
+    """Tests for job submission and /api/jobs endpoints"""
+
+    def test_unknown_job_returns_404(self):
+        response = client.get("/api/jobs/does-not-exist")
+        assert response.status_code == 404
+
+    def test_validation_job_matches_validate_response(self):
+        response = client.post("/api/tt/validate/jobs")
+        assert response.status_code == 202
+        job = response.json()
+        assert job["kind"] == "validate-tt"
+
+        finished = _wait_for_route(job["job_id"])
+
+        assert finished["status"] == JOB_SUCCEEDED
+        expected = client.get("/api/tt/validate").json()
+        assert finished["result"]["teams"]["total_files"] == expected["teams"]["total_files"]
+        assert finished["result"]["team_schema"] == "tt-team-file"
+        assert finished["progress"] == {"done": expected["teams"]["total_files"], "total": expected["teams"]["total_files"]}
+        assert job["job_id"] in [j["job_id"] for j in client.get("/api/jobs").json()]
+
+    def test_validation_job_rejects_unknown_profile(self):
+        response = client.post("/api/baseline/validate/jobs?profile=bogus")
+        assert response.status_code == 400
+
+    def test_snapshot_job_creates_snapshot(self, tmp_path, monkeypatch):
+        import backend.snapshot_services as snapshot_services
+
+        monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+        response = client.post("/api/tt/snapshots/jobs", json={"name": "Job Snapshot", "team_names": []})
+        assert response.status_code == 202
+
+        finished = _wait_for_route(response.json()["job_id"])
+
+        assert finished["status"] == JOB_SUCCEEDED
+        assert finished["result"]["name"] == "Job Snapshot"
+        assert "teams" not in finished["result"]
+        assert (tmp_path / f"{finished['result']['snapshot_id']}.json").exists()
+
+    def test_snapshot_job_blocked_in_read_only_mode(self, monkeypatch):
+        monkeypatch.setenv("READ_ONLY_MODE", "true")
+        response = client.post("/api/tt/snapshots/jobs", json={"name": "Blocked"})
+        assert response.status_code == 403
@@ -0,0 +1,76 @@
+"""Tests for the load-testing harness (python -m backend.loadtest)"""
+import asyncio
+
+import httpx
+import pytest
+
+from backend.dataset_generator import generate_dataset, use_dataset
+from backend.loadtest import Recorder, local_server, main, percentile, run_load
+from main import app
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("loadtest") / "data"
+    generate_dataset(data_dir, teams=20, seed=3, snapshots=1)
+    return data_dir
+
+
+def test_percentile_interpolates():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == pytest.approx(4.8)
+    assert percentile(values, 100) == 5.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_recorder_report_counts_errors_per_route():
+    recorder = Recorder()
+    for latency in (0.010, 0.020, 0.030, 0.040):
+        recorder.record("GET /api/tt/teams", latency, 200)
+    recorder.record("GET /api/tt/teams/{team_id}", 0.005, 404)
+    recorder.record("GET /api/tt/teams/{team_id}", 0.100, "ReadTimeout")
+    recorder.record("GET /api/tt/teams/{team_id}", 0.002, 200)
+    recorder.record("GET /api/tt/teams/{team_id}", 0.003, 200)
+
+    report = recorder.report(duration=2.0)
+
+    assert report["requests"] == 8
+    assert report["errors"] == 2
+    assert report["throughput_rps"] == 4.0
+    teams = report["routes"]["GET /api/tt/teams"]
+    assert teams["p50_ms"] == pytest.approx(25.0)
+    assert teams["max_ms"] == pytest.approx(40.0)
+    assert teams["error_rate"] == 0
+    team = report["routes"]["GET /api/tt/teams/{team_id}"]
+    assert team["error_rate"] == 0.5
+    assert team["statuses"] == {"200": 2, "404": 1, "ReadTimeout": 1}
+
+
+def test_run_load_mixed_workload(dataset):
+    """Planners run the mixed workload in-process without errors"""
+    with use_dataset(dataset):
+        report = asyncio.run(run_load(
+            "http://testserver", users=4, duration=1.5, think_time=0, seed=1,
+            transport=httpx.ASGITransport(app=app),
+        ))
+
+    assert report["users"] == 4
+    assert report["requests"] > 0
+    assert report["errors"] == 0, report["routes"]
+    routes = set(report["routes"])
+    assert {"GET /api/tt/teams/{team_id}", "PATCH /api/tt/teams/{team_id}/position"} & routes
+    assert all(route.split()[1].startswith("/api/") for route in routes)
+
+
+def test_local_server_serves_the_dataset(dataset):
+    with local_server(dataset) as base_url:
+        response = httpx.get(f"{base_url}/api/tt/teams", timeout=30)
+    assert response.status_code == 200
+    assert len(response.json()) == 20
+
+
+def test_cli_rejects_invalid_arguments(tmp_path):
+    assert main(["--users", "0"]) == 2
+    assert main(["--data-dir", str(tmp_path / "missing")]) == 2
@@ -0,0 +1,150 @@
+"""Tests for file locking and atomic writes"""
+import stat
+import threading
+import time
+
+import pytest
+import yaml
+
+from backend.services import file_ops, locking, update_position_in_file
+from backend.services.locking import (
+    atomic_write_bytes,
+    atomic_write_text,
+    file_lock,
+    lock_stats,
+    reset_lock_stats,
+)
+
+TEAM_FILE = """---
+name: Locked Team
+team_type: stream-aligned
+position:
+  x: 0
+  y: 0
+---
+
+# Locked Team
+
+Body text --- with dashes.
+"""
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    target = tmp_path / "data.json"
+    atomic_write_text(target, "old")
+    atomic_write_text(target, "new")
+
+    assert target.read_text(encoding="utf-8") == "new"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_atomic_write_keeps_file_mode(tmp_path):
+    target = tmp_path / "team.md"
+    atomic_write_text(target, "old")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    target.chmod(0o664)
+    atomic_write_text(target, "new")
+    assert stat.S_IMODE(target.stat().st_mode) == 0o664
+
+
+def test_atomic_write_follows_symlinks(tmp_path):
+    """Writing through a symlink should replace the target file and keep the link"""
+    (tmp_path / "shared").mkdir()
+    target = tmp_path / "shared" / "team.md"
+    target.write_text("old", encoding="utf-8")
+    link = tmp_path / "team.md"
+    link.symlink_to(target)
+
+    atomic_write_text(link, "new")
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "new"
+    assert sorted(p.name for p in (tmp_path / "shared").iterdir()) == ["team.md"]
+
+
+def test_failed_atomic_write_keeps_old_file(tmp_path, monkeypatch):
+    """A write that fails before the rename should leave the old content and no temp file"""
+    target = tmp_path / "data.json"
+    atomic_write_text(target, "old")
+
+    def failing_fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(locking.os, "fsync", failing_fsync)
+    with pytest.raises(OSError, match="disk full"):
+        atomic_write_bytes(target, b"new")
+
+    assert target.read_text(encoding="utf-8") == "old"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+@pytest.mark.skipif(locking.fcntl is None, reason="file_lock is a no-op without fcntl")
+def test_file_lock_is_exclusive(tmp_path):
+    lock_path = tmp_path / ".lock"
+    inside = []
+    overlaps = []
+
+    def worker():
+        with file_lock(lock_path):
+            inside.append(1)
+            if len(inside) > 1:
+                overlaps.append(len(inside))
+            time.sleep(0.01)
+            inside.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == []
+    assert lock_path.exists()
+
+
+@pytest.mark.skipif(locking.fcntl is None, reason="file_lock is a no-op without fcntl")
+def test_lock_contention_is_counted(tmp_path):
+    reset_lock_stats()
+    lock_path = tmp_path / ".lock"
+    holding = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with file_lock(lock_path, "test"):
+            holding.set()
+            release.wait()
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    holding.wait()
+    threading.Timer(0.05, release.set).start()
+    with file_lock(lock_path, "test"):
+        pass
+    thread.join()
+
+    stats = lock_stats()["test"]
+    assert stats["acquired"] == 2
+    assert stats["contended"] == 1
+    assert stats["max_wait_seconds"] > 0
+
+
+def test_concurrent_position_updates_keep_file_valid(tmp_path, monkeypatch):
+    """Concurrent read-modify-write updates must not interleave and corrupt the front matter"""
+    monkeypatch.setattr(file_ops, "TEAM_LOCK_DIR", tmp_path / "locks")
+    team_file = tmp_path / "locked-team.md"
+    team_file.write_text(TEAM_FILE, encoding="utf-8")
+
+    threads = [threading.Thread(target=update_position_in_file, args=(team_file, i, i * 2)) for i in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    content = team_file.read_text(encoding="utf-8")
+    _, front_matter, body = content.split("---", 2)
+    data = yaml.safe_load(front_matter)
+    assert data["name"] == "Locked Team"
+    assert data["position"]["y"] == data["position"]["x"] * 2
+    assert body == TEAM_FILE.split("---", 2)[2]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["locked-team.md", "locks"]
@@ -0,0 +1,99 @@
+"""Tests for the metrics registry and /api/metrics"""
+from fastapi.testclient import TestClient
+
+from backend import metrics
+from backend.metrics import Counter, Histogram
+from main import app
+
+client = TestClient(app)
+
+
+def _sample(text: str, prefix: str) -> float:
+    """Value of the first exposition line starting with prefix"""
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample {prefix}")
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "Test", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, op="read")
+
+    assert histogram.samples() == [
+        ("_bucket", {"op": "read", "le": "0.1"}, 2),
+        ("_bucket", {"op": "read", "le": "1"}, 3),
+        ("_bucket", {"op": "read", "le": "+Inf"}, 4),
+        ("_count", {"op": "read"}, 4),
+        ("_sum", {"op": "read"}, 3.65),
+    ]
+
+
+def test_counter_labels_and_unlabelled_zero():
+    labelled = Counter("test_total", "Test", ("cache",))
+    labelled.inc(cache="a")
+    labelled.inc(2, cache="a")
+
+    assert labelled.value(cache="a") == 3
+    assert labelled.samples() == [("", {"cache": "a"}, 3)]
+    assert Counter("plain_total", "Test").samples() == [("", {}, 0)]
+
+
+def test_metrics_endpoint_reports_route_templates():
+    client.get("/api/tt/teams/does-not-exist")
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'route="/api/tt/teams/{team_id}",status="404"' in response.text
+    assert "does-not-exist" not in response.text
+
+
+def test_parsing_and_validation_are_counted():
+    before = client.get("/api/metrics").text
+    validations = metrics.VALIDATION_DURATION.count(view="tt", profile="full")
+    client.get("/api/tt/validate")
+    client.get("/api/tt/teams")
+    after = client.get("/api/metrics").text
+
+    assert _sample(after, "team_files_parsed_total") > _sample(before, "team_files_parsed_total")
+    assert metrics.VALIDATION_DURATION.count(view="tt", profile="full") == validations + 1
+    assert 'validation_duration_seconds_count{view="tt",profile="full"}' in after
+    assert 'cache_requests_total{cache="validation",result=' in after
+
+
+def test_parse_errors_are_counted(tmp_path):
+    from backend.services import parse_team_file
+
+    bad_file = tmp_path / "bad.md"
+    bad_file.write_text("no front matter", encoding="utf-8")
+    errors = metrics.PARSE_ERRORS.value()
+
+    try:
+        parse_team_file(bad_file)
+    except ValueError:
+        pass
+
+    assert metrics.PARSE_ERRORS.value() == errors + 1
+
+
+def test_snapshot_io_and_cache_are_counted(tmp_path, monkeypatch):
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    snapshot_services.clear_snapshot_caches()
+    written = metrics.SNAPSHOT_IO_BYTES.value(direction="write")
+    read = metrics.SNAPSHOT_IO_BYTES.value(direction="read")
+    hits = metrics.CACHE_REQUESTS.value(cache="snapshot", result="hit")
+    misses = metrics.CACHE_REQUESTS.value(cache="snapshot", result="miss")
+
+    created = snapshot_services.create_snapshot(name="Metrics")
+    snapshot_services.load_snapshot(created.snapshot_id)
+    snapshot_services.load_snapshot(created.snapshot_id)
+
+    assert metrics.SNAPSHOT_IO_BYTES.value(direction="write") > written
+    assert metrics.SNAPSHOT_IO_BYTES.value(direction="read") > read
+    assert metrics.CACHE_REQUESTS.value(cache="snapshot", result="miss") == misses + 1
+    assert metrics.CACHE_REQUESTS.value(cache="snapshot", result="hit") == hits + 1
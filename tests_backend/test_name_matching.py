@@ -0,0 +1,58 @@
+"""Tests for the fuzzy team name index (name_matching.py)"""
+import random
+import string
+
+from backend.name_matching import TrigramIndex, levenshtein
+
+
+class TestLevenshtein:
+    """Tests for the edit distance function"""
+
+    def test_distances(self):
+        """Should count insertions, deletions and substitutions"""
+        assert levenshtein("", "") == 0
+        assert levenshtein("team", "team") == 0
+        assert levenshtein("team", "") == 4
+        assert levenshtein("kitten", "sitting") == 3
+        assert levenshtein("platfrom", "platform") == 2
+
+    def test_max_distance_stops_early(self):
+        """Distances beyond max_distance should be reported as max_distance + 1"""
+        assert levenshtein("kitten", "sitting", max_distance=1) == 2
+        assert levenshtein("a", "abcdef", max_distance=2) == 3
+        assert levenshtein("kitten", "sitting", max_distance=3) == 3
+
+
+class TestTrigramIndex:
+    """Tests for TrigramIndex search"""
+
+    def test_search_returns_closest_first(self):
+        """Should return values within the distance, closest first"""
+        tree = TrigramIndex()
+        for term in ["platform", "payments", "mobile", "platforms"]:
+            tree.add(term, term.title())
+
+        assert tree.search("platfrom", 2) == [(2, "Platform")]
+        assert tree.search("platform", 1) == [(0, "Platform"), (1, "Platforms")]
+        assert tree.search("zzz", 1) == []
+
+    def test_terms_sharing_a_value_report_best_distance(self):
+        """A value indexed under several terms (name and slug) should appear once"""
+        tree = TrigramIndex()
+        tree.add("platform team", "Platform Team")
+        tree.add("platform-team", "Platform Team")
+
+        assert tree.search("platform-tean", 2) == [(1, "Platform Team")]
+
+    def test_matches_linear_scan(self):
+        """Search results should equal a brute-force scan over all terms"""
+        rng = random.Random(42)
+        terms = {"".join(rng.choices(string.ascii_lowercase[:6], k=rng.randint(3, 9))) for _ in range(400)}
+        tree = TrigramIndex()
+        for term in terms:
+            tree.add(term, term)
+
+        for _ in range(50):
+            query = "".join(rng.choices(string.ascii_lowercase[:6], k=rng.randint(3, 9)))
+            expected = sorted((levenshtein(query, t), t) for t in terms if levenshtein(query, t) <= 2)
+            assert tree.search(query, 2) == expected
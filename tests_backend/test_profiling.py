@@ -0,0 +1,83 @@
+"""Tests for opt-in request profiling"""
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    monkeypatch.delenv("PROFILE_REQUESTS", raising=False)
+    monkeypatch.delenv("PROFILE_ADMIN_TOKEN", raising=False)
+    return tmp_path
+
+
+def test_requests_are_not_profiled_by_default(profile_dir):
+    response = client.get("/api/tt/teams", headers={"X-Profile": "1"})
+
+    assert "x-profile-id" not in response.headers
+    assert list(profile_dir.iterdir()) == []
+
+
+def test_profile_all_requests_with_env(profile_dir, monkeypatch):
+    from backend.validation import clear_validation_cache
+
+    monkeypatch.setenv("PROFILE_REQUESTS", "true")
+    clear_validation_cache()  # Make the request do real work
+
+    response = client.get("/api/tt/validate")
+    profile_id = response.headers["x-profile-id"]
+
+    profiles = client.get("/api/profiles").json()
+    assert profiles[0]["profile_id"] == profile_id
+    assert profiles[0]["route"] == "/api/tt/validate"
+    assert profiles[0]["status"] == 200
+    assert profiles[0]["samples"] > 0
+
+    download = client.get(f"/api/profiles/{profile_id}")
+    assert download.status_code == 200
+    lines = download.text.splitlines()
+    assert len(lines) > 0
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "validate_files" in download.text
+
+
+def test_admin_header_opts_in_single_request(profile_dir, monkeypatch):
+    monkeypatch.setenv("PROFILE_ADMIN_TOKEN", "secret")
+
+    assert "x-profile-id" not in client.get(
+        "/api/tt/teams", headers={"X-Profile": "1", "X-Admin-Token": "wrong"}).headers
+    assert "x-profile-id" not in client.get("/api/tt/teams").headers
+    response = client.get("/api/tt/teams", headers={"X-Profile": "1", "X-Admin-Token": "secret"})
+    assert "x-profile-id" in response.headers
+
+    assert client.get("/api/profiles").status_code == 403
+    profiles = client.get("/api/profiles", headers={"X-Admin-Token": "secret"}).json()
+    assert [p["profile_id"] for p in profiles] == [response.headers["x-profile-id"]]
+
+
+def test_profiles_endpoints_disabled_without_profiling(profile_dir):
+    assert client.get("/api/profiles").status_code == 403
+
+
+def test_unknown_or_path_like_profile_ids_return_404(profile_dir, monkeypatch):
+    monkeypatch.setenv("PROFILE_REQUESTS", "true")
+    (profile_dir.parent / "secret.collapsed").write_text("x 1\n", encoding="utf-8")
+
+    assert client.get("/api/profiles/missing").status_code == 404
+    assert client.get("/api/profiles/..%2Fsecret").status_code == 404
+
+
+def test_old_profiles_are_pruned(profile_dir, monkeypatch):
+    monkeypatch.setenv("PROFILE_REQUESTS", "true")
+    monkeypatch.setenv("PROFILE_KEEP", "2")
+
+    for _ in range(4):
+        client.get("/api/config")
+
+    assert len(list(profile_dir.glob("*.collapsed"))) == 2
+    assert len(client.get("/api/profiles").json()) == 2
@@ -1,5 +1,6 @@
 """Tests for TT-Design API routes"""
 
+import pytest
 from fastapi.testclient import TestClient
 
 from main import app
@@ -203,3 +204,132 @@ class TestTTValidateEndpoint:
         assert "issues" in teams_report
         assert isinstance(teams_report["total_files"], int)
         assert isinstance(teams_report["issues"], list)
+
+    def test_validate_fast_profile_with_timings(self):
+        """Should honour profile and timings query parameters"""
+        response = client.get("/api/tt/validate?profile=fast&timings=true")
+        assert response.status_code == 200
+
+        teams_report = response.json()["teams"]
+        assert teams_report["profile"] == "fast"
+        assert "rules" in teams_report["rule_timings"]
+
+    def test_validate_unknown_profile_returns_400(self):
+        """Should reject unknown validation profiles"""
+        assert client.get("/api/tt/validate?profile=bogus").status_code == 400
+        assert client.get("/api/tt/validate/stream?profile=bogus").status_code == 400
+
+
+class TestTTValidateStreamEndpoint:
+    """Tests for /api/tt/validate/stream endpoint"""
+
+    @staticmethod
+    def _parse_events(body: str) -> list[tuple[str, dict]]:
+        """Parse an SSE body into (event, data) tuples"""
+        import json
+
+        events = []
+        for message in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in message.split("\n"))
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    def test_stream_returns_event_stream(self):
+        """Should respond with text/event-stream"""
+        response = client.get("/api/tt/validate/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+    def test_stream_matches_validate_report(self):
+        """Streamed issues and summary should match the non-streaming report"""
+        report = client.get("/api/tt/validate").json()
+        events = self._parse_events(client.get("/api/tt/validate/stream").text)
+
+        assert events[0][0] == "start"
+        assert events[-1][0] == "summary"
+
+        issues = [
+            {"file": data["file"], "errors": data["errors"], "warnings": data["warnings"]}
+            for name, data in events if name == "issue"
+        ]
+        summary = events[-1][1]
+        assert issues == report["teams"]["issues"]
+        assert summary["teams"]["total_files"] == report["teams"]["total_files"]
+        assert summary["team_schema"] == "tt-team-file"
+        assert "config_files" in summary
+
+
+class TestTTSnapshotTeamEndpoint:
+    """Tests for /api/tt/snapshots/{snapshot_id}/teams/{team_name} endpoint"""
+
+    def test_get_snapshot_team(self):
+        """Should return one team from a stored snapshot"""
+        from backend.snapshot_services import list_snapshots, load_snapshot
+
+        snapshots = [s for s in list_snapshots() if s.statistics.total_teams > 0]
+        if not snapshots:
+            pytest.skip("No snapshots with teams in data/tt-snapshots")
+        snapshot = load_snapshot(snapshots[0].snapshot_id)
+        team = snapshot.teams[0]
+
+        response = client.get(f"/api/tt/snapshots/{snapshot.snapshot_id}/teams/{team.name}")
+
+        assert response.status_code == 200
+        assert response.json()["name"] == team.name
+
+    def test_get_unknown_snapshot_team_returns_404(self):
+        """Should return 404 for unknown snapshots and teams"""
+        from backend.snapshot_services import list_snapshots
+
+        assert client.get("/api/tt/snapshots/nonexistent-snapshot-12345/teams/Any Team").status_code == 404
+        snapshots = list_snapshots()
+        if snapshots:
+            response = client.get(f"/api/tt/snapshots/{snapshots[0].snapshot_id}/teams/No Such Team")
+            assert response.status_code == 404
+
+
+class TestTTCompareWithLiveEndpoint:
+    """Tests for /api/tt/snapshots/compare/{before_id}/live endpoint"""
+
+    def test_compare_with_live(self):
+        """Should diff a stored snapshot against the current design without saving one"""
+        from backend.snapshot_services import SNAPSHOTS_DIR, list_snapshots
+
+        snapshots = list_snapshots()
+        if not snapshots:
+            pytest.skip("No snapshots in data/tt-snapshots")
+        before_count = len(list(SNAPSHOTS_DIR.glob("*.json")))
+
+        response = client.get(f"/api/tt/snapshots/compare/{snapshots[0].snapshot_id}/live")
+
+        assert response.status_code == 200
+        comparison = response.json()
+        assert comparison["after_snapshot"]["id"] == "live"
+        assert "summary" in comparison["changes"]
+        assert len(list(SNAPSHOTS_DIR.glob("*.json"))) == before_count
+
+    def test_compare_unknown_snapshot_with_live_returns_404(self):
+        """Should return 404 for an unknown snapshot"""
+        response = client.get("/api/tt/snapshots/compare/nonexistent-snapshot-12345/live")
+        assert response.status_code == 404
+
+
+class TestTTSnapshotTimelineEndpoint:
+    """Tests for /api/tt/snapshots/timeline endpoint"""
+
+    def test_timeline_all_snapshots(self):
+        """Should return a series point per snapshot and one step fewer"""
+        response = client.get("/api/tt/snapshots/timeline?ids=all")
+        assert response.status_code == 200
+
+        timeline = response.json()
+        assert len(timeline["steps"]) == max(len(timeline["series"]) - 1, 0)
+
+    def test_timeline_unknown_snapshot_returns_404(self):
+        """Should return 404 when a snapshot id doesn't exist"""
+        response = client.get("/api/tt/snapshots/timeline?ids=nonexistent-snapshot-12345")
+        assert response.status_code == 404
+
+    def test_timeline_empty_ids_returns_400(self):
+        """Should reject an empty id list"""
+        assert client.get("/api/tt/snapshots/timeline?ids=,").status_code == 400
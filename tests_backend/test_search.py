@@ -0,0 +1,117 @@
+"""Tests for full-text team search"""
+from fastapi.testclient import TestClient
+
+from backend.search import SearchIndex, search_teams, tokenize
+from main import app
+
+client = TestClient(app)
+
+TEAM_FILE = """---
+team_id: {team_id}
+name: {name}
+team_type: stream-aligned
+team_api:
+  purpose: {purpose}
+  services_provided:
+    - {service}
+software_owned:
+  - {software}
+team_members:
+  - {member}
+---
+
+# {name}
+
+{body}
+"""
+
+
+def _write_team(directory, team_id, name, purpose="Unknown", service="Support", software="Tools", member="Staff",
+                body=""):
+    path = directory / f"{team_id}.md"
+    path.write_text(TEAM_FILE.format(team_id=team_id, name=name, purpose=purpose, service=service,
+                                     software=software, member=member, body=body), encoding="utf-8")
+    return path
+
+
+def test_tokenize_lowercases_and_strips_plurals():
+    assert tokenize("Owns Payments, reconciliation & APIs!") == ["own", "payment", "reconciliation", "api"]
+    assert tokenize("class access") == ["class", "access"]
+
+
+def test_search_ranks_name_and_purpose_above_passing_mentions(tmp_path):
+    _write_team(tmp_path, "ledger", "Ledger Team", purpose="Owns payments reconciliation",
+                body="Keeps the books balanced.")
+    _write_team(tmp_path, "checkout", "Checkout Team", purpose="Runs checkout",
+                body="We call the payment service once per order.")
+    _write_team(tmp_path, "search", "Search Team", purpose="Product search")
+    index = SearchIndex(tmp_path)
+    index.sync()
+
+    result = index.search("payments reconciliation")
+
+    assert result["total"] == 2
+    assert [hit["team_id"] for hit in result["hits"]] == ["ledger", "checkout"]
+    assert result["hits"][0]["matched_terms"] == ["payment", "reconciliation"]
+    assert result["hits"][0]["field"] == "purpose"
+    assert result["hits"][1]["snippet"] == "Checkout Team We call the payment service once per order."
+
+
+def test_search_covers_services_software_and_members(tmp_path):
+    _write_team(tmp_path, "platform", "Platform Team", service="Kubernetes clusters",
+                software="deploy-bot", member="Ada Lovelace")
+    index = SearchIndex(tmp_path)
+    index.sync()
+
+    for query, field in [("kubernetes", "services_provided"), ("bot", "software_owned"), ("lovelace", "team_members")]:
+        hit = index.search(query)["hits"][0]
+        assert (hit["team_id"], hit["field"]) == ("platform", field)
+
+
+def test_index_updates_incrementally(tmp_path):
+    ledger = _write_team(tmp_path, "ledger", "Ledger Team", purpose="Owns reconciliation")
+    _write_team(tmp_path, "checkout", "Checkout Team")
+    index = SearchIndex(tmp_path)
+    assert index.sync() == 2
+    assert index.sync() == 0
+
+    _write_team(tmp_path, "checkout", "Checkout Team", purpose="Now also owns reconciliation reports")
+    assert index.sync() == 1
+    assert {hit["team_id"] for hit in index.search("reconciliation")["hits"]} == {"ledger", "checkout"}
+
+    ledger.unlink()
+    assert index.sync() == 1
+    assert [hit["team_id"] for hit in index.search("reconciliation")["hits"]] == ["checkout"]
+    assert len(index) == 1
+
+
+def test_search_teams_uses_view_directory(tmp_path, monkeypatch):
+    _write_team(tmp_path, "ledger", "Ledger Team", purpose="Owns reconciliation")
+    monkeypatch.setattr("backend.search.get_data_dir", lambda view: tmp_path)
+
+    assert search_teams("tt", "reconciliation")["hits"][0]["name"] == "Ledger Team"
+    assert search_teams("tt", "nothing matches this")["hits"] == []
+
+
+class TestSearchEndpoint:
+    """Tests for /api/{view}/search"""
+
+    def test_tt_search_returns_ranked_hits(self):
+        response = client.get("/api/tt/search", params={"q": "payment", "limit": 3})
+        assert response.status_code == 200
+        data = response.json()
+        assert 0 < len(data["hits"]) <= 3
+        scores = [hit["score"] for hit in data["hits"]]
+        assert scores == sorted(scores, reverse=True)
+        assert all("payment" in hit["matched_terms"] for hit in data["hits"])
+
+    def test_baseline_search(self):
+        response = client.get("/api/baseline/search", params={"q": "team"})
+        assert response.status_code == 200
+        assert response.json()["total"] > 0
+
+    def test_empty_query_returns_400(self):
+        assert client.get("/api/tt/search", params={"q": "  "}).status_code == 400
+
+    def test_invalid_limit_returns_400(self):
+        assert client.get("/api/tt/search", params={"q": "payment", "limit": 0}).status_code == 400
@@ -8,6 +8,7 @@ from backend.models import SnapshotMetadata, TeamData
 from backend.snapshot_services import (
     SNAPSHOTS_DIR,
     calculate_statistics,
+    collect_unreferenced_objects,
     condense_team_for_snapshot,
     create_snapshot,
     generate_snapshot_id,
@@ -28,6 +29,7 @@ def cleanup_snapshots():
     for pattern in patterns:
         for snapshot_file in SNAPSHOTS_DIR.glob(pattern):
             snapshot_file.unlink()
+    collect_unreferenced_objects()
 
 
 def test_generate_snapshot_id():
@@ -137,7 +139,7 @@ def test_create_snapshot():
     assert data["description"] == "Test description"
     assert data["author"] == "Test Author"
     assert "created_at" in data
-    assert len(data["teams"]) > 0
+    assert len(data["team_refs"]) == len(snapshot.teams)
     assert "statistics" in data
 
 
@@ -251,3 +253,420 @@ def test_snapshot_with_filtered_teams():
 
     # Verify it's less than total teams
     assert len(snapshot.teams) < len(all_teams)
+
+
+def test_list_snapshots_reads_manifest_not_snapshot_files(tmp_path, monkeypatch):
+    """Listing should answer from the manifest once it is up to date"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="Manifest Snapshot", team_names=[])
+    assert (tmp_path / snapshot_services.MANIFEST_FILE).exists()
+
+    def fail(_snapshot_file):
+        raise AssertionError("snapshot file should not be read")
+
+    monkeypatch.setattr(snapshot_services, "_read_snapshot_metadata", fail)
+    snapshots = list_snapshots()
+
+    assert [s.snapshot_id for s in snapshots] == [created.snapshot_id]
+    assert snapshots[0].statistics == created.statistics
+
+
+def test_list_snapshots_refreshes_stale_manifest(tmp_path, monkeypatch):
+    """Snapshots added, changed or removed behind the manifest's back should be picked up"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    first = create_snapshot(name="First", team_names=[])
+
+    # Copied in by hand (e.g. from another checkout)
+    data = json.loads((tmp_path / f"{first.snapshot_id}.json").read_text(encoding="utf-8"))
+    data.update(snapshot_id="copied-snapshot", name="Copied")
+    (tmp_path / "copied-snapshot.json").write_text(json.dumps(data), encoding="utf-8")
+    assert {s.name for s in list_snapshots()} == {"First", "Copied"}
+
+    # Edited in place, then removed
+    data["name"] = "Copied And Renamed"
+    (tmp_path / "copied-snapshot.json").write_text(json.dumps(data), encoding="utf-8")
+    assert {s.name for s in list_snapshots()} == {"First", "Copied And Renamed"}
+
+    (tmp_path / "copied-snapshot.json").unlink()
+    assert {s.name for s in list_snapshots()} == {"First"}
+    manifest = json.loads((tmp_path / snapshot_services.MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert list(manifest["snapshots"]) == [f"{first.snapshot_id}.json"]
+
+
+def test_list_snapshots_rebuilds_missing_or_corrupt_manifest(tmp_path, monkeypatch):
+    """A missing or corrupt manifest should be rebuilt from the snapshot files"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="Rebuild", team_names=[])
+    manifest_file = tmp_path / snapshot_services.MANIFEST_FILE
+
+    manifest_file.write_text("{ not json", encoding="utf-8")
+    assert [s.snapshot_id for s in list_snapshots()] == [created.snapshot_id]
+
+    manifest_file.unlink()
+    assert [s.snapshot_id for s in list_snapshots()] == [created.snapshot_id]
+    assert json.loads(manifest_file.read_text(encoding="utf-8"))["version"] == snapshot_services.MANIFEST_VERSION
+
+
+def test_list_snapshots_on_read_only_directory(tmp_path, monkeypatch):
+    """Listing still works when the manifest can't be repaired (lock file can't be created)"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="Read Only", team_names=[])
+    (tmp_path / snapshot_services.MANIFEST_FILE).unlink()
+
+    def read_only_lock(*_args, **_kwargs):
+        raise PermissionError(13, "Permission denied", str(tmp_path / snapshot_services.LOCK_FILE))
+
+    monkeypatch.setattr(snapshot_services, "file_lock", read_only_lock)
+
+    assert [s.snapshot_id for s in list_snapshots()] == [created.snapshot_id]
+    assert not (tmp_path / snapshot_services.MANIFEST_FILE).exists()
+
+
+def _stored_objects(snapshots_dir):
+    import sqlite3
+
+    from backend.snapshot_services import OBJECT_STORE_FILE
+
+    connection = sqlite3.connect(snapshots_dir / OBJECT_STORE_FILE)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_snapshots_share_unchanged_team_objects(tmp_path, monkeypatch):
+    """Each distinct team should be stored once, however many snapshots contain it"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    first = create_snapshot(name="First")
+    second = create_snapshot(name="Second")
+
+    assert _stored_objects(tmp_path) == len({team.model_dump_json() for team in first.teams})
+
+    first_refs = json.loads((tmp_path / f"{first.snapshot_id}.json").read_text(encoding="utf-8"))["team_refs"]
+    second_refs = json.loads((tmp_path / f"{second.snapshot_id}.json").read_text(encoding="utf-8"))["team_refs"]
+    assert first_refs == second_refs
+
+    loaded = load_snapshot(second.snapshot_id)
+    assert loaded.model_dump() == second.model_dump()
+
+
+def test_object_store_uses_less_disk_than_embedded_teams(tmp_path):
+    """Shared, packed team objects should take a fraction of the disk of one file per snapshot"""
+    from backend.dataset_generator import generate_dataset, use_dataset
+
+    generate_dataset(tmp_path / "data", teams=100, seed=1, snapshots=5)
+    snapshots_dir = tmp_path / "data" / "tt-snapshots"
+    snapshot_files = [path for path in snapshots_dir.glob("*.json") if path.name != "index.json"]
+    legacy_dir = tmp_path / "legacy"
+    legacy_dir.mkdir()
+    with use_dataset(tmp_path / "data"):
+        for path in snapshot_files:
+            legacy = load_snapshot(path.stem).model_dump(mode="json")
+            (legacy_dir / path.name).write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    def disk_usage(paths):
+        return sum(path.stat().st_blocks * 512 for path in paths)
+
+    stored = disk_usage([*snapshot_files, snapshots_dir / "objects.db"])
+    assert stored < disk_usage(legacy_dir.iterdir()) / 2
+
+
+def test_load_legacy_snapshot_with_embedded_teams(tmp_path, monkeypatch):
+    """Snapshots written before content-addressed storage should still load"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    legacy = create_snapshot(name="Legacy", team_names=[])
+    legacy_data = legacy.model_dump(mode="json")
+    legacy_data["teams"] = [{"name": "Old Team", "team_type": "platform", "position": {"x": 1, "y": 2}}]
+    (tmp_path / "legacy-snapshot.json").write_text(json.dumps(legacy_data, indent=2), encoding="utf-8")
+
+    loaded = load_snapshot("legacy-snapshot")
+
+    assert loaded is not None
+    assert [team.name for team in loaded.teams] == ["Old Team"]
+
+
+def test_collect_unreferenced_objects(tmp_path, monkeypatch):
+    """Objects of deleted snapshots should be collected, shared ones kept"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    all_teams = create_snapshot(name="All Teams")
+    some_teams = create_snapshot(name="Some Teams", team_names=[team.name for team in all_teams.teams[:2]])
+
+    (tmp_path / f"{all_teams.snapshot_id}.json").unlink()
+    deleted = collect_unreferenced_objects()
+
+    assert deleted == len(all_teams.teams) - 2
+    assert load_snapshot(some_teams.snapshot_id).model_dump() == some_teams.model_dump()
+
+
+def test_gc_command_collects_objects_of_deleted_snapshots(tmp_path, monkeypatch, capsys):
+    """python -m backend.snapshot_services gc cleans the object store of a snapshot directory"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_cli import main
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="To Delete")
+    (tmp_path / f"{created.snapshot_id}.json").unlink()
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path / "elsewhere")
+
+    assert main(["gc", "--snapshots-dir", str(tmp_path)]) == 0
+    assert f"Deleted {len(created.teams)} unreferenced team object(s)" in capsys.readouterr().out
+    assert _stored_objects(tmp_path) == 0
+    assert snapshot_services.SNAPSHOTS_DIR == tmp_path / "elsewhere"
+    assert main(["gc", "--snapshots-dir", str(tmp_path / "missing")]) == 2
+
+
+def test_load_snapshot_is_cached_until_file_changes(tmp_path, monkeypatch):
+    """Repeated loads should reuse the parsed snapshot, but notice edits"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="Cached", team_names=[])
+
+    first = load_snapshot(created.snapshot_id)
+    assert load_snapshot(created.snapshot_id) is first
+
+    snapshot_file = tmp_path / f"{created.snapshot_id}.json"
+    data = json.loads(snapshot_file.read_text(encoding="utf-8"))
+    data["name"] = "Cached And Edited"
+    snapshot_file.write_text(json.dumps(data), encoding="utf-8")
+
+    reloaded = load_snapshot(created.snapshot_id)
+    assert reloaded is not first
+    assert reloaded.name == "Cached And Edited"
+
+    snapshot_file.unlink()
+    assert load_snapshot(created.snapshot_id) is None
+
+
+def test_snapshot_cache_is_bounded(tmp_path, monkeypatch):
+    """The least recently used snapshot should be evicted past the cache size"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    monkeypatch.setattr(snapshot_services, "SNAPSHOT_CACHE_SIZE", 2)
+    snapshot_services.clear_snapshot_caches()
+    created = create_snapshot(name="Bounded", team_names=[])
+    data = json.loads((tmp_path / f"{created.snapshot_id}.json").read_text(encoding="utf-8"))
+    for snapshot_id in ["snap-a", "snap-b", "snap-c"]:
+        (tmp_path / f"{snapshot_id}.json").write_text(json.dumps({**data, "snapshot_id": snapshot_id}), encoding="utf-8")
+
+    a = load_snapshot("snap-a")
+    load_snapshot("snap-b")
+    load_snapshot("snap-c")
+
+    assert len(snapshot_services._SNAPSHOT_CACHE) == 2
+    assert load_snapshot("snap-a") is not a
+    snapshot_services.clear_snapshot_caches()
+
+
+def test_comparison_is_cached_per_snapshot_pair(tmp_path, monkeypatch):
+    """Comparing the same pair again should reuse the result until a snapshot changes"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_services import compare_loaded_snapshots
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    before = create_snapshot(name="Before", team_names=[])
+    after = create_snapshot(name="After")
+
+    result = compare_loaded_snapshots(load_snapshot(before.snapshot_id), load_snapshot(after.snapshot_id))
+    assert len(result["changes"]["added_teams"]) == len(after.teams)
+    assert compare_loaded_snapshots(load_snapshot(before.snapshot_id), load_snapshot(after.snapshot_id)) is result
+
+    # Reversed direction is a different comparison
+    reverse = compare_loaded_snapshots(load_snapshot(after.snapshot_id), load_snapshot(before.snapshot_id))
+    assert reverse["changes"]["removed_teams"] == result["changes"]["added_teams"]
+
+    # Rewriting a snapshot invalidates the comparison
+    after_file = tmp_path / f"{after.snapshot_id}.json"
+    data = json.loads(after_file.read_text(encoding="utf-8"))
+    data["team_refs"] = data["team_refs"][:1]
+    after_file.write_text(json.dumps(data), encoding="utf-8")
+    updated = compare_loaded_snapshots(load_snapshot(before.snapshot_id), load_snapshot(after.snapshot_id))
+    assert updated["changes"]["summary"]["added_count"] == 1
+
+
+def _copy_snapshot(tmp_path, source_id: str, snapshot_id: str, created_at: str, team_count: int | None = None):
+    """Write a copy of a snapshot file with a new id, date and optionally fewer teams"""
+    data = json.loads((tmp_path / f"{source_id}.json").read_text(encoding="utf-8"))
+    data.update(snapshot_id=snapshot_id, name=snapshot_id, created_at=created_at)
+    if team_count is not None:
+        data["team_refs"] = data["team_refs"][:team_count]
+        data["statistics"]["total_teams"] = team_count
+    (tmp_path / f"{snapshot_id}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_snapshot_timeline(tmp_path, monkeypatch):
+    """Timeline should hold one series point per snapshot and one step per consecutive pair"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_services import snapshot_timeline
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    full = create_snapshot(name="Full")
+    _copy_snapshot(tmp_path, full.snapshot_id, "q1", "2025-01-01T00:00:00", team_count=2)
+    _copy_snapshot(tmp_path, full.snapshot_id, "q2", "2025-04-01T00:00:00", team_count=5)
+
+    timeline = snapshot_timeline(["q1", "q2", full.snapshot_id])
+
+    assert [point["snapshot_id"] for point in timeline["series"]] == ["q1", "q2", full.snapshot_id]
+    assert [point["statistics"]["total_teams"] for point in timeline["series"]] == [2, 5, len(full.teams)]
+    assert all("dependency_edges" in point and "interaction_edges" in point for point in timeline["series"])
+    assert [(s["before_id"], s["after_id"]) for s in timeline["steps"]] == [("q1", "q2"), ("q2", full.snapshot_id)]
+    assert timeline["steps"][0]["changes"]["summary"]["added_count"] == 3
+
+    # "all" is every snapshot, oldest first
+    assert [p["snapshot_id"] for p in snapshot_timeline()["series"]] == ["q1", "q2", full.snapshot_id]
+
+    with pytest.raises(ValueError, match="Snapshot not found: missing"):
+        snapshot_timeline(["q1", "missing"])
+
+
+def test_extending_timeline_computes_one_new_diff(tmp_path, monkeypatch):
+    """Adjacent diffs should come from the cache, even after snapshots leave the snapshot cache"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_services import snapshot_timeline
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    snapshot_services.clear_snapshot_caches()
+    full = create_snapshot(name="Full")
+    ids = []
+    for month in range(1, 6):
+        ids.append(f"m{month}")
+        _copy_snapshot(tmp_path, full.snapshot_id, ids[-1], f"2025-0{month}-01T00:00:00", team_count=month)
+
+    diffs = []
+    original = snapshot_services.compare_snapshots
+    monkeypatch.setattr(snapshot_services, "compare_snapshots", lambda b, a: diffs.append((b.snapshot_id, a.snapshot_id)) or original(b, a))
+
+    snapshot_timeline(ids[:4])
+    assert len(diffs) == 3
+
+    diffs.clear()
+    snapshot_services._SNAPSHOT_CACHE.clear()
+    timeline = snapshot_timeline(ids)
+
+    assert diffs == [("m4", "m5")]
+    assert len(timeline["steps"]) == 4
+    snapshot_services.clear_snapshot_caches()
+
+
+def test_live_snapshot_is_reused_until_dataset_changes(tmp_path, monkeypatch):
+    """The condensed live view should only be rebuilt when team files change"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_services import compare_loaded_snapshots, live_snapshot
+
+    teams_dir = tmp_path / "tt-teams"
+    teams_dir.mkdir()
+    monkeypatch.setattr("backend.services.file_ops.get_data_dir", lambda view="tt": teams_dir)
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    snapshot_services.clear_snapshot_caches()
+
+    (teams_dir / "team-a.md").write_text("---\nteam_id: team-a\nname: Team A\nteam_type: platform\n---\n", encoding="utf-8")
+    before = create_snapshot(name="Before")
+
+    live = live_snapshot()
+    assert live.snapshot_id == "live"
+    assert live_snapshot() is live
+    assert not (tmp_path / "live.json").exists()
+
+    (teams_dir / "team-b.md").write_text("---\nteam_id: team-b\nname: Team B\nteam_type: enabling\n---\n", encoding="utf-8")
+    updated = live_snapshot()
+
+    assert updated is not live
+    changes = compare_loaded_snapshots(load_snapshot(before.snapshot_id), updated)["changes"]
+    assert changes["added_teams"] == ["Team B"]
+    snapshot_services.clear_snapshot_caches()
+
+
+def test_snapshot_reader_reads_teams_on_demand(tmp_path, monkeypatch):
+    """Opening a snapshot should not read team objects; lookups by name read just one"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_services import open_snapshot
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="Lazy")
+
+    reads = []
+    original = snapshot_services._read_object
+    monkeypatch.setattr(snapshot_services, "_read_object", lambda ref: reads.append(ref) or original(ref))
+
+    reader = open_snapshot(created.snapshot_id)
+    assert reader.metadata.name == "Lazy"
+    assert len(reader) == len(created.teams)
+    assert reader.team_names() == [team.name for team in created.teams]
+    assert reads == []
+
+    target = created.teams[-1]
+    assert reader.get_team(target.name) == target
+    assert len(reads) == 1
+    assert reader.get_team("No Such Team") is None
+
+    assert list(reader.iter_teams()) == created.teams
+    assert open_snapshot("missing-snapshot") is None
+
+
+def test_snapshot_reader_legacy_format(tmp_path, monkeypatch):
+    """Legacy snapshots with embedded teams should be readable through the same interface"""
+    import backend.snapshot_services as snapshot_services
+    from backend.snapshot_services import open_snapshot
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    created = create_snapshot(name="Legacy Reader")
+    (tmp_path / "legacy.json").write_text(json.dumps(created.model_dump(mode="json")), encoding="utf-8")
+
+    reader = open_snapshot("legacy")
+
+    assert reader.team_names() == [team.name for team in created.teams]
+    assert reader.get_team(created.teams[-1].name) == created.teams[-1]
+    assert reader.get_team("No Such Team") is None
+
+
+def test_snapshots_created_in_the_same_second_get_distinct_ids(tmp_path, monkeypatch):
+    """Snapshot ids have second resolution; a taken id should get a suffix, not be overwritten"""
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    monkeypatch.setattr(snapshot_services, "generate_snapshot_id", lambda name, created_at: "same-second")
+
+    first = create_snapshot(name="First", team_names=[])
+    second = create_snapshot(name="Second", team_names=[])
+    third = create_snapshot(name="Third", team_names=[])
+
+    assert [first.snapshot_id, second.snapshot_id, third.snapshot_id] == [
+        "same-second", "same-second-2", "same-second-3"]
+    assert load_snapshot("same-second").name == "First"
+    assert {s.snapshot_id for s in list_snapshots()} == {"same-second", "same-second-2", "same-second-3"}
+
+
+def test_concurrent_snapshot_creation(tmp_path, monkeypatch):
+    """Concurrent writers should neither overwrite each other nor lose manifest entries"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import backend.snapshot_services as snapshot_services
+
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path)
+    monkeypatch.setattr(snapshot_services, "generate_snapshot_id", lambda name, created_at: "concurrent")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        created = list(pool.map(lambda i: create_snapshot(name=f"Writer {i}"), range(8)))
+
+    ids = {snapshot.snapshot_id for snapshot in created}
+    assert len(ids) == 8
+    manifest = json.loads((tmp_path / snapshot_services.MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert set(manifest["snapshots"]) == {f"{snapshot_id}.json" for snapshot_id in ids}
+    assert not list(tmp_path.glob("*.tmp"))
+    for snapshot in created:
+        assert load_snapshot(snapshot.snapshot_id).name == snapshot.name
@@ -0,0 +1,114 @@
+"""Tests for application startup: side-effect-free imports, startup phases, import budget"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from backend import snapshot_services
+from backend.services import file_ops
+from backend.startup import count_team_files, run_startup
+from main import app
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Self time of importing our own modules (backend.* and main), third-party packages
+# excluded, best of IMPORT_RUNS. Measured on a single-CPU VM, median of 10 runs: 90 ms
+# before the routes for jobs, profiles, metrics, search and snapshot diffs were added,
+# 130 ms with them (mostly FastAPI building the route models). The budget is about
+# 1.4x that: broad growth fails it, DEFERRED_MODULES catches specific regressions.
+IMPORT_BUDGET_SECONDS = 0.18
+IMPORT_RUNS = 3
+
+# Only needed by some requests or settings, so not imported with the app:
+# PyYAML and config schemas (parsing, validation), multiprocessing (parallel validation),
+# sqlite3 (TEAM_INDEX_DB, snapshot object store), the job thread pool, profiling
+DEFERRED_MODULES = (
+    "yaml",
+    "backend.schemas",
+    "concurrent.futures.process",
+    "multiprocessing",
+    "sqlite3",
+    "backend.services.team_index",
+    "concurrent.futures.thread",
+    "backend.profiling",
+)
+
+
+def _python(code: str, data_dir: Path, *options: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "DATA_DIR": str(data_dir)}
+    for setting in ("TEAM_INDEX_DB", "PROFILE_REQUESTS"):
+        env.pop(setting, None)
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=120, check=True,
+    )
+
+
+def test_import_has_no_side_effects(tmp_path):
+    """Importing the app creates no directories and loads none of the deferred modules"""
+    data_dir = tmp_path / "data"
+    result = _python(
+        f"import json, sys, main; print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))",
+        data_dir,
+    )
+
+    assert not data_dir.exists()
+    assert json.loads(result.stdout) == []
+
+
+def _own_import_seconds(data_dir: Path) -> float:
+    result = _python("import main", data_dir, "-X", "importtime")
+    own_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, module = line.removeprefix("import time:").split("|")
+        if module.strip().split(".")[0] in ("backend", "main"):
+            own_us += int(self_us)
+    return own_us / 1e6
+
+
+def test_import_time_budget(tmp_path):
+    best = min(_own_import_seconds(tmp_path / "data") for _ in range(IMPORT_RUNS))
+    assert 0 < best < IMPORT_BUDGET_SECONDS, f"Importing main took {best * 1000:.0f} ms of our own modules"
+
+
+def test_count_team_files(tmp_path):
+    (tmp_path / "a.md").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.md").write_text("")
+
+    assert count_team_files(tmp_path) == 1
+    assert count_team_files(tmp_path, recursive=True) == 2
+    assert count_team_files(tmp_path / "missing", recursive=True) == 0
+
+
+def test_run_startup_creates_dirs_and_times_phases(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_ops, "TT_TEAMS_DIR", tmp_path / "tt-teams")
+    monkeypatch.setattr(file_ops, "BASELINE_TEAMS_DIR", tmp_path / "baseline-teams")
+    monkeypatch.setattr(snapshot_services, "SNAPSHOTS_DIR", tmp_path / "tt-snapshots")
+
+    report = run_startup(scan=False)
+    assert report["file_counts"] is None
+    assert list(report["phases"]) == ["ensure_dirs"]
+    assert all((tmp_path / name).is_dir() for name in ("tt-teams", "baseline-teams", "tt-snapshots"))
+
+    (tmp_path / "tt-teams" / "team.md").write_text("")
+    (tmp_path / "baseline-teams" / "dept").mkdir()
+    (tmp_path / "baseline-teams" / "dept" / "team.md").write_text("")
+    monkeypatch.setenv("STARTUP_SCAN", "true")
+
+    report = run_startup()
+    assert report["file_counts"] == {"tt": 1, "baseline": 1}
+    assert set(report["phases"]) == {"ensure_dirs", "scan"}
+
+
+def test_lifespan_reports_startup_phases():
+    with TestClient(app) as client:
+        metrics = client.get("/api/metrics").text
+    assert 'startup_phase_duration_seconds{phase="ensure_dirs"}' in metrics
+    assert 'startup_phase_duration_seconds{phase="scan"}' in metrics
@@ -0,0 +1,112 @@
+"""Tests for the optional SQLite team index"""
+import sqlite3
+import threading
+
+import pytest
+
+from backend.services import (
+    find_all_teams,
+    find_team_by_id,
+    find_team_by_name,
+    team_index,
+)
+
+TEAM_TEMPLATE = """---
+team_id: {team_id}
+name: {name}
+team_type: {team_type}
+value_stream: {value_stream}
+dependencies:
+{dependencies}
+interaction_modes:
+{interactions}
+---
+
+# {name}
+"""
+
+
+def _write_team(directory, team_id, name, team_type="stream-aligned", value_stream="Checkout",
+                dependencies=(), interactions=None):
+    deps = "\n".join(f"  - {dep}" for dep in dependencies) or "  []"
+    modes = "\n".join(f"  {team}: {mode}" for team, mode in (interactions or {}).items()) or "  {}"
+    path = directory / f"{team_id}.md"
+    path.write_text(TEAM_TEMPLATE.format(
+        team_id=team_id, name=name, team_type=team_type, value_stream=value_stream,
+        dependencies=deps, interactions=modes,
+    ), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def index_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "index" / "teams.db"
+    monkeypatch.setenv("TEAM_INDEX_DB", str(db_path))
+    yield db_path
+    team_index.close_connections()
+
+
+@pytest.fixture
+def teams_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "teams"
+    directory.mkdir()
+    _write_team(directory, "checkout", "Checkout Team", dependencies=["Payments Team"],
+                interactions={"Payments Team": "collaboration"})
+    _write_team(directory, "payments", "Payments Team", team_type="platform", value_stream="Money")
+    monkeypatch.setattr("backend.services.file_ops.get_data_dir", lambda view: directory)
+    return directory
+
+
+@pytest.mark.parametrize("view", ["tt", "baseline"])
+def test_indexed_lookups_match_file_scan(view, index_db, monkeypatch):
+    """The index must return exactly what scanning the markdown files returns"""
+    monkeypatch.delenv("TEAM_INDEX_DB")
+    scanned = find_all_teams(view)
+    monkeypatch.setenv("TEAM_INDEX_DB", str(index_db))
+
+    assert find_all_teams(view) == scanned
+    for team in scanned[:5]:
+        assert find_team_by_id(team.team_id, view)[0] == team
+        assert find_team_by_name(team.name, view)[0] == team
+
+
+def test_index_follows_file_changes(teams_dir, index_db):
+    assert [t.team_id for t in find_all_teams()] == ["checkout", "payments"]
+
+    _write_team(teams_dir, "search", "Search Team")
+    (teams_dir / "payments.md").unlink()
+    checkout = teams_dir / "checkout.md"
+    checkout.write_text(checkout.read_text(encoding="utf-8").replace("Checkout Team", "Basket Team"), encoding="utf-8")
+
+    assert [t.name for t in find_all_teams()] == ["Basket Team", "Search Team"]
+    assert find_team_by_id("payments") is None
+    assert find_team_by_id("basket-team")[1] == checkout  # Slug of the new name
+
+
+def test_unchanged_directory_is_not_reindexed(teams_dir, index_db):
+    assert team_index.sync(teams_dir) == 2
+    assert team_index.sync(teams_dir) == 0
+
+    team_index.close_connections()  # Another process: same database, no in-memory state
+    assert team_index.sync(teams_dir) == 0
+
+
+def test_index_uses_wal_and_is_readable_from_other_threads(teams_dir, index_db):
+    team_index.sync(teams_dir)
+    with sqlite3.connect(index_db) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(find_all_teams()))
+    thread.start()
+    thread.join()
+    assert [t.team_id for t in results[0]] == ["checkout", "payments"]
+
+
+def test_index_failure_falls_back_to_files(teams_dir, index_db, monkeypatch):
+    def broken(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(team_index, "indexed_teams", broken)
+    assert [t.team_id for t in find_all_teams()] == ["checkout", "payments"]
+
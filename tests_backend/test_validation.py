@@ -394,6 +394,36 @@ team_type: stream-aligned
         assert result["files_with_warnings"] == 1
         assert any("references unknown team: 'Nonexistent Team'" in warning for warning in result["issues"][0]["warnings"])
 
+    def test_interactions_reference_team_id_or_slug(self, temp_data_dir, monkeypatch):
+        """YAML interactions may name a team by its team_id or slug; only unresolved references warn"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+
+        write_team_file(temp_data_dir, "platform-team.md", """---
+name: Platform Team
+team_id: core-platform
+team_type: platform
+---
+""", "tt")
+        write_team_file(temp_data_dir, "consumer-team.md", """---
+name: Consumer Team
+team_type: stream-aligned
+interactions:
+  - team_id: core-platform
+    interaction_mode: x-as-a-service
+  - team_id: platform-team
+    interaction_mode: x-as-a-service
+  - team_id: core-platfrom
+    interaction_mode: x-as-a-service
+---
+""", "tt")
+
+        result = validate_all_team_files("tt")
+
+        consumer_issues = next(i for i in result["issues"] if i["file"] == "consumer-team.md")
+        assert consumer_issues["warnings"] == [
+            "Interaction references unknown team: 'core-platfrom' (did you mean 'Platform Team'?)"
+        ]
+
     def test_yaml_parsing_error(self, temp_data_dir, monkeypatch):
         """Should handle YAML parsing errors gracefully"""
         monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
@@ -520,3 +550,290 @@ team_type: stream-aligned
 
         assert result["files_with_errors"] == 1
         assert any("Empty YAML front matter" in error for error in result["issues"][0]["errors"])
+
+
+class TestIncrementalValidation:
+    """Test per-file caching of validation results"""
+
+    @staticmethod
+    def _count_validations(monkeypatch):
+        """Wrap _validate_content and return the list of validated file names"""
+        import backend.validation as validation
+
+        validated = []
+        original = validation._validate_content
+
+        def counting(file_name, content, ctx, *args):
+            validated.append(file_name)
+            return original(file_name, content, ctx, *args)
+
+        monkeypatch.setattr('backend.validation._validate_content', counting)
+        return validated
+
+    def test_unchanged_files_are_not_revalidated(self, temp_data_dir, monkeypatch):
+        """Second run over an unchanged directory should reuse every result"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        validated = self._count_validations(monkeypatch)
+
+        write_team_file(temp_data_dir, "team-a.md", "---\nname: Team A\nteam_type: platform\n---\n", "tt")
+        write_team_file(temp_data_dir, "team-b.md", "---\nname: Team B\nteam_type: bogus\n---\n", "tt")
+
+        first = validate_all_team_files("tt")
+        assert sorted(validated) == ["team-a.md", "team-b.md"]
+
+        validated.clear()
+        second = validate_all_team_files("tt")
+
+        assert validated == []
+        assert second == first
+
+    def test_only_edited_file_is_revalidated(self, temp_data_dir, monkeypatch):
+        """Editing one file should re-validate just that file"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        validated = self._count_validations(monkeypatch)
+
+        write_team_file(temp_data_dir, "team-a.md", "---\nname: Team A\nteam_type: platform\n---\n", "tt")
+        write_team_file(temp_data_dir, "team-b.md", "---\nname: Team B\nteam_type: platform\n---\n", "tt")
+        validate_all_team_files("tt")
+
+        validated.clear()
+        write_team_file(temp_data_dir, "team-b.md", "---\nname: Team B\nteam_type: bogus\n---\n", "tt")
+        result = validate_all_team_files("tt")
+
+        assert validated == ["team-b.md"]
+        assert result["files_with_errors"] == 1
+        assert result["valid_files"] == 1
+
+    def test_renamed_team_revalidates_referencing_files(self, temp_data_dir, monkeypatch):
+        """Files referencing a renamed team must be re-validated, others not"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        validated = self._count_validations(monkeypatch)
+
+        write_team_file(temp_data_dir, "platform-team.md", "---\nname: Platform Team\nteam_type: platform\n---\n", "tt")
+        write_team_file(temp_data_dir, "consumer-team.md", """---
+name: Consumer Team
+team_type: stream-aligned
+interactions:
+  - team_id: Platform Team
+    interaction_mode: x-as-a-service
+---
+""", "tt")
+        write_team_file(temp_data_dir, "other-team.md", "---\nname: Other Team\nteam_type: enabling\n---\n", "tt")
+        assert validate_all_team_files("tt")["issues"] == []
+
+        validated.clear()
+        write_team_file(temp_data_dir, "platform-team.md", "---\nname: Core Platform Team\nteam_type: platform\n---\n", "tt")
+        result = validate_all_team_files("tt")
+
+        assert sorted(validated) == ["consumer-team.md", "platform-team.md"]
+        consumer_issues = next(i for i in result["issues"] if i["file"] == "consumer-team.md")
+        assert any("unknown team: 'Platform Team'" in w for w in consumer_issues["warnings"])
+
+    def test_new_similar_team_refreshes_suggestions(self, temp_data_dir, monkeypatch):
+        """A cached dangling reference should pick up a suggestion once a close match exists"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+
+        write_team_file(temp_data_dir, "consumer-team.md", """---
+name: Consumer Team
+team_type: stream-aligned
+interactions:
+  - team_id: billing-team
+    interaction_mode: collaboration
+---
+""", "tt")
+        first = validate_all_team_files("tt")
+        assert first["issues"][0]["warnings"] == ["Interaction references unknown team: 'billing-team'"]
+
+        write_team_file(temp_data_dir, "billing-teams.md", "---\nname: Billing Teams\nteam_type: platform\n---\n", "tt")
+        second = validate_all_team_files("tt")
+
+        consumer_issues = next(i for i in second["issues"] if i["file"] == "consumer-team.md")
+        assert consumer_issues["warnings"] == [
+            "Interaction references unknown team: 'billing-team' (did you mean 'Billing Teams'?)"
+        ]
+
+    def test_config_change_invalidates_cache(self, temp_data_dir, monkeypatch):
+        """Changing valid team types should re-validate every file"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "baseline-teams")
+        validated = self._count_validations(monkeypatch)
+
+        write_config_file(temp_data_dir, "baseline", '{"team_types": [{"id": "feature-team"}]}')
+        write_team_file(temp_data_dir, "team-a.md", "---\nname: Team A\nteam_type: ops-team\n---\n", "baseline")
+        assert validate_all_team_files("baseline")["files_with_errors"] == 1
+
+        validated.clear()
+        write_config_file(temp_data_dir, "baseline", '{"team_types": [{"id": "feature-team"}, {"id": "ops-team"}]}')
+        result = validate_all_team_files("baseline")
+
+        assert validated == ["team-a.md"]
+        assert result["files_with_errors"] == 0
+
+    def test_overlapping_runs_keep_results_with_their_files(self, temp_data_dir, monkeypatch):
+        """Runs in progress at the same time (SSE stream, /validate, jobs) must not swap results"""
+        from backend.validation import iter_team_file_validation
+
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "baseline-teams")
+        write_config_file(temp_data_dir, "baseline", '{"team_types": [{"id": "feature-team"}]}')
+        for i in range(1, 6):
+            write_team_file(temp_data_dir, f"team-{i}.md", f"""---
+name: Team {i}
+team_type: feature-team
+dependencies:
+  - Missing Team {i}
+---
+""", "baseline")
+        validate_all_team_files("baseline")
+        # Config change: every cached result is stale, so both runs below re-validate everything
+        write_config_file(temp_data_dir, "baseline", '{"team_types": [{"id": "feature-team"}, {"id": "ops"}]}')
+
+        def check(file_events):
+            """Each file (by path, not by the name inside its result) has its own warning"""
+            assert sorted(e.get("path", e["file"]) for e in file_events) == [f"team-{i}.md" for i in range(1, 6)]
+            for event in file_events:
+                assert event["file"] == event.get("path", event["file"])
+                number = event["file"].removeprefix("team-").removesuffix(".md")
+                assert event["warnings"] == [f"Dependency 'Missing Team {number}' not found - team does not exist"]
+
+        stream = iter_team_file_validation("baseline")
+        other = iter_team_file_validation("baseline")
+        stream_events = [next(stream), next(stream)]  # start, team-1
+        other_events = [next(other) for _ in range(4)]  # start, team-1 .. team-3
+        stream_events.extend(stream)
+        other_events.extend(other)
+
+        for events in (stream_events, other_events):
+            check([e for e in events if e["event"] == "file"])
+        check(validate_all_team_files("baseline")["issues"])
+    """Test validating across a worker pool"""
+
+    def test_parallel_report_matches_serial(self, temp_data_dir, monkeypatch):
+        """Parallel validation should produce exactly the serial report"""
+        from backend.validation import clear_validation_cache
+
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        monkeypatch.setattr('backend.validation.PARALLEL_MIN_FILES_PER_WORKER', 1)
+
+        for i in range(24):
+            team_type = "bogus" if i % 5 == 0 else "stream-aligned"
+            write_team_file(temp_data_dir, f"team-{i}.md", f"""---
+name: Team {i}
+team_type: {team_type}
+interactions:
+  - team_id: Team {(i + 1) % 30}
+    interaction_mode: collaboration
+metadata:
+  size: {i}
+---
+# Team {i}
+""", "tt")
+
+        clear_validation_cache()
+        serial = validate_all_team_files("tt", workers=1)
+        clear_validation_cache()
+        parallel = validate_all_team_files("tt", workers=3)
+
+        assert parallel == serial
+        assert serial["files_with_errors"] == 5
+
+    def test_workers_from_environment(self, monkeypatch):
+        """VALIDATION_WORKERS should set the default worker count"""
+        from backend.validation import _resolve_workers
+
+        monkeypatch.setenv("VALIDATION_WORKERS", "4")
+        assert _resolve_workers(None) == 4
+        assert _resolve_workers(2) == 2
+
+        monkeypatch.setenv("VALIDATION_WORKERS", "0")
+        assert _resolve_workers(None) >= 1
+
+
+class TestIterTeamFileValidation:
+    """Test the event stream behind validate_all_team_files"""
+
+    def test_event_sequence(self, temp_data_dir, monkeypatch):
+        """Should yield start, one file event per team file, then summary"""
+        from backend.validation import iter_team_file_validation
+
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        write_team_file(temp_data_dir, "team-a.md", "---\nname: Team A\nteam_type: platform\n---\n", "tt")
+        write_team_file(temp_data_dir, "team-b.md", "---\nname: Team B\nteam_type: bogus\n---\n", "tt")
+
+        events = list(iter_team_file_validation("tt"))
+
+        assert [e["event"] for e in events] == ["start", "file", "file", "summary"]
+        assert events[0]["total_files"] == 2
+        assert [e["file"] for e in events[1:3]] == ["team-a.md", "team-b.md"]
+        assert [e["index"] for e in events[1:3]] == [1, 2]
+        assert events[2]["errors"]
+        assert events[-1]["files_with_errors"] == 1
+        assert events[-1]["valid_files"] == 1
+
+
+class TestValidatorProfiles:
+    """Test validator profiles and per-rule timings"""
+
+    TEAM_WITH_DANGLING_DEPENDENCY = (
+        "---\nname: Team A\nteam_type: platform\ninteractions:\n"
+        "  - team_id: missing-team\n    interaction_mode: collaboration\n---\n"
+    )
+
+    def test_fast_profile_skips_cross_reference_rules(self, temp_data_dir, monkeypatch):
+        """Fast profile should only run structural checks"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        write_team_file(temp_data_dir, "team-a.md", self.TEAM_WITH_DANGLING_DEPENDENCY, "tt")
+
+        full = validate_all_team_files("tt")
+        fast = validate_all_team_files("tt", profile="fast")
+
+        assert full["profile"] == "full"
+        assert any("missing-team" in w for w in full["issues"][0]["warnings"])
+        assert fast["profile"] == "fast"
+        assert fast["issues"] == []
+
+    def test_fast_profile_still_reports_structural_errors(self, temp_data_dir, monkeypatch):
+        """Fast profile should still flag missing required fields"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        write_team_file(temp_data_dir, "team-a.md", "---\nteam_type: platform\n---\n", "tt")
+
+        report = validate_all_team_files("tt", profile="fast")
+
+        assert report["files_with_errors"] == 1
+
+    def test_unknown_profile_raises(self, temp_data_dir, monkeypatch):
+        """Unknown profile names should be rejected"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+
+        with pytest.raises(ValueError, match="Unknown validation profile"):
+            validate_all_team_files("tt", profile="thorough")
+
+    def test_rule_timings(self, temp_data_dir, monkeypatch):
+        """include_timings should report call counts per rule, including YAML parsing"""
+        from backend.validation import YAML_PARSE_TIMING
+
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        write_team_file(temp_data_dir, "team-a.md", "---\nname: Team A\nteam_type: platform\n---\n", "tt")
+        write_team_file(temp_data_dir, "team-b.md", "---\nname: Team B\nteam_type: platform\n---\n", "tt")
+
+        report = validate_all_team_files("tt", profile="fast", include_timings=True)
+        timings = report["rule_timings"]
+
+        assert timings["validated_files"] == 2
+        assert timings["rules"][YAML_PARSE_TIMING]["calls"] == 2
+        assert timings["rules"]["validate_required_fields"]["calls"] == 2
+        assert "validate_dependencies" not in timings["rules"]
+        assert all(stats["total_ms"] >= 0 for stats in timings["rules"].values())
+
+    def test_timings_omitted_by_default(self, temp_data_dir, monkeypatch):
+        """rule_timings should only be present when requested"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        write_team_file(temp_data_dir, "team-a.md", "---\nname: Team A\nteam_type: platform\n---\n", "tt")
+
+        assert "rule_timings" not in validate_all_team_files("tt")
+
+    def test_profiles_are_cached_separately(self, temp_data_dir, monkeypatch):
+        """A fast run must not satisfy a later full run from the cache"""
+        monkeypatch.setattr('backend.validation.get_data_dir', lambda view: temp_data_dir / "tt-teams")
+        write_team_file(temp_data_dir, "team-a.md", self.TEAM_WITH_DANGLING_DEPENDENCY, "tt")
+
+        assert validate_all_team_files("tt", profile="fast")["issues"] == []
+        assert validate_all_team_files("tt", profile="full")["issues"]
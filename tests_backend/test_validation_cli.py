@@ -0,0 +1,212 @@
+"""Tests for the validation command-line interface (python -m backend.validation)"""
+import json
+
+import pytest
+
+from backend.validation import clear_validation_cache
+from backend.validation_cli import infer_view, main
+
+VALID_TEAM = """---
+name: Valid Team
+team_type: stream-aligned
+---
+# Valid Team
+"""
+
+INVALID_TEAM = """---
+name: Broken Team
+team_type: not-a-type
+---
+# Broken Team
+"""
+
+
+@pytest.fixture
+def tt_dir(tmp_path, monkeypatch):
+    """A TT variant folder with one valid and one invalid team"""
+    monkeypatch.chdir(tmp_path)  # --changed-only writes .validation-cache.json here
+    data_dir = tmp_path / "tt-design-proposal-a"
+    data_dir.mkdir()
+    (data_dir / "valid-team.md").write_text(VALID_TEAM, encoding="utf-8")
+    (data_dir / "broken-team.md").write_text(INVALID_TEAM, encoding="utf-8")
+    clear_validation_cache()
+    yield data_dir
+    clear_validation_cache()
+
+
+def test_exit_code_reflects_errors(tt_dir, capsys):
+    """Should exit 1 when errors are found and 0 when all files are valid"""
+    assert main([str(tt_dir), "--workers", "1"]) == 1
+    assert "broken-team.md: error: Invalid team_type" in capsys.readouterr().out
+
+    (tt_dir / "broken-team.md").write_text(INVALID_TEAM.replace("not-a-type", "platform"), encoding="utf-8")
+    assert main([str(tt_dir), "--workers", "1"]) == 0
+
+
+def test_json_output(tt_dir, capsys):
+    """JSON output should include per-directory reports and totals"""
+    main([str(tt_dir), "--format", "json"])
+    output = json.loads(capsys.readouterr().out)
+
+    assert output["total_errors"] == 1
+    directory = output["directories"][0]
+    assert directory["view"] == "tt"
+    assert directory["total_files"] == 2
+    assert directory["issues"][0]["path"].endswith("broken-team.md")
+
+
+def test_sarif_output(tt_dir, capsys):
+    """SARIF output should contain one result per issue"""
+    main([str(tt_dir), "--format", "sarif"])
+    sarif = json.loads(capsys.readouterr().out)
+
+    assert sarif["version"] == "2.1.0"
+    results = sarif["runs"][0]["results"]
+    assert len(results) == 1
+    assert results[0]["level"] == "error"
+    assert results[0]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"].endswith("broken-team.md")
+
+
+def test_changed_only_with_file_list(tt_dir, capsys):
+    """--changed-only --files should validate just the listed files"""
+    exit_code = main([str(tt_dir), "--changed-only", "--format", "json", "--files", str(tt_dir / "valid-team.md")])
+    output = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 0
+    assert output["directories"][0]["total_files"] == 1
+
+
+def test_changed_only_skips_untouched_directories(tt_dir, tmp_path, capsys):
+    """Directories without changed files should not be validated at all"""
+    exit_code = main([str(tt_dir), "--changed-only", "--format", "json", "--files", str(tmp_path / "elsewhere.md")])
+    output = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 0
+    assert output["directories"] == []
+
+
+def test_changed_only_uses_a_cache_by_default(tt_dir, tmp_path):
+    main([str(tt_dir), "--changed-only", "--files", str(tt_dir / "valid-team.md")])
+    assert (tmp_path / ".validation-cache.json").exists()
+
+    (tmp_path / ".validation-cache.json").unlink()
+    main([str(tt_dir), "--changed-only", "--no-cache", "--files", str(tt_dir / "valid-team.md")])
+    assert not (tmp_path / ".validation-cache.json").exists()
+
+
+def test_changed_only_rechecks_files_referencing_a_renamed_team(tmp_path, monkeypatch, capsys):
+    """Renaming a team should re-check the files that depend on it, not just the renamed file"""
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "baseline-teams"
+    data_dir.mkdir()
+    team = VALID_TEAM.replace("stream-aligned", "department")
+    (data_dir / "provider-team.md").write_text(team.replace("Valid Team", "Provider Team"), encoding="utf-8")
+    (data_dir / "consumer-team.md").write_text(
+        team.replace("Valid Team", "Consumer Team").replace("---\n#", "dependencies:\n  - Provider Team\n---\n#"),
+        encoding="utf-8",
+    )
+    (data_dir / "other-team.md").write_text(team.replace("Valid Team", "Other Team"), encoding="utf-8")
+    clear_validation_cache()
+    assert main([str(data_dir), "--changed-only", "--files", *map(str, data_dir.glob("*.md"))]) == 0
+    capsys.readouterr()
+
+    clear_validation_cache()
+    (data_dir / "provider-team.md").write_text(team.replace("Valid Team", "Platform Team"), encoding="utf-8")
+    main([str(data_dir), "--changed-only", "--format", "json", "--files", str(data_dir / "provider-team.md")])
+    directory = json.loads(capsys.readouterr().out)["directories"][0]
+    clear_validation_cache()
+
+    assert directory["total_files"] == 2  # provider-team.md and the consumer depending on it
+    assert directory["issues"][0]["path"].endswith("consumer-team.md")
+    assert "Dependency 'Provider Team' not found" in directory["issues"][0]["warnings"][0]
+
+
+def test_changed_config_file_validates_its_directory(tmp_path, monkeypatch, capsys):
+    """A malformed config file is reported (not raised), also when it is the only changed file"""
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "baseline-teams"
+    data_dir.mkdir()
+    (data_dir / "valid-team.md").write_text(VALID_TEAM.replace("stream-aligned", "department"), encoding="utf-8")
+    (data_dir / "products.json").write_text("{not json", encoding="utf-8")
+    clear_validation_cache()
+
+    assert main([str(data_dir), "--changed-only", "--files", str(data_dir / "products.json")]) == 1
+    output = capsys.readouterr().out
+    assert "products.json: error: Invalid JSON" in output
+    assert "1 files" in output
+
+    assert main([str(data_dir), "--no-cache"]) == 1
+    assert "products.json: error: Invalid JSON" in capsys.readouterr().out
+    clear_validation_cache()
+
+
+def test_cache_file_is_reused(tt_dir, tmp_path, capsys, monkeypatch):
+    """A second run with --cache should not re-validate unchanged files"""
+    import backend.validation as validation
+
+    cache_file = tmp_path / "validation-cache.json"
+    assert main([str(tt_dir), "--cache", str(cache_file)]) == 1
+    assert cache_file.exists()
+
+    clear_validation_cache()
+    validated = []
+    original = validation._validate_content
+
+    def counting(file_name, content, ctx, *args):
+        validated.append(file_name)
+        return original(file_name, content, ctx, *args)
+
+    monkeypatch.setattr("backend.validation._validate_content", counting)
+    assert main([str(tt_dir), "--cache", str(cache_file), "--workers", "1"]) == 1
+    assert validated == []
+
+
+def test_cache_file_is_discarded_when_rule_dependencies_change(tt_dir, tmp_path, monkeypatch):
+    """Changing a module the rules depend on (e.g. name_matching.py) invalidates the cache"""
+    import backend.validation as validation
+
+    assert "name_matching.py" in validation._RULE_DEPENDENCIES
+    dependency = tmp_path / "name_matching.py"
+    dependency.write_text("THRESHOLD = 0.5\n", encoding="utf-8")
+    monkeypatch.setattr(validation, "_RULE_DEPENDENCIES", (*validation._RULE_DEPENDENCIES, str(dependency)))
+
+    cache_file = tmp_path / "validation-cache.json"
+    assert main([str(tt_dir), "--cache", str(cache_file)]) == 1
+
+    dependency.write_text("THRESHOLD = 0.4\n", encoding="utf-8")
+    clear_validation_cache()
+    validation.load_validation_cache(cache_file)
+    assert validation._VALIDATION_CACHE == {}
+
+
+def test_strict_fails_on_warnings(tt_dir, capsys):
+    """--strict should turn warnings into a failing exit code"""
+    (tt_dir / "broken-team.md").unlink()
+    (tt_dir / "misnamed.md").write_text(VALID_TEAM.replace("Valid Team", "Other Team"), encoding="utf-8")
+
+    assert main([str(tt_dir)]) == 0
+    assert main([str(tt_dir), "--strict"]) == 1
+
+
+def test_timings_are_printed_to_stderr(tt_dir, capsys):
+    """--timings should print a per-rule table without changing stdout"""
+    main([str(tt_dir), "--profile", "fast", "--timings", "--format", "json"])
+    captured = capsys.readouterr()
+
+    assert json.loads(captured.out)["directories"][0]["profile"] == "fast"
+    assert "validate_required_fields" in captured.err
+    assert "validate_dependencies" not in captured.err
+
+
+def test_missing_directory_is_usage_error(tmp_path, capsys):
+    """Should exit 2 for a directory that does not exist"""
+    assert main([str(tmp_path / "nope")]) == 2
+
+
+def test_infer_view(tmp_path):
+    """Baseline folders are recognized by name or baseline config file"""
+    assert infer_view(tmp_path / "baseline-teams") == "baseline"
+    assert infer_view(tmp_path / "tt-teams-initial") == "tt"
+
+    (tmp_path / "baseline-team-types.json").write_text("{}", encoding="utf-8")
+    assert infer_view(tmp_path) == "baseline"
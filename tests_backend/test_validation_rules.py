@@ -334,3 +334,155 @@ class TestIntegrationWithValidateAllTeamFiles:
 
         assert result["files_with_warnings"] == 0
         assert result["files_with_errors"] == 0
+
+
+class TestValidationLookups:
+    """Tests for the prebuilt lookups carried by ValidationContext."""
+
+    def test_lookups_built_from_context_lists(self):
+        """Context should normalize product lines, streams and team names once."""
+        ctx = ValidationContext(
+            view="baseline",
+            file_name="test-team.md",
+            valid_types=["feature-team"],
+            all_team_names={"Platform Team"},
+            valid_product_lines=["  Product A "],
+            valid_business_streams=["Stream X"],
+        )
+
+        assert ctx.lookups.valid_types == frozenset({"feature-team"})
+        assert ctx.lookups.product_lines == frozenset({"product a"})
+        assert ctx.lookups.business_streams == frozenset({"stream x"})
+        assert ctx.lookups.team_names == frozenset({"Platform Team"})
+        assert ctx.lookups.team_names_by_normalized == {"platform team": "Platform Team"}
+
+    def test_replace_shares_lookups_and_resets_recorded_lookups(self):
+        """Per-file contexts should reuse the lookups but record their own queries."""
+        from dataclasses import replace
+
+        base = create_tt_context()
+        base.has_team("Anything")
+        per_file = replace(base, file_name="other-team.md")
+
+        assert per_file.lookups is base.lookups
+        assert per_file.team_lookups == {}
+
+    def test_team_lookups_are_recorded(self):
+        """Every team check should be recorded with its answer."""
+        from backend.validation_rules import validate_dependencies
+
+        ctx = ValidationContext(
+            view="baseline",
+            file_name="test-team.md",
+            valid_types=[],
+            all_team_names={"Platform Team"},
+            valid_product_lines=[],
+            valid_business_streams=[],
+        )
+
+        _, warnings = validate_dependencies({"dependencies": ["Platform Team", "Ghost Team"]}, ctx)
+
+        assert warnings == ["Dependency 'Ghost Team' not found - team does not exist"]
+        assert ctx.team_lookups == {
+            ("name", "Platform Team"): True,
+            ("name", "Ghost Team"): False,
+            ("suggest", "Ghost Team"): [],
+        }
+
+    def test_interactions_resolve_team_id(self):
+        """YAML interactions may reference a team by team_id, like the frontend allows."""
+        from backend.validation_rules import ValidationLookups, validate_interactions_array
+
+        lookups = ValidationLookups.build(
+            [], {"Platform Team"}, [], [], team_ids={"platform-team": "Platform Team"}
+        )
+        ctx = ValidationContext(
+            view="tt",
+            file_name="test-team.md",
+            valid_types=[],
+            all_team_names={"Platform Team"},
+            valid_product_lines=[],
+            valid_business_streams=[],
+            lookups=lookups,
+        )
+        data = {"interactions": [
+            {"team_id": "platform-team", "interaction_mode": "x-as-a-service"},
+            {"team_id": "Platform Team", "interaction_mode": "x-as-a-service"},
+            {"team_id": "ghost-team", "interaction_mode": "x-as-a-service"},
+        ]}
+
+        errors, warnings = validate_interactions_array(data, ctx)
+
+        assert errors == []
+        assert warnings == ["Interaction references unknown team: 'ghost-team'"]
+
+    def test_non_string_references_are_reported_not_raised(self):
+        """Malformed references (e.g. nested YAML) should warn instead of crashing."""
+        from backend.validation_rules import validate_dependencies
+
+        ctx = create_baseline_context()
+
+        _, warnings = validate_dependencies({"dependencies": [{"name": "Platform Team"}]}, ctx)
+
+        assert len(warnings) == 1
+
+
+class TestTeamSuggestions:
+    """Tests for "did you mean" suggestions on unresolved team references."""
+
+    @staticmethod
+    def _context(view: str) -> ValidationContext:
+        from backend.validation_rules import ValidationLookups
+
+        names = {"Platform Team", "Payments Team", "Mobile App Team"}
+        lookups = ValidationLookups.build(
+            [], names, [], [],
+            team_ids={"platform-team": "Platform Team", "payments-team": "Payments Team"},
+        )
+        return ValidationContext(
+            view=view,
+            file_name="test-team.md",
+            valid_types=[],
+            all_team_names=names,
+            valid_product_lines=[],
+            valid_business_streams=[],
+            lookups=lookups,
+        )
+
+    def test_dependency_typo_suggests_closest_name(self):
+        """A misspelled dependency should suggest the intended team."""
+        from backend.validation_rules import validate_dependencies
+
+        _, warnings = validate_dependencies({"dependencies": ["Platfrom Team"]}, self._context("baseline"))
+
+        assert warnings == [
+            "Dependency 'Platfrom Team' not found - team does not exist (did you mean 'Platform Team'?)"
+        ]
+
+    def test_case_mismatch_suggests_exact_name(self):
+        """Dependencies match exactly, so a case-only difference should point at the right spelling."""
+        from backend.validation_rules import validate_interaction_modes
+
+        data = {"interaction_modes": {"collaboration": ["mobile app team"]}}
+        _, warnings = validate_interaction_modes(data, self._context("baseline"))
+
+        assert warnings[0].endswith("(did you mean 'Mobile App Team'?)")
+
+    def test_team_id_typo_suggests_team(self):
+        """Interactions referencing a mistyped team_id should be matched against slugs too."""
+        from backend.validation_rules import validate_interactions_array
+
+        data = {"interactions": [{"team_id": "paymnets-team", "interaction_mode": "collaboration"}]}
+        _, warnings = validate_interactions_array(data, self._context("tt"))
+
+        assert warnings == [
+            "Interaction references unknown team: 'paymnets-team' (did you mean 'Payments Team'?)"
+        ]
+
+    def test_no_suggestion_for_unrelated_name(self):
+        """References far from every team should not get a misleading suggestion."""
+        from backend.validation_rules import validate_dependencies
+
+        _, warnings = validate_dependencies({"dependencies": ["Ghost"]}, self._context("baseline"))
+
+        assert warnings == ["Dependency 'Ghost' not found - team does not exist"]